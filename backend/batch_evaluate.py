@@ -0,0 +1,161 @@
+"""
+비디오 메타데이터 일괄 평가 도구
+
+get_video_info 형식의 JSONL/CSV 레코드를 읽어 모든 코어에서 청크 단위로 평가하고,
+입력 순서대로 결과를 스트리밍 출력합니다. 처리 중인 청크 수가 제한되므로
+입력 크기와 관계없이 메모리 사용량이 일정합니다.
+
+사용 예:
+    python batch_evaluate.py videos.jsonl -o results.jsonl --config setting.json
+    python batch_evaluate.py videos.csv.gz -o results.csv --workers 8 --chunk-size 2000
+"""
+from typing import Dict, Iterator, List, Optional, TextIO
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import csv
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+from modules.evaluator import Evaluator
+from modules.records import VideoInfo, parse_fields
+from modules.workers import _init_child, flatten_record, evaluate_records_chunk
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("batch_evaluate")
+
+# 기본 출력 필드 (비디오 정보 원문은 제외)
+DEFAULT_FIELDS = "video_id,source_trust,content_trust,final_score,grade"
+
+
+def _open_text(path: str, mode: str) -> TextIO:
+    """파일 열기 ("-"는 표준 입출력, .gz는 gzip 압축)"""
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _detect_format(path: str, explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    name = path[:-3] if path.endswith(".gz") else path
+    return "csv" if name.endswith(".csv") else "jsonl"
+
+
+def read_records(stream: TextIO, input_format: str) -> Iterator:
+    """
+    입력 레코드를 하나씩 읽습니다.
+
+    JSONL 입력은 파싱하지 않은 줄을 그대로 반환하여 파싱도 자식 프로세스에서 수행합니다.
+    """
+    if input_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+def chunked(records: Iterator, size: int) -> Iterator[List]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_config(path: Optional[str]) -> Optional[Dict]:
+    """관리자 설정 스냅샷(setting.json 형식) 로드"""
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def csv_columns(admin_config: Optional[Dict], fields: Dict) -> List[str]:
+    """필드 선택에 따른 CSV 출력 열 목록"""
+    sample = Evaluator(admin_config).evaluate(VideoInfo(video_id="")).to_dict(fields)
+    return list(flatten_record(sample)) + ["error"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="비디오 메타데이터 일괄 평가")
+    parser.add_argument("input", help="입력 파일 (JSONL/CSV, .gz 지원, '-'는 표준 입력)")
+    parser.add_argument("-o", "--output", default="-", help="출력 파일 (JSONL/CSV, '-'는 표준 출력)")
+    parser.add_argument("--input-format", choices=("jsonl", "csv"), help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--output-format", choices=("jsonl", "csv"), help="출력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--config", help="관리자 설정 스냅샷 파일 (예: setting.json)")
+    parser.add_argument("--fields", default=DEFAULT_FIELDS, help=f"출력 필드 (기본값: {DEFAULT_FIELDS})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="평가 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="프로세스에 한 번에 전달할 레코드 수")
+    parser.add_argument("--max-pending", type=int, help="동시에 처리 중인 최대 청크 수 (기본값: 프로세스 수 x 2)")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="진행 상황 출력 간격(초)")
+    args = parser.parse_args(argv)
+
+    # 레코드별 평가 로그는 남기지 않음
+    logging.getLogger("modules.evaluator").setLevel(logging.WARNING)
+
+    try:
+        fields = parse_fields(args.fields)
+        admin_config = load_config(args.config)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+    max_pending = args.max_pending or args.workers * 2
+
+    processed = errors = 0
+    started = last_report = time.monotonic()
+
+    def report(final: bool = False) -> None:
+        elapsed = time.monotonic() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        status = "완료" if final else "진행 중"
+        logger.info(f"[BATCH] {status}: {processed:,}건 처리, 오류 {errors:,}건, {elapsed:.1f}초, {rate:,.0f}건/초")
+
+    with _open_text(args.input, "r") as source, _open_text(args.output, "w") as sink, \
+            ProcessPoolExecutor(max_workers=args.workers, initializer=_init_child, initargs=(0, admin_config)) as executor:
+        writer = None
+        if output_format == "csv":
+            writer = csv.DictWriter(sink, fieldnames=csv_columns(admin_config, fields), extrasaction="ignore")
+            writer.writeheader()
+
+        def drain(future) -> None:
+            nonlocal processed, errors, last_report
+            results, failed = future.result()
+            if writer is not None:
+                writer.writerows(results)
+            else:
+                sink.write("\n".join(results) + "\n")
+            processed += len(results)
+            errors += failed
+            if time.monotonic() - last_report >= args.progress_interval:
+                last_report = time.monotonic()
+                report()
+
+        # 처리 중인 청크 수를 제한하고 제출 순서대로 결과를 기록
+        pending = deque()
+        for chunk in chunked(read_records(source, input_format), args.chunk_size):
+            if len(pending) >= max_pending:
+                drain(pending.popleft())
+            # 설정은 자식 프로세스 초기화 시 한 번만 전달
+            pending.append(executor.submit(evaluate_records_chunk, 0, None, chunk, fields, output_format))
+        while pending:
+            drain(pending.popleft())
+
+    report(final=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
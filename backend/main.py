@@ -1,23 +1,49 @@
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Security, Request, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
-from modules.youtube import YouTubeAPI
+from modules.youtube import YouTubeAPI, VideoNotFoundError
 from modules.evaluator import Evaluator
+from modules.workers import ContentAnalysisPool
+from modules.memo import TextAnalysisMemo
+from modules.cache import VideoCache, CachedVideo
+from modules.timeseries import VideoStatsSeries
+from modules.storage import create_client, parse_nodes
+from modules.search import SearchCache, result_bucket, RESULT_BUCKETS
+from modules.compression import CompressionMiddleware, strip_encoding_suffix
+from modules.ratelimit import AdmissionMiddleware, SlidingWindowLimiter, load_rules
+from modules.profiling import SamplingProfiler, ProfileReports, RequestProfilerMiddleware
+from modules.records import parse_fields, SUMMARY_FIELDS, Evaluation, VideoInfo
+from modules.events import EvaluationBroadcaster
+from modules.snapshot import CacheSnapshot
+from modules.history import ConfigHistoryStore
+from modules.duplicates import NearDuplicateIndex, DuplicateMatch
+from modules.comments import CommentAnalyzer
+from modules.negative import MissingVideoCache, is_valid_video_id
+from modules.tenants import DEFAULT_TENANT, TenantConfig, TenantDirectory, EvaluatorRegistry, tenant_keys
+from modules.breaker import CircuitOpenError
+import hashlib
 from modules.scoring import ScoreCalculator
+from modules.archive import EvaluationArchive
+from modules.analytics import EvaluationStats
+from modules.simulator import simulate
+from modules import codec
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
 import json
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from modules.auth import PasswordHasher, TokenCache, UserStore
 import logging
 import redis
 from uuid import uuid4
 from redis.retry import Retry
 from redis.backoff import ExponentialBackoff
 import time
+import asyncio
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -29,21 +55,25 @@ load_dotenv(".env")
 # Redis 연결 설정
 def get_redis_client():
     retry = Retry(ExponentialBackoff(), 3)  # 최대 3번 재시도
-    return redis.Redis(
-        host=os.getenv("REDIS_HOST", "localhost"),  # 기본값을 localhost로 변경
-        port=int(os.getenv("REDIS_PORT", 6379)),
-        db=0,
-        decode_responses=True,
+    # REDIS_NODES가 있으면 여러 노드(또는 REDIS_CLUSTER=true이면 Redis Cluster)에 분산
+    nodes = parse_nodes(os.getenv("REDIS_NODES", "")) or [
+        (os.getenv("REDIS_HOST", "localhost"), int(os.getenv("REDIS_PORT", 6379)))  # 기본값을 localhost로 변경
+    ]
+    cluster = os.getenv("REDIS_CLUSTER", "false").lower() == "true"
+    connection_kwargs = dict(
+        decode_responses=False,  # 값은 modules.codec으로 직렬화
         retry=retry,
         retry_on_timeout=True
     )
+    if not cluster:
+        connection_kwargs["db"] = 0
+    return create_client(nodes, cluster=cluster, vnodes=int(os.getenv("REDIS_VNODES", 160)), **connection_kwargs)
 
 # Redis 연결 시도
-def connect_redis(max_retries: int = 3, delay: int = 1) -> Optional[redis.Redis]:
+def connect_redis(max_retries: int = int(os.getenv("REDIS_CONNECT_RETRIES", 3)), delay: int = 1):
     for attempt in range(max_retries):
         try:
-            client = get_redis_client()
-            client.ping()  # 연결 테스트
+            client = get_redis_client()  # 생성 시 연결 테스트
             logger.info("Redis 연결 성공")
             return client
         except redis.ConnectionError as e:
@@ -51,6 +81,9 @@ def connect_redis(max_retries: int = 3, delay: int = 1) -> Optional[redis.Redis]
             if attempt < max_retries - 1:
                 time.sleep(delay * (attempt + 1))  # 지수 백오프
     logger.error("Redis 연결 최대 재시도 횟수 초과")
+    if len(parse_nodes(os.getenv("REDIS_NODES", ""))) > 1:
+        # 여러 노드에 분산하는 구성에서 메모리 내 데이터베이스로 대체하면 다른 워커와 데이터가 갈라지므로 시작 중단
+        raise RuntimeError("Redis 노드에 연결할 수 없어 시작을 중단합니다.")
     return None
 
 # Redis 클라이언트 초기화
@@ -65,8 +98,11 @@ if not redis_client:
         def get(self, key):
             return self.data.get(key)
         
-        def set(self, key, value):
+        def set(self, key, value, nx=False, ex=None):
+            if nx and key in self.data:
+                return None
             self.data[key] = value
+            return True
         
         def exists(self, key):
             return key in self.data
@@ -75,20 +111,213 @@ if not redis_client:
             if key not in self.data:
                 self.data[key] = []
             self.data[key].append(value)
+            return len(self.data[key])
         
         def lrange(self, key, start, end):
             if key not in self.data:
                 return []
-            return self.data[key][start:end]
+            # Redis와 같이 end 위치를 포함
+            return self.data[key][start:end + 1 or None]
+        
+        def llen(self, key):
+            return len(self.data.get(key, []))
+        
+        def ltrim(self, key, start, end):
+            if key in self.data:
+                self.data[key] = self.data[key][start:end + 1 or None]
+        
+        def setex(self, key, ttl, value):
+            self.data[key] = value
+        
+        def lset(self, key, index, value):
+            self.data[key][index] = value
+        
+        def incr(self, key, amount=1):
+            self.data[key] = int(self.data.get(key, 0)) + amount
+            return self.data[key]
+        
+        def hset(self, key, field, value):
+            self.data.setdefault(key, {})[field] = value
+        
+        def hget(self, key, field):
+            return self.data.get(key, {}).get(field)
+        
+        def hmget(self, key, fields):
+            values = self.data.get(key, {})
+            return [values.get(field) for field in fields]
+        
+        def hgetall(self, key):
+            return dict(self.data.get(key, {}))
+        
+        def hdel(self, key, *fields):
+            values = self.data.get(key, {})
+            return sum(1 for field in fields if values.pop(field, None) is not None)
+        
+        def hincrby(self, key, field, amount=1):
+            values = self.data.setdefault(key, {})
+            values[field] = int(values.get(field, 0)) + amount
+            return values[field]
+        
+        def hincrbyfloat(self, key, field, amount=1.0):
+            values = self.data.setdefault(key, {})
+            values[field] = float(values.get(field, 0.0)) + amount
+            return values[field]
+        
+        def sadd(self, key, *members):
+            self.data.setdefault(key, set()).update(members)
+        
+        def smembers(self, key):
+            return set(self.data.get(key, set()))
+        
+        def zadd(self, key, mapping):
+            self.data.setdefault(key, {}).update(mapping)
+        
+        def zrange(self, key, start, end, desc=False, withscores=False):
+            items = sorted(self.data.get(key, {}).items(), key=lambda item: item[1], reverse=desc)
+            items = items[start:None if end == -1 else end + 1]
+            return items if withscores else [member for member, _ in items]
+        
+        def zrevrange(self, key, start, end, withscores=False):
+            return self.zrange(key, start, end, desc=True, withscores=withscores)
+        
+        def zrem(self, key, *members):
+            zset = self.data.get(key, {})
+            return sum(1 for member in members if zset.pop(member, None) is not None)
+        
+        def zremrangebyscore(self, key, min_score, max_score):
+            zset = self.data.get(key, {})
+            expired = [member for member, score in zset.items() if min_score <= score <= max_score]
+            return self.zrem(key, *expired)
+        
+        def zcard(self, key):
+            return len(self.data.get(key, {}))
+        
+        def expire(self, key, ttl):
+            return key in self.data
+        
+        def append(self, key, value):
+            self.data[key] = self.data.get(key, b"") + value
+            return len(self.data[key])
+        
+        def setbit(self, key, offset, value):
+            bitmap = self.data.setdefault(key, bytearray())
+            index, mask = offset >> 3, 1 << (7 - (offset & 7))
+            if index >= len(bitmap):
+                bitmap.extend(bytes(index + 1 - len(bitmap)))
+            previous = int(bool(bitmap[index] & mask))
+            bitmap[index] = bitmap[index] | mask if value else bitmap[index] & ~mask
+            return previous
+        
+        def delete(self, *keys):
+            return sum(1 for key in keys if self.data.pop(key, None) is not None)
+        
+        def pipeline(self):
+            return InMemoryPipeline(self)
+    
+    class InMemoryPipeline:
+        """명령을 즉시 실행하고 결과를 모아 반환하는 파이프라인"""
+        def __init__(self, db):
+            self.db = db
+            self.results = []
+        
+        def __getattr__(self, name):
+            method = getattr(self.db, name)
+            def command(*args, **kwargs):
+                self.results.append(method(*args, **kwargs))
+                return self
+            return command
+        
+        def execute(self):
+            results, self.results = self.results, []
+            return results
     
     redis_client = InMemoryDB()
 
+# orjson이 설치되어 있으면 더 빠른 JSON 인코더 사용
+try:
+    import orjson
+    FastJSONResponse = ORJSONResponse
+except ImportError:
+    FastJSONResponse = JSONResponse
+
 app = FastAPI(
     title="CTS API",
     description="Content Trust Score API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
+)
+
+# 요청 헤더의 Bearer 토큰 클레임 (미들웨어용, 검증 실패 시 None)
+def _token_claims(scope) -> Optional[Dict]:
+    authorization = dict(scope.get("headers", [])).get(b"authorization", b"").decode("latin-1")
+    if not authorization.lower().startswith("bearer "):
+        return None
+    token = authorization[7:]
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            return None
+        token_cache.set(token, payload)
+    return payload
+
+async def _is_admin_request(scope) -> bool:
+    payload = _token_claims(scope)
+    if not payload or not payload.get("sub"):
+        return False
+    user = await user_store.get(payload["sub"])
+    return bool(user) and user.get("role") == "admin" and not user.get("disabled")
+
+# 요청별 프로파일링 (관리자 요청에 X-Profile 헤더가 있을 때만 동작)
+profile_reports = ProfileReports(max_reports=int(os.getenv("PROFILE_REPORTS", 20)))
+sampling_profiler = SamplingProfiler()
+app.add_middleware(
+    RequestProfilerMiddleware,
+    authorize=_is_admin_request,
+    reports=profile_reports
 )
 
+# 응답 압축 (brotli가 설치되어 있으면 우선 사용)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+)
+
+# 요청 유입 제어 (클라이언트별 요청 제한, 경로별 동시 처리 한도)
+def _client_identity(scope) -> str:
+    """요청 제한 단위: 등록된 API 키 > 로그인 사용자 > 클라이언트 IP"""
+    headers = dict(scope.get("headers", []))
+    api_key = headers.get(b"x-api-key")
+    # 등록되지 않은 키를 식별자로 쓰면 요청마다 키를 바꿔 제한을 우회할 수 있음
+    if api_key and tenant_directory.lookup(api_key.decode("latin-1")) is not None:
+        return "key:" + hashlib.blake2b(api_key, digest_size=8).hexdigest()
+    payload = _token_claims(scope)
+    if payload and payload.get("sub"):
+        return f"user:{payload['sub']}"
+    if TRUST_PROXY_HEADERS and b"x-forwarded-for" in headers:
+        return "ip:" + headers[b"x-forwarded-for"].decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+
+# 요청 제한 (Redis 왕복은 전용 스레드 풀에서 실행)
+rate_limiter = SlidingWindowLimiter(redis_client)
+
+if os.getenv("ADMISSION_CONTROL", "true").lower() == "true":
+    app.add_middleware(
+        AdmissionMiddleware,
+        rules=load_rules(os.getenv("ADMISSION_RULES")),
+        limiter=rate_limiter,
+        identify=_client_identity,
+        exempt=("/", "/env-check")
+    )
+
+@app.on_event("shutdown")
+def shutdown_rate_limiter():
+    rate_limiter.shutdown()
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -103,6 +332,228 @@ youtube_api = YouTubeAPI()
 evaluator = Evaluator()
 score_calculator = ScoreCalculator()
 
+# 내용 분석 프로세스 풀 (CONTENT_POOL_SIZE가 0이면 이벤트 루프에서 직접 계산)
+content_pool_size = int(os.getenv("CONTENT_POOL_SIZE", 0))
+content_pool = ContentAnalysisPool(
+    content_pool_size,
+    chunk_size=int(os.getenv("CONTENT_POOL_CHUNK", 32)),
+    max_wait=float(os.getenv("CONTENT_POOL_WAIT_MS", 5)) / 1000
+) if content_pool_size > 0 else None
+
+@app.on_event("shutdown")
+def shutdown_content_pool():
+    if content_pool is not None:
+        content_pool.shutdown()
+
+# 텍스트 분석 결과 메모이제이션
+text_memo = TextAnalysisMemo(
+    redis_client,
+    max_entries=int(os.getenv("TEXT_MEMO_SIZE", 10000)),
+    ttl=int(os.getenv("TEXT_MEMO_TTL", 86400))
+)
+
+# 유사 텍스트(재업로드/미러링) 색인
+near_duplicates = NearDuplicateIndex(
+    redis_client,
+    num_perm=int(os.getenv("DUPLICATE_PERMUTATIONS", 64)),
+    bands=int(os.getenv("DUPLICATE_BANDS", 16)),
+    ttl=int(os.getenv("DUPLICATE_TTL", 30 * 86400))
+) if os.getenv("DUPLICATE_DETECTION", "true").lower() == "true" else None
+DUPLICATE_REUSE_THRESHOLD = float(os.getenv("DUPLICATE_REUSE_THRESHOLD", 0.9))
+DUPLICATE_FLAG_THRESHOLD = float(os.getenv("DUPLICATE_FLAG_THRESHOLD", 0.7))
+
+# 댓글 키워드 분석 (선택, 점수와 별도 신호로 제공)
+comment_analyzer = CommentAnalyzer(
+    youtube_api,
+    redis_client,
+    max_comments=int(os.getenv("COMMENT_SAMPLE_SIZE", 300)),
+    max_pages=int(os.getenv("COMMENT_QUOTA", 3)),
+    time_budget=float(os.getenv("COMMENT_TIME_BUDGET", 2.0)),
+    min_comments=int(os.getenv("COMMENT_MIN_SAMPLE", 50)),
+    tolerance=float(os.getenv("COMMENT_CONVERGENCE", 3.0)),
+    ttl=int(os.getenv("COMMENT_CACHE_TTL", 21600))
+) if os.getenv("COMMENT_ANALYSIS", "false").lower() == "true" else None
+
+# 비디오 정보 캐시
+video_cache = VideoCache(
+    redis_client,
+    ttl=int(os.getenv("VIDEO_CACHE_TTL", 600)),
+    local_size=int(os.getenv("VIDEO_CACHE_SIZE", 2048)),
+    stale_ttl=int(os.getenv("VIDEO_STALE_TTL", 86400))
+)
+
+# 찾을 수 없는(삭제/비공개) 비디오 ID 부정 캐시 (반복 요청에 할당량을 쓰지 않음)
+missing_videos = MissingVideoCache(
+    redis_client,
+    ttl=int(os.getenv("MISSING_VIDEO_TTL", 3600)),
+    bloom_bits=int(os.getenv("MISSING_BLOOM_BITS", 1 << 20)),
+    hashes=int(os.getenv("MISSING_BLOOM_HASHES", 7)),
+    refresh_interval=float(os.getenv("MISSING_BLOOM_REFRESH", 30))
+)
+
+# 검색 결과 캐시 (비디오 ID 목록만 저장)
+search_cache = SearchCache(redis_client, ttl=int(os.getenv("SEARCH_CACHE_TTL", 1800)))
+
+# 비디오 통계 시계열 (새로 조회할 때마다 기록)
+video_stats = VideoStatsSeries(
+    redis_client,
+    raw_retention=int(os.getenv("STATS_RAW_RETENTION", 2 * 86400)),
+    retention=int(os.getenv("STATS_RETENTION", 365 * 86400)),
+    half_life=float(os.getenv("STATS_VELOCITY_HALF_LIFE", 6 * 3600))
+)
+
+@app.on_event("shutdown")
+def stop_video_stats():
+    video_stats.stop()
+
+def fetch_video(video_id: str, allow_stale: bool = False) -> CachedVideo:
+    """
+    캐시된 비디오 정보를 반환하고, 없으면 YouTube에서 조회하여 캐시
+    
+    allow_stale이면 YouTube API 장애(회로 차단 포함) 시 만료된 캐시 항목을 대신 반환합니다.
+    형식이 잘못된 ID와 최근에 찾을 수 없었던 ID는 YouTube API를 호출하지 않고 ValueError가 발생합니다.
+    """
+    missing_videos.check(video_id)
+    cached = video_cache.get(video_id)
+    if cached is not None:
+        return cached
+    try:
+        cached = video_cache.put(youtube_api.get_video(video_id))
+    except VideoNotFoundError:
+        missing_videos.add([video_id])
+        raise
+    except Exception as e:
+        if not allow_stale or not _is_upstream_outage(e):
+            raise
+        stale = video_cache.get(video_id, allow_stale=True)
+        if stale is None:
+            raise
+        logger.warning(f"[UPSTREAM] YouTube API 장애로 만료된 비디오 정보 사용: {video_id} ({stale.age()}초 전 조회)")
+        return stale
+    
+    _record_video_stats(cached)
+    return cached
+
+def fetch_videos(video_ids: List[str]) -> Dict[str, CachedVideo]:
+    """
+    여러 비디오 정보를 반환합니다. 캐시에 없는 비디오만 YouTube에서 일괄 조회하여 캐시
+    
+    형식이 잘못되었거나 찾을 수 없는 것으로 기록된 ID는 조회하지 않고 결과에서 제외합니다.
+    """
+    video_ids = [video_id for video_id in video_ids if is_valid_video_id(video_id)]
+    found = video_cache.get_many(video_ids)
+    missing = [video_id for video_id in video_ids if video_id not in found]
+    if missing:
+        known_missing = missing_videos.known_missing(missing)
+        missing = [video_id for video_id in missing if video_id not in known_missing]
+    if missing:
+        for video_id, video in youtube_api.get_videos(missing).items():
+            found[video_id] = video_cache.put(video)
+            _record_video_stats(found[video_id])
+        missing_videos.add([video_id for video_id in missing if video_id not in found])
+    return found
+
+def _record_video_stats(cached: CachedVideo) -> None:
+    """통계 스냅샷을 백그라운드 기록 대기열에 추가 (이벤트 루프에서 잠금/Redis 왕복을 기다리지 않음)"""
+    video_stats.submit(cached.video, cached.fetched_at)
+
+def _is_upstream_outage(e: Exception) -> bool:
+    """회로 차단 또는 YouTube API 장애 여부"""
+    return isinstance(e, CircuitOpenError) or youtube_api.breaker.is_failure(e)
+
+def _upstream_unavailable(e: Exception) -> HTTPException:
+    """대체 응답이 없을 때의 503 응답"""
+    retry_after = e.retry_after if isinstance(e, CircuitOpenError) else youtube_api.breaker.recovery_timeout
+    return HTTPException(
+        status_code=503,
+        detail="YouTube API를 일시적으로 사용할 수 없습니다.",
+        headers={"Retry-After": str(max(1, int(retry_after)))}
+    )
+
+STALE_WARNING = '110 - "Response is Stale"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (압축 응답의 인코딩 접미사는 무시)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(
+        strip_encoding_suffix(candidate[2:] if candidate.startswith("W/") else candidate) == etag
+        for candidate in candidates
+    )
+
+def _cache_headers(etag: str, max_age: int, scope: str = "public") -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"{scope}, max-age={max_age}"
+    }
+
+# 평가 결과 아카이브
+evaluation_archive = EvaluationArchive(
+    os.getenv("ARCHIVE_DIR", "data/archive"),
+    segment_rows=int(os.getenv("ARCHIVE_SEGMENT_ROWS", 1_000_000)),
+    flush_rows=int(os.getenv("ARCHIVE_FLUSH_ROWS", 64))
+)
+
+@app.on_event("shutdown")
+def flush_archive():
+    evaluation_archive.flush()
+
+# 평가 결과 증분 집계
+evaluation_stats = EvaluationStats(redis_client)
+
+# 평가 결과 구독 (Redis pub/sub으로 워커 간 전달)
+evaluation_events = EvaluationBroadcaster(
+    redis_client,
+    max_subscribers=int(os.getenv("EVENTS_MAX_SUBSCRIBERS", 5000)),
+    max_tracked=int(os.getenv("EVENTS_MAX_TRACKED", 10000))
+)
+EVENTS_MAX_TOPICS = int(os.getenv("EVENTS_MAX_TOPICS", 100))
+EVENTS_HEARTBEAT = float(os.getenv("EVENTS_HEARTBEAT", 15))
+SUBSCRIPTION_REFRESH_INTERVAL = int(os.getenv("SUBSCRIPTION_REFRESH_INTERVAL", 60))
+REFRESH_LOCK_KEY = "events:refresh:{{{video_id}}}"
+subscription_refresher: Optional[asyncio.Task] = None
+
+async def refresh_subscribed_videos():
+    """
+    구독 중인 비디오의 캐시가 만료되었거나 설정이 바뀌면 다시 평가하여 발행합니다.
+    
+    같은 비디오를 여러 워커가 구독하더라도 Redis 잠금을 얻은 워커 하나만 계산합니다.
+    """
+    while True:
+        await asyncio.sleep(SUBSCRIPTION_REFRESH_INTERVAL)
+        current_evaluator = get_evaluator()
+        for video_id in evaluation_events.subscribed_videos:
+            try:
+                cached = video_cache.get(video_id)
+                last = evaluation_events.last_published(video_id)
+                if cached is not None and last == (cached.version, evaluator_config_version):
+                    continue
+                if not redis_client.set(REFRESH_LOCK_KEY.format(video_id=video_id), 1, nx=True, ex=SUBSCRIPTION_REFRESH_INTERVAL):
+                    continue
+                if cached is None:
+                    cached = await run_in_threadpool(fetch_video, video_id)
+                if evaluation_events.last_published(video_id) == (cached.version, evaluator_config_version):
+                    continue
+                evaluation = await score_video(cached.video, current_evaluator)
+                reason = "config" if last is not None and last[1] != evaluator_config_version else "refresh"
+                record_evaluation(evaluation, cached.version, reason=reason)
+            except Exception as e:
+                logger.warning(f"[EVENTS] 구독 비디오 갱신 실패: {video_id} ({str(e)})")
+
+@app.on_event("startup")
+async def start_evaluation_events():
+    global subscription_refresher
+    evaluation_events.start(asyncio.get_running_loop())
+    subscription_refresher = asyncio.get_running_loop().create_task(refresh_subscribed_videos())
+
+@app.on_event("shutdown")
+def stop_evaluation_events():
+    evaluation_events.stop()
+    if subscription_refresher is not None:
+        subscription_refresher.cancel()
+
 class VideoRequest(BaseModel):
     video_id: str
 
@@ -116,16 +567,23 @@ class AdminConfig(BaseModel):
     thresholds: Dict[str, Dict[str, int]]
     keywords: Dict[str, List[str]]
 
+# 설정 변경 시뮬레이션 요청 모델
+class SimulationRequest(BaseModel):
+    change_id: Optional[str] = None
+    config: Optional[AdminConfig] = None
+    sample: Optional[int] = 10000
+
 # 관리자 히스토리 모델
 class ConfigHistory(BaseModel):
     timestamp: datetime
-    changes: str
+    config: Dict
     user: str
 
-# Redis 키 설정
-ADMIN_CONFIG_KEY = "admin:config"
-CONFIG_HISTORY_KEY = "admin:history"
-PENDING_CHANGES_KEY = "admin:pending"
+# Redis 키 설정 (기본 테넌트, 다른 테넌트는 tenant_keys 참고)
+ADMIN_CONFIG_KEY = tenant_keys(DEFAULT_TENANT).config
+LAST_EVALUATION_KEY = "evaluation:last:{{{video_id}}}"
+LAST_EVALUATION_TTL = int(os.getenv("LAST_EVALUATION_TTL", 7 * 86400))
+RECORDED_EVALUATION_KEY = "evaluation:recorded:{{{video_id}}}:{data_version}:{config_version}"
 
 # 초기 관리자 설정
 default_admin_config = {
@@ -153,15 +611,106 @@ default_admin_config = {
 
 # Redis에 초기 설정 저장
 if not redis_client.exists(ADMIN_CONFIG_KEY):
-    redis_client.set(ADMIN_CONFIG_KEY, json.dumps(default_admin_config))
+    redis_client.set(ADMIN_CONFIG_KEY, codec.dumps(default_admin_config))
+
+# 테넌트 (API 키별 관리자 설정)
+tenant_directory = TenantDirectory(redis_client, cache_ttl=float(os.getenv("TENANT_KEY_CACHE_TTL", 60)))
+evaluator_registry = EvaluatorRegistry(redis_client, max_entries=int(os.getenv("EVALUATOR_CACHE_SIZE", 32)))
+
+def get_config_history(tenant: str = DEFAULT_TENANT) -> ConfigHistoryStore:
+    """테넌트의 설정 변경 이력 (차이 + 주기적 체크포인트)"""
+    return ConfigHistoryStore(
+        redis_client,
+        key=tenant_keys(tenant).history,
+        checkpoint_interval=int(os.getenv("HISTORY_CHECKPOINT_INTERVAL", 20)),
+        max_entries=int(os.getenv("HISTORY_MAX_ENTRIES", 1000))
+    )
+
+def get_config_version(tenant: str = DEFAULT_TENANT) -> int:
+    """현재 관리자 설정 버전 조회"""
+    return evaluator_registry.version(tenant)
+
+# 기본 테넌트의 현재 평가기와 설정 버전 (구독 갱신, 평가 기록에 사용)
+evaluator_config_version = 0
+
+def get_tenant_config(tenant: str = DEFAULT_TENANT) -> TenantConfig:
+    """테넌트의 현재 설정 버전과 평가기 (설정 버전이 바뀐 경우에만 평가기를 다시 생성)"""
+    global evaluator, evaluator_config_version
+    current = evaluator_registry.get(tenant)
+    if tenant == DEFAULT_TENANT:
+        evaluator, evaluator_config_version = current.evaluator, current.version
+    return current
+
+def get_evaluator(tenant: str = DEFAULT_TENANT) -> Evaluator:
+    return get_tenant_config(tenant).evaluator
+
+def _bump_config_version(tenant: str = DEFAULT_TENANT) -> int:
+    """관리자 설정 변경 시 버전 증가"""
+    return redis_client.incr(tenant_keys(tenant).version)
+
+def get_tenant(request: Request) -> str:
+    """요청의 API 키(X-API-Key)로 테넌트 결정 (없거나 등록되지 않은 키는 기본 테넌트)"""
+    return tenant_directory.resolve(request.headers.get("X-API-Key"))
+
+def admin_tenant(tenant: str = DEFAULT_TENANT) -> str:
+    """관리자 API의 대상 테넌트 (쿼리 파라미터 tenant)"""
+    if not tenant_directory.exists(tenant):
+        raise HTTPException(status_code=404, detail="테넌트를 찾을 수 없습니다.")
+    return tenant
+
+# 프로세스 내 캐시 스냅샷 (재시작한 워커가 빈 캐시로 시작하지 않도록 주기적으로 저장)
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "data/snapshot/cache.snap")
+SNAPSHOT_INTERVAL = int(os.getenv("SNAPSHOT_INTERVAL", 300))
+cache_snapshot = CacheSnapshot(SNAPSHOT_PATH) if SNAPSHOT_PATH else None
+snapshot_saver: Optional[asyncio.Task] = None
+
+if cache_snapshot is not None:
+    cache_snapshot.register("video_info", video_cache.export_entries, video_cache.load_entries)
+    cache_snapshot.register("channels", youtube_api.channel_cache.export_entries, youtube_api.channel_cache.load_entries)
+    cache_snapshot.register("text_analysis", text_memo.export_entries, text_memo.load_entries)
+    cache_snapshot.register("evaluators", evaluator_registry.export_entries, evaluator_registry.load_entries)
+
+async def save_snapshots_periodically():
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL)
+        try:
+            await run_in_threadpool(cache_snapshot.save)
+        except Exception as e:
+            logger.warning(f"[SNAPSHOT] 캐시 스냅샷 저장 실패: {str(e)}")
+
+@app.on_event("startup")
+async def restore_cache_snapshot():
+    global snapshot_saver
+    if cache_snapshot is None:
+        return
+    try:
+        cache_snapshot.restore()
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT] 캐시 스냅샷 복원 실패: {str(e)}")
+    if SNAPSHOT_INTERVAL > 0:
+        snapshot_saver = asyncio.get_running_loop().create_task(save_snapshots_periodically())
+
+@app.on_event("shutdown")
+def save_cache_snapshot():
+    if cache_snapshot is None:
+        return
+    if snapshot_saver is not None:
+        snapshot_saver.cancel()
+    try:
+        cache_snapshot.save()
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT] 캐시 스냅샷 저장 실패: {str(e)}")
 
 # JWT 설정
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱 (이벤트 루프 밖의 제한된 스레드 풀에서 실행)
+password_hasher = PasswordHasher(max_workers=int(os.getenv("AUTH_HASH_WORKERS", 2)))
+
+# 검증된 토큰 클레임 캐시
+token_cache = TokenCache(max_entries=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 1024)))
 
 # 사용자 모델
 class User(BaseModel):
@@ -174,17 +723,16 @@ class User(BaseModel):
 class UserInDB(User):
     hashed_password: str
 
-# 사용자 데이터베이스 (실제 구현에서는 DB 사용)
-users_db = {
-    "admin": {
-        "username": "admin",
-        "email": "admin@example.com",
-        "full_name": "Administrator",
-        "disabled": False,
-        "role": "admin",
-        "hashed_password": pwd_context.hash("admin123")
-    }
-}
+# 사용자 저장소 (Redis, 첫 조회 시 로드)
+user_store = UserStore(
+    redis_client,
+    password_hasher,
+    default_admin_password=os.getenv("ADMIN_PASSWORD", "admin123")
+)
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    password_hasher.shutdown()
 
 # OAuth2 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -209,14 +757,17 @@ async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
             raise credentials_exception
-    except JWTError:
+        token_cache.set(token, payload)
+    username: str = payload.get("sub")
+    if username is None:
         raise credentials_exception
-    user = users_db.get(username)
+    user = await user_store.get(username)
     if user is None:
         raise credentials_exception
     return UserInDB(**user)
@@ -230,8 +781,8 @@ async def get_current_admin_user(current_user: User = Depends(get_current_user))
 # 로그인 엔드포인트
 @app.post("/token")
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    user = users_db.get(form_data.username)
-    if not user or not pwd_context.verify(form_data.password, user["hashed_password"]):
+    user = await user_store.get(form_data.username)
+    if not user or not await password_hasher.verify(form_data.password, user["hashed_password"]):
         raise HTTPException(status_code=400, detail="Incorrect username or password")
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -254,92 +805,384 @@ async def env_check():
     }
 
 @app.get("/youtube/video/{video_id}")
-async def get_video_info(video_id: str, current_user: Optional[User] = Depends(get_current_user)):
+async def get_video_info(video_id: str, request: Request, response: Response, current_user: Optional[User] = Depends(get_current_user)):
     try:
-        video_info = youtube_api.get_video_info(video_id)
+        try:
+            cached = fetch_video(video_id, allow_stale=True)
+        except Exception as e:
+            if _is_upstream_outage(e):
+                raise _upstream_unavailable(e)
+            raise
+        headers = _cache_headers(f'"{cached.version}"', cached.remaining_ttl(), scope="private")
+        if cached.is_stale():
+            headers["Warning"] = STALE_WARNING
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        
+        video = cached.video
         return {
-            "title": video_info["title"],
-            "channelTitle": video_info["channel_title"],
-            "thumbnail": video_info["thumbnail_url"],
-            "viewCount": video_info["views"],
-            "likeCount": video_info["likes"],
-            "commentCount": video_info["comments"],
-            "publishedAt": video_info["published_at"],
-            "description": video_info["description"],
-            "channelId": video_info["channel_id"]
+            "title": video.title,
+            "channelTitle": video.channel.channel_title,
+            "thumbnail": video.thumbnail_url,
+            "viewCount": video.views,
+            "likeCount": video.likes,
+            "commentCount": video.comments,
+            "publishedAt": video.published_at,
+            "description": video.description,
+            "channelId": video.channel.channel_id
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"비디오 정보 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/youtube/video/{video_id}/velocity")
+async def get_video_velocity(video_id: str, series: bool = False):
+    try:
+        features = video_stats.features(video_id)
+        if features is None:
+            raise HTTPException(status_code=404, detail="기록된 통계가 없습니다.")
+        if series:
+            features["series"] = [
+                {"timestamp": timestamp, "views": views, "likes": likes, "comments": comments}
+                for timestamp, views, likes, comments in video_stats.points(video_id)
+            ]
+        return features
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"비디오 통계 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/youtube/video/{video_id}/duplicates")
+async def get_video_duplicates(video_id: str, threshold: Optional[float] = None):
+    """제목+설명이 거의 같은 (재업로드/미러링 가능성이 높은) 평가된 비디오"""
+    if near_duplicates is None:
+        raise HTTPException(status_code=404, detail="유사 텍스트 감지가 비활성화되어 있습니다.")
+    threshold = DUPLICATE_FLAG_THRESHOLD if threshold is None else threshold
+    if not 0 < threshold <= 1:
+        raise HTTPException(status_code=400, detail="threshold는 0보다 크고 1 이하여야 합니다.")
+    try:
+        try:
+            cached = await run_in_threadpool(fetch_video, video_id)
+        except CircuitOpenError as e:
+            raise _upstream_unavailable(e)
+        signature = near_duplicates.signature(cached.video.title, cached.video.description)
+        matches = near_duplicates.query(signature, exclude=video_id, threshold=threshold) if signature else []
+        return {
+            "video_id": video_id,
+            "threshold": threshold,
+            "duplicates": [
+                {"video_id": match.video_id, "similarity": match.similarity, "content_trust": match.content.total_score}
+                for match in matches
+            ]
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"유사 비디오 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/events/evaluations")
+async def subscribe_evaluations(request: Request, videos: str = "", channels: str = ""):
+    """비디오/채널 ID를 구독하여 새 평가 결과를 Server-Sent Events로 받습니다."""
+    video_ids = [video_id for video_id in (part.strip() for part in videos.split(",")) if video_id]
+    channel_ids = [channel_id for channel_id in (part.strip() for part in channels.split(",")) if channel_id]
+    if not video_ids and not channel_ids:
+        raise HTTPException(status_code=400, detail="구독할 비디오 또는 채널 ID가 필요합니다.")
+    if len(video_ids) + len(channel_ids) > EVENTS_MAX_TOPICS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {EVENTS_MAX_TOPICS}개까지 구독할 수 있습니다.")
+    if evaluation_events.stats()["subscribers"] >= evaluation_events.max_subscribers:
+        raise HTTPException(status_code=503, detail="구독자 수가 한도에 도달했습니다.", headers={"Retry-After": "30"})
+    
+    async def stream():
+        subscription = evaluation_events.subscribe(video_ids, channel_ids)
+        try:
+            yield b"retry: 5000\n\n"
+            # 저장된 마지막 평가 결과를 먼저 전송
+            if video_ids:
+                pipe = redis_client.pipeline()
+                for video_id in video_ids:
+                    pipe.get(LAST_EVALUATION_KEY.format(video_id=video_id))
+                for video_id, stored in zip(video_ids, pipe.execute()):
+                    if stored is not None:
+                        snapshot = json.dumps({"video_id": video_id, **codec.loads(stored)}, ensure_ascii=False)
+                        yield f"event: snapshot\ndata: {snapshot}\n\n".encode("utf-8")
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscription.queue.get(), EVENTS_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    frame = b": ping\n\n"
+                yield frame
+        finally:
+            evaluation_events.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/search")
 async def search_videos(request: SearchRequest):
     try:
-        results = youtube_api.search_videos(request.query, request.max_results)
-        return results
+        max_results = min(max(request.max_results or 10, 1), RESULT_BUCKETS[-1])
+        
+        # 같은 검색어(정규화 기준)의 캐시된 결과 사용, 없으면 버킷 크기로 검색하여 저장
+        page = search_cache.get(request.query, max_results)
+        if page is None:
+            bucket = result_bucket(max_results)
+            page = youtube_api.search_ids(request.query, bucket)
+            search_cache.put(request.query, bucket, page)
+            page["video_ids"] = page["video_ids"][:max_results]
+        
+        # 비디오 정보는 비디오 캐시에서 채우고, 없는 비디오만 일괄 조회
+        videos = fetch_videos(page["video_ids"])
+        results = []
+        for video_id in page["video_ids"]:
+            cached = videos.get(video_id)
+            if cached is None:
+                logger.warning(f"비디오 {video_id} 정보 조회 실패")
+                continue
+            video = cached.video
+            results.append({
+                'video_id': video_id,
+                'title': video.title,
+                'description': video.description,
+                'thumbnail': video.thumbnail_url,
+                'channel_title': video.channel.channel_title,
+                'published_at': video.published_at,
+                'views': video.views,
+                'likes': video.likes,
+                'comments': video.comments
+            })
+        return {
+            'total_results': page["total_results"],
+            'results': results
+        }
+    except CircuitOpenError as e:
+        raise _upstream_unavailable(e)
     except Exception as e:
         logger.error(f"비디오 검색 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/evaluate/{video_id}")
-async def evaluate_video(video_id: str):
+async def evaluate_video(video_id: str, request: Request, fields: Optional[str] = None, view: Optional[str] = None,
+                         tenant: str = Depends(get_tenant)):
+    # 필드 선택 (view=summary는 요약 필드만 반환)
     try:
-        # 비디오 정보 가져오기
-        video_info = youtube_api.get_video_info(video_id)
+        if view == "summary":
+            fields = SUMMARY_FIELDS
+        elif view not in (None, "full"):
+            raise ValueError(f"알 수 없는 view입니다: {view}")
+        projection = parse_fields(fields) if fields else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        # 비디오 정보 가져오기 (YouTube API 장애 시 만료된 캐시 사용)
+        try:
+            cached = fetch_video(video_id, allow_stale=True)
+        except Exception as e:
+            if not _is_upstream_outage(e):
+                raise
+            tenant_evaluator = get_evaluator(tenant) if tenant != DEFAULT_TENANT else None
+            return _last_evaluation_response(video_id, projection, e, tenant_evaluator)
+        video = cached.video
+        stale = cached.is_stale()
         
-        # 출처 신뢰도 평가
-        source_trust = evaluator.evaluate_source_trust(video_info)
+        # 비디오 데이터 버전과 테넌트 설정 버전이 같으면 평가 결과도 같으므로 304 응답
+        current = get_tenant_config(tenant)
+        current_evaluator = current.evaluator
+        etag = f"{cached.version}-{current.tag}"
+        if projection is not None:
+            # 필드 선택이 다르면 응답 본문도 다르므로 ETag에 반영
+            etag += "-" + hashlib.blake2b(repr(sorted((name, sorted(sub or ())) for name, sub in projection.items())).encode("utf-8"), digest_size=4).hexdigest()
+        headers = _cache_headers(f'"{etag}"', cached.remaining_ttl())
+        # 같은 URL이라도 API 키(테넌트)에 따라 결과가 다름
+        headers["Vary"] = "X-API-Key"
+        if stale:
+            headers["Warning"] = STALE_WARNING
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
         
-        # 내용 신뢰도 평가
-        content_trust = evaluator.evaluate_content_trust(video_info)
+        # 출처/내용 신뢰도 및 종합 점수 평가
+        evaluation = await score_video(video, current_evaluator)
         
-        # 종합 점수 계산 (ScoreCalculator 사용)
-        final_score = score_calculator.calculate_score(
-            trust_score=source_trust["total_score"],
-            content_score=content_trust["total_score"]
-        )
+        if stale:
+            # 만료된 데이터로 계산한 결과는 기록하지 않음
+            body = evaluation.to_dict(projection)
+            body.update(stale=True, data_age=cached.age())
+            return FastJSONResponse(content=body, headers=headers)
         
-        # 등급 및 설명 추가
-        grade = score_calculator.get_grade(final_score)
-        grade_description = score_calculator.get_grade_description(grade)
+        # 아카이브/통계/구독은 기본 테넌트 설정의 평가 결과만 기록
+        if tenant == DEFAULT_TENANT:
+            record_evaluation(evaluation, cached.version)
         
-        return {
-            "video_info": video_info,
-            "source_trust": source_trust,
-            "content_trust": content_trust,
-            "final_score": final_score,
-            "grade": grade,
-            "grade_description": grade_description
-        }
+        # 응답 모델 검증/변환 없이 바로 직렬화
+        return FastJSONResponse(content=evaluation.to_dict(projection), headers=headers)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"비디오 평가 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="비디오 평가 중 오류가 발생했습니다.")
 
+@app.get("/evaluate/{video_id}/comments")
+async def evaluate_comments(video_id: str, tenant: str = Depends(get_tenant)):
+    """댓글 키워드 분석 결과 (종합 점수에는 반영하지 않는 별도 신호)"""
+    if comment_analyzer is None:
+        raise HTTPException(status_code=404, detail="댓글 분석이 비활성화되어 있습니다.")
+    try:
+        missing_videos.check(video_id)
+        return await run_in_threadpool(comment_analyzer.get, video_id, get_evaluator(tenant))
+    except Exception as e:
+        if _is_upstream_outage(e):
+            raise _upstream_unavailable(e)
+        if isinstance(e, ValueError):
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.error(f"댓글 분석 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail="댓글 분석 중 오류가 발생했습니다.")
+
+def _find_near_duplicate(video: VideoInfo, keyword_version: str) -> Tuple[Optional[List[int]], Optional[DuplicateMatch]]:
+    """유사 텍스트 서명 계산과 색인 조회 (Redis 왕복이 있으므로 스레드 풀에서 실행)"""
+    signature = near_duplicates.signature(video.title, video.description)
+    if signature is None:
+        return None, None
+    return signature, near_duplicates.find_reusable(video.video_id, signature, keyword_version, DUPLICATE_REUSE_THRESHOLD)
+
+async def score_video(video: VideoInfo, current_evaluator: Evaluator) -> Evaluation:
+    """내용 분석(메모/프로세스 풀)을 거쳐 비디오를 평가합니다."""
+    memo_key = text_memo.key(video.title, video.description, current_evaluator.keyword_version)
+    content = text_memo.get(memo_key)
+    if content is None:
+        # 같은 키워드 설정으로 분석한 거의 같은 텍스트가 있으면 텍스트 분석 생략
+        signature = match = None
+        if near_duplicates is not None:
+            try:
+                signature, match = await run_in_threadpool(_find_near_duplicate, video, current_evaluator.keyword_version)
+            except Exception as e:
+                logger.warning(f"[DUPLICATE] 유사 텍스트 조회 실패: {str(e)}")
+        
+        if match is not None:
+            logger.info(f"[DUPLICATE] 유사 비디오의 내용 신뢰도 재사용: {video.video_id} -> {match.video_id} ({match.similarity:.2f})")
+            content = match.content
+        elif content_pool is not None:
+            # 내용 신뢰도는 키워드 설정에만 의존하므로 키워드 지문이 같은 테넌트끼리 평가기를 공유
+            content = await content_pool.score(video, current_evaluator.keyword_version, current_evaluator.admin_config)
+        else:
+            content = current_evaluator.score_content(video)
+        text_memo.set(memo_key, content)
+        
+        # 재사용한 결과는 색인하지 않아 유사도가 연쇄적으로 낮아지는 것을 방지
+        if signature is not None and match is None:
+            try:
+                await run_in_threadpool(near_duplicates.add, video.video_id, signature, current_evaluator.keyword_version, content)
+            except Exception as e:
+                logger.warning(f"[DUPLICATE] 유사 텍스트 색인 실패: {str(e)}")
+    return current_evaluator.evaluate(video, content)
+
+def _is_new_evaluation(video_id: str, data_version: str) -> bool:
+    """
+    같은 (데이터 버전, 설정 버전)의 평가 결과를 처음 기록하는 요청인지 확인합니다.
+    
+    이 워커가 이미 발행한 버전이면 Redis 왕복 없이 건너뛰고, 그 외에는 버전별 표식을
+    SET NX로 설정한 워커 하나만 기록합니다 (Redis 오류 시에는 기록).
+    """
+    if evaluation_events.last_published(video_id) == (data_version, evaluator_config_version):
+        return False
+    try:
+        return bool(redis_client.set(
+            RECORDED_EVALUATION_KEY.format(video_id=video_id, data_version=data_version, config_version=evaluator_config_version),
+            1, nx=True, ex=LAST_EVALUATION_TTL
+        ))
+    except Exception as e:
+        logger.warning(f"평가 결과 기록 여부 확인 실패: {str(e)}")
+        return True
+
+def record_evaluation(evaluation: Evaluation, data_version: str, reason: str = "evaluate") -> None:
+    """새 평가 결과를 기록하고 구독자에게 발행합니다 (실패해도 응답에는 영향 없음)."""
+    video_id = evaluation.video.video_id
+    
+    # 분석용 아카이브와 증분 집계에는 데이터 또는 설정이 바뀐 결과만 한 번 기록 (요청 수가 아닌 평가 건수 기준)
+    if _is_new_evaluation(video_id, data_version):
+        try:
+            evaluation_archive.append(evaluation, keyword_version=evaluator.keyword_version)
+        except Exception as e:
+            logger.warning(f"평가 결과 아카이브 기록 실패: {str(e)}")
+        
+        try:
+            evaluation_stats.record(evaluation, evaluator_config_version)
+        except Exception as e:
+            logger.warning(f"평가 결과 집계 갱신 실패: {str(e)}")
+    
+    # YouTube API 장애 시 대체 응답용 마지막 평가 결과 저장
+    try:
+        redis_client.setex(
+            LAST_EVALUATION_KEY.format(video_id=video_id),
+            LAST_EVALUATION_TTL,
+            codec.dumps({"evaluation": evaluation.to_dict(), "evaluated_at": time.time(), "config_version": evaluator_config_version})
+        )
+    except Exception as e:
+        logger.warning(f"마지막 평가 결과 저장 실패: {str(e)}")
+    
+    # 데이터 또는 설정이 바뀐 결과만 발행
+    if evaluation_events.last_published(video_id) != (data_version, evaluator_config_version):
+        try:
+            evaluation_events.publish(evaluation, data_version, evaluator_config_version, reason)
+        except Exception as e:
+            logger.warning(f"평가 결과 발행 실패: {str(e)}")
+
+def _last_evaluation_response(video_id: str, projection: Optional[Dict], error: Exception,
+                              current_evaluator: Optional[Evaluator] = None) -> Response:
+    """
+    YouTube API 장애 시 마지막으로 저장된 평가 결과를 반환하고, 없으면 503
+
+    저장된 결과는 기본 테넌트 설정의 평가 결과이므로, 다른 테넌트는 current_evaluator로
+    저장된 비디오 정보를 다시 평가합니다.
+    """
+    try:
+        stored = redis_client.get(LAST_EVALUATION_KEY.format(video_id=video_id))
+    except Exception as e:
+        logger.warning(f"마지막 평가 결과 조회 실패: {str(e)}")
+        stored = None
+    if stored is None:
+        raise _upstream_unavailable(error)
+    
+    record = codec.loads(stored)
+    logger.warning(f"[UPSTREAM] YouTube API 장애로 마지막 평가 결과 사용: {video_id}")
+    evaluation = Evaluation.from_dict(record["evaluation"])
+    if current_evaluator is not None:
+        evaluation = current_evaluator.evaluate(evaluation.video)
+    body = evaluation.to_dict(projection)
+    body.update(stale=True, data_age=int(time.time() - record["evaluated_at"]))
+    return FastJSONResponse(content=body, headers={"Cache-Control": "no-cache", "Warning": STALE_WARNING})
+
 # 관리자 설정 관련 엔드포인트
 @app.get("/api/admin/config")
-async def get_admin_config(current_user: User = Depends(get_current_admin_user)):
+async def get_admin_config(tenant: str = Depends(admin_tenant), current_user: User = Depends(get_current_admin_user)):
     try:
-        config = redis_client.get(ADMIN_CONFIG_KEY)
-        return json.loads(config) if config else default_admin_config
+        config = redis_client.get(tenant_keys(tenant).config)
+        return codec.loads(config) if config else default_admin_config
     except Exception as e:
         logger.error(f"관리자 설정 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/admin/config")
-async def update_admin_config(config: AdminConfig, current_user: User = Depends(get_current_admin_user)):
+async def update_admin_config(config: AdminConfig, tenant: str = Depends(admin_tenant),
+                              current_user: User = Depends(get_current_admin_user)):
     try:
         # 현재 설정 저장
-        redis_client.set(ADMIN_CONFIG_KEY, json.dumps(config.dict()))
+        redis_client.set(tenant_keys(tenant).config, codec.dumps(config.dict()))
+        _bump_config_version(tenant)
         
         # 변경 이력 저장
-        history = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "changes": json.dumps(config.dict()),
-            "user": current_user.username
-        }
-        redis_client.rpush(CONFIG_HISTORY_KEY, json.dumps(history))
+        get_config_history(tenant).append(config.dict(), current_user.username)
         
         return {"message": "설정이 업데이트되었습니다."}
     except Exception as e:
@@ -347,16 +1190,17 @@ async def update_admin_config(config: AdminConfig, current_user: User = Depends(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/admin/history")
-async def get_config_history(current_user: User = Depends(get_current_admin_user)):
+async def list_config_history(limit: int = 50, tenant: str = Depends(admin_tenant),
+                              current_user: User = Depends(get_current_admin_user)):
     try:
-        history = redis_client.lrange(CONFIG_HISTORY_KEY, 0, -1)
-        return [json.loads(item) for item in history]
+        return get_config_history(tenant).recent(limit)
     except Exception as e:
         logger.error(f"설정 변경 이력 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/admin/config/pending")
-async def submit_pending_changes(config: AdminConfig, current_user: User = Depends(get_current_admin_user)):
+async def submit_pending_changes(config: AdminConfig, tenant: str = Depends(admin_tenant),
+                                 current_user: User = Depends(get_current_admin_user)):
     try:
         change = {
             "id": str(uuid4()),
@@ -365,28 +1209,30 @@ async def submit_pending_changes(config: AdminConfig, current_user: User = Depen
             "user": current_user.username,
             "status": "pending"
         }
-        redis_client.rpush(PENDING_CHANGES_KEY, json.dumps(change))
+        redis_client.rpush(tenant_keys(tenant).pending, codec.dumps(change))
         return {"message": "변경 요청이 제출되었습니다.", "change_id": change["id"]}
     except Exception as e:
         logger.error(f"변경 요청 제출 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/admin/config/pending")
-async def get_pending_changes(current_user: User = Depends(get_current_admin_user)):
+async def get_pending_changes(tenant: str = Depends(admin_tenant), current_user: User = Depends(get_current_admin_user)):
     try:
-        changes = redis_client.lrange(PENDING_CHANGES_KEY, 0, -1)
-        return [json.loads(change) for change in changes if json.loads(change)["status"] == "pending"]
+        changes = redis_client.lrange(tenant_keys(tenant).pending, 0, -1)
+        return [change for change in map(codec.loads, changes) if change["status"] == "pending"]
     except Exception as e:
         logger.error(f"대기 중인 변경 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/admin/config/approve")
-async def approve_changes(change_id: str, current_user: User = Depends(get_current_admin_user)):
+async def approve_changes(change_id: str, tenant: str = Depends(admin_tenant),
+                          current_user: User = Depends(get_current_admin_user)):
     try:
         # 대기 중인 변경 찾기
-        changes = redis_client.lrange(PENDING_CHANGES_KEY, 0, -1)
+        keys = tenant_keys(tenant)
+        changes = redis_client.lrange(keys.pending, 0, -1)
         for i, change_str in enumerate(changes):
-            change = json.loads(change_str)
+            change = codec.loads(change_str)
             if change["id"] == change_id and change["status"] == "pending":
                 # 변경 승인
                 change["status"] = "approved"
@@ -394,16 +1240,12 @@ async def approve_changes(change_id: str, current_user: User = Depends(get_curre
                 change["approved_at"] = datetime.utcnow().isoformat()
                 
                 # Redis 업데이트
-                redis_client.lset(PENDING_CHANGES_KEY, i, json.dumps(change))
-                redis_client.set(ADMIN_CONFIG_KEY, json.dumps(change["config"]))
+                redis_client.lset(keys.pending, i, codec.dumps(change))
+                redis_client.set(keys.config, codec.dumps(change["config"]))
+                _bump_config_version(tenant)
                 
                 # 변경 이력 저장
-                history = {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "changes": json.dumps(change["config"]),
-                    "user": current_user.username
-                }
-                redis_client.rpush(CONFIG_HISTORY_KEY, json.dumps(history))
+                get_config_history(tenant).append(change["config"], current_user.username, change_id=change_id)
                 
                 return {"message": "변경이 승인되었습니다."}
         
@@ -412,32 +1254,195 @@ async def approve_changes(change_id: str, current_user: User = Depends(get_curre
         logger.error(f"변경 승인 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/admin/config/simulate")
+async def simulate_config(request: SimulationRequest, tenant: str = Depends(admin_tenant),
+                          current_user: User = Depends(get_current_admin_user)):
+    """후보 설정을 저장된 평가 결과에 적용했을 때의 점수 변화 미리보기"""
+    if request.config is not None:
+        candidate = request.config.dict()
+    elif request.change_id:
+        changes = redis_client.lrange(tenant_keys(tenant).pending, 0, -1)
+        candidate = next(
+            (change["config"] for change in map(codec.loads, changes) if change["id"] == request.change_id),
+            None
+        )
+        if candidate is None:
+            raise HTTPException(status_code=404, detail="변경 요청을 찾을 수 없습니다.")
+    else:
+        raise HTTPException(status_code=400, detail="change_id 또는 config가 필요합니다.")
+    
+    try:
+        # 저장된 점수는 기록 당시 설정의 결과이므로 모든 테넌트에서 현재 설정으로 기준 점수를 다시 계산
+        baseline = get_evaluator(tenant).admin_config
+        
+        def run():
+            evaluation_archive.flush()
+            with evaluation_archive.reader() as reader:
+                return simulate(reader, candidate, baseline, sample=request.sample)
+        
+        return await run_in_threadpool(run)
+    except Exception as e:
+        logger.error(f"설정 시뮬레이션 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/admin/config/rollback")
-async def rollback_config(history_id: int, current_user: User = Depends(get_current_admin_user)):
+async def rollback_config(history_id: int, tenant: str = Depends(admin_tenant),
+                          current_user: User = Depends(get_current_admin_user)):
     try:
-        # 변경 이력 가져오기
-        history = redis_client.lrange(CONFIG_HISTORY_KEY, history_id, history_id)
-        if not history:
+        # 변경 이력 시점의 설정 복원
+        history = get_config_history(tenant)
+        config = history.config_at(history_id)
+        if config is None:
             raise HTTPException(status_code=404, detail="변경 이력을 찾을 수 없습니다.")
         
         # 설정 롤백
-        config = json.loads(json.loads(history[0])["changes"])
-        redis_client.set(ADMIN_CONFIG_KEY, json.dumps(config))
+        redis_client.set(tenant_keys(tenant).config, codec.dumps(config))
+        _bump_config_version(tenant)
         
         # 롤백 이력 저장
-        rollback = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "changes": json.dumps(config),
-            "user": current_user.username,
-            "rollback_from": history_id
-        }
-        redis_client.rpush(CONFIG_HISTORY_KEY, json.dumps(rollback))
+        history.append(config, current_user.username, rollback_from=history_id)
         
         return {"message": "설정이 롤백되었습니다."}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"설정 롤백 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# 테넌트 관리 엔드포인트
+@app.get("/api/admin/tenants")
+async def list_tenants(current_user: User = Depends(get_current_admin_user)):
+    try:
+        return [
+            {"tenant": tenant, "config_version": get_config_version(tenant), "api_keys": len(tenant_directory.keys(tenant))}
+            for tenant in tenant_directory.tenants()
+        ]
+    except Exception as e:
+        logger.error(f"테넌트 목록 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/admin/tenants/{tenant_id}")
+async def create_tenant(tenant_id: str, current_user: User = Depends(get_current_admin_user)):
+    """새 테넌트 생성 (기본 테넌트의 현재 설정으로 시작)"""
+    try:
+        config = get_evaluator().admin_config
+        if not tenant_directory.create(tenant_id, config):
+            raise HTTPException(status_code=409, detail="이미 존재하는 테넌트입니다.")
+        get_config_history(tenant_id).append(config, current_user.username, created=True)
+        return {"message": "테넌트가 생성되었습니다.", "tenant": tenant_id}
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"테넌트 생성 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/admin/tenants/{tenant_id}/api-keys")
+async def issue_tenant_api_key(tenant_id: str, current_user: User = Depends(get_current_admin_user)):
+    """API 키 발급 (원문은 이 응답에서만 확인 가능)"""
+    if tenant_id == DEFAULT_TENANT or not tenant_directory.exists(tenant_id):
+        raise HTTPException(status_code=404, detail="테넌트를 찾을 수 없습니다.")
+    try:
+        return tenant_directory.issue_key(tenant_id)
+    except Exception as e:
+        logger.error(f"API 키 발급 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/admin/tenants/{tenant_id}/api-keys")
+async def list_tenant_api_keys(tenant_id: str, current_user: User = Depends(get_current_admin_user)):
+    if not tenant_directory.exists(tenant_id):
+        raise HTTPException(status_code=404, detail="테넌트를 찾을 수 없습니다.")
+    try:
+        return {"tenant": tenant_id, "key_ids": tenant_directory.keys(tenant_id)}
+    except Exception as e:
+        logger.error(f"API 키 목록 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/api/admin/tenants/{tenant_id}/api-keys/{key_id}")
+async def revoke_tenant_api_key(tenant_id: str, key_id: str, current_user: User = Depends(get_current_admin_user)):
+    try:
+        if not tenant_directory.revoke_key(tenant_id, key_id):
+            raise HTTPException(status_code=404, detail="API 키를 찾을 수 없습니다.")
+        return {"message": "API 키가 폐기되었습니다."}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"API 키 폐기 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 캐시 상태 엔드포인트
+@app.get("/api/admin/cache/stats")
+async def get_cache_stats(current_user: User = Depends(get_current_admin_user)):
+    return {
+        "video_info": video_cache.stats(),
+        "channels": youtube_api.channel_cache.stats(),
+        "search": search_cache.stats(),
+        "missing_videos": missing_videos.stats(),
+        "text_analysis": text_memo.stats(),
+        "near_duplicates": near_duplicates.stats() if near_duplicates is not None else None,
+        "comments": comment_analyzer.stats() if comment_analyzer is not None else None,
+        "evaluators": evaluator_registry.stats(),
+        "snapshot": cache_snapshot.stats() if cache_snapshot is not None else None
+    }
+
+# 프로파일링 엔드포인트
+@app.get("/api/admin/profile/sample")
+async def sample_profile(seconds: float = 10, interval_ms: float = 5, current_user: User = Depends(get_current_admin_user)):
+    if not 0 < seconds <= 60 or not 1 <= interval_ms <= 1000:
+        raise HTTPException(status_code=400, detail="seconds는 0~60, interval_ms는 1~1000 범위여야 합니다.")
+    try:
+        # 샘플링은 별도 스레드에서 실행되므로 이벤트 루프는 계속 요청을 처리(측정)할 수 있음
+        collapsed = await run_in_threadpool(sampling_profiler.collect, seconds, interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    filename = f"profile-{os.getpid()}-{datetime.now().strftime('%Y%m%d%H%M%S')}.collapsed"
+    return PlainTextResponse(collapsed, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+@app.get("/api/admin/profile/requests/{profile_id}")
+async def get_request_profile(profile_id: str, current_user: User = Depends(get_current_admin_user)):
+    report = profile_reports.get(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="프로파일링 결과를 찾을 수 없습니다.")
+    return PlainTextResponse(report)
+
+# 외부 서비스 상태 엔드포인트
+@app.get("/api/admin/upstream")
+async def get_upstream_status(current_user: User = Depends(get_current_admin_user)):
+    return {"youtube": youtube_api.breaker.stats()}
+
+# 평가 통계 엔드포인트
+@app.get("/api/admin/analytics/grades")
+async def get_grade_distribution(config_version: Optional[int] = None, current_user: User = Depends(get_current_admin_user)):
+    try:
+        return evaluation_stats.grade_histogram(config_version)
+    except Exception as e:
+        logger.error(f"등급 분포 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/admin/analytics/channels")
+async def get_channel_leaderboard(
+    order: str = "top",
+    limit: int = 10,
+    min_count: int = 1,
+    current_user: User = Depends(get_current_admin_user)
+):
+    if order not in ("top", "bottom"):
+        raise HTTPException(status_code=400, detail="order는 top 또는 bottom이어야 합니다.")
+    try:
+        return evaluation_stats.channel_leaderboard(order, min(limit, 100), min_count)
+    except Exception as e:
+        logger.error(f"채널 순위 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/admin/analytics/drift")
+async def get_score_drift(hours: int = 24, current_user: User = Depends(get_current_admin_user)):
+    try:
+        return evaluation_stats.score_drift(max(1, min(hours, 24 * 90)))
+    except Exception as e:
+        logger.error(f"점수 추이 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 def _generate_source_analysis(source_trust: Dict) -> str:
     """출처 신뢰도 분석 결과 생성"""
     try:
@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional
+from datetime import datetime, timezone, timedelta
+import logging
+from .records import Evaluation
+from .codec import to_text
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정
+GRADE_HISTOGRAM_KEY = "stats:grades:{version}"
+CONFIG_VERSIONS_KEY = "stats:versions"
+CHANNEL_SUM_KEY = "stats:channel:sum"
+CHANNEL_COUNT_KEY = "stats:channel:count"
+CHANNEL_MEAN_KEY = "stats:channel:mean"
+CHANNEL_TITLE_KEY = "stats:channel:title"
+DRIFT_SUM_KEY = "stats:drift:sum"
+DRIFT_COUNT_KEY = "stats:drift:count"
+
+# 점수 추이 집계 단위 (시간 버킷)
+DRIFT_BUCKET_FORMAT = "%Y%m%d%H"
+
+
+class EvaluationStats:
+    """
+    평가 결과에 대한 증분 집계
+
+    평가가 발생할 때마다 Redis 카운터와 정렬 집합을 갱신하므로
+    조회 비용은 누적 평가 건수와 무관합니다. 같은 (비디오, 데이터 버전, 설정 버전)의 반복 요청은
+    호출하는 쪽(record_evaluation)에서 걸러 한 번만 반영합니다.
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def record(self, evaluation: Evaluation, config_version: int, timestamp: Optional[datetime] = None) -> None:
+        """평가 결과 한 건을 집계에 반영합니다."""
+        channel = evaluation.video.channel
+        channel_id = channel.channel_id
+        score = float(evaluation.final_score)
+        bucket = (timestamp or datetime.now(timezone.utc)).strftime(DRIFT_BUCKET_FORMAT)
+
+        pipe = self.redis.pipeline()
+        pipe.hincrby(GRADE_HISTOGRAM_KEY.format(version=config_version), evaluation.grade, 1)
+        pipe.sadd(CONFIG_VERSIONS_KEY, config_version)
+        pipe.hincrbyfloat(DRIFT_SUM_KEY, bucket, score)
+        pipe.hincrby(DRIFT_COUNT_KEY, bucket, 1)
+        if channel_id:
+            pipe.hincrbyfloat(CHANNEL_SUM_KEY, channel_id, score)
+            pipe.hincrby(CHANNEL_COUNT_KEY, channel_id, 1)
+            pipe.hset(CHANNEL_TITLE_KEY, channel_id, channel.channel_title)
+        results = pipe.execute()
+
+        if channel_id:
+            channel_sum, channel_count = float(results[4]), int(results[5])
+            self.redis.zadd(CHANNEL_MEAN_KEY, {channel_id: channel_sum / channel_count})
+
+    def grade_histogram(self, config_version: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """설정 버전별 등급 분포"""
+        if config_version is None:
+            versions = sorted(int(version) for version in self.redis.smembers(CONFIG_VERSIONS_KEY))
+        else:
+            versions = [config_version]
+
+        pipe = self.redis.pipeline()
+        for version in versions:
+            pipe.hgetall(GRADE_HISTOGRAM_KEY.format(version=version))
+        return {
+            str(version): {to_text(grade): int(count) for grade, count in histogram.items()}
+            for version, histogram in zip(versions, pipe.execute())
+        }
+
+    def channel_leaderboard(self, order: str = "top", limit: int = 10, min_count: int = 1) -> List[Dict]:
+        """평균 점수 기준 상위/하위 채널"""
+        fetch = self.redis.zrevrange if order == "top" else self.redis.zrange
+        leaderboard: List[Dict] = []
+        start, page = 0, max(limit, 1) * 4
+
+        while len(leaderboard) < limit:
+            entries = fetch(CHANNEL_MEAN_KEY, start, start + page - 1, withscores=True)
+            if not entries:
+                break
+            channel_ids = [channel_id for channel_id, _ in entries]
+            counts = self.redis.hmget(CHANNEL_COUNT_KEY, channel_ids)
+            titles = self.redis.hmget(CHANNEL_TITLE_KEY, channel_ids)
+            for (channel_id, mean), count, title in zip(entries, counts, titles):
+                count = int(count or 0)
+                if count < min_count:
+                    continue
+                leaderboard.append({
+                    "channel_id": to_text(channel_id),
+                    "channel_title": to_text(title) or "",
+                    "mean_score": mean,
+                    "evaluations": count
+                })
+                if len(leaderboard) >= limit:
+                    break
+            start += page
+
+        return leaderboard
+
+    def score_drift(self, hours: int = 24, now: Optional[datetime] = None) -> List[Dict]:
+        """시간 버킷별 평균 점수 추이"""
+        now = now or datetime.now(timezone.utc)
+        buckets = [(now - timedelta(hours=offset)).strftime(DRIFT_BUCKET_FORMAT) for offset in range(hours - 1, -1, -1)]
+        if not buckets:
+            return []
+
+        sums = self.redis.hmget(DRIFT_SUM_KEY, buckets)
+        counts = self.redis.hmget(DRIFT_COUNT_KEY, buckets)
+        drift = []
+        for bucket, total, count in zip(buckets, sums, counts):
+            count = int(count or 0)
+            drift.append({
+                "bucket": datetime.strptime(bucket, DRIFT_BUCKET_FORMAT).replace(tzinfo=timezone.utc).isoformat(),
+                "evaluations": count,
+                "mean_score": float(total) / count if count else None
+            })
+        return drift
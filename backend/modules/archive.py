@@ -0,0 +1,399 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+import json
+import logging
+import mmap
+import os
+import sys
+import threading
+import time
+from .records import Evaluation
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 고정 폭 컬럼 정의 (컬럼 이름, array 타입 코드)
+# q: int64, d: float64, I: uint32, B: uint8
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "q"),
+    ("final_score", "d"),
+    ("source_score", "d"),
+    ("content_score", "d"),
+    ("subscriber_score", "d"),
+    ("activity_score", "d"),
+    ("engagement_score", "d"),
+    ("title_score", "d"),
+    ("description_score", "d"),
+    ("sentiment_score", "d"),
+    ("views", "q"),
+    ("likes", "q"),
+    ("comments", "q"),
+    ("subscriber_count", "q"),
+    ("channel_age", "q"),
+    ("video_count", "q"),
+    ("channel", "I"),       # 세그먼트 채널 사전 인덱스
+    ("grade", "B"),         # 세그먼트 등급 사전 인덱스
+    ("keywords", "I"),      # 세그먼트 키워드 설정 지문 사전 인덱스
+    ("text_offset", "q"),   # text.bin 내 제목 시작 위치
+    ("title_length", "I"),
+    ("description_length", "I"),
+)
+COLUMN_TYPES: Dict[str, str] = dict(COLUMNS)
+
+# 비디오 ID는 고정 폭 바이트 컬럼으로 저장
+VIDEO_ID_WIDTH = 16
+
+SEGMENT_PREFIX = "seg-"
+META_FILE = "meta.json"
+TEXT_FILE = "text.bin"
+VIDEO_ID_FILE = "video_id.col"
+CHANNEL_DICT_FILE = "channels.dict"
+GRADE_DICT_FILE = "grades.dict"
+KEYWORDS_DICT_FILE = "keywords.dict"
+FORMAT_VERSION = 2
+
+
+def _column_path(segment_dir: str, name: str) -> str:
+    return os.path.join(segment_dir, f"{name}.col")
+
+
+class SegmentWriter:
+    """단일 세그먼트에 대한 추가 전용 기록기"""
+
+    def __init__(self, segment_dir: str):
+        self.segment_dir = segment_dir
+        os.makedirs(segment_dir, exist_ok=True)
+
+        meta_path = os.path.join(segment_dir, META_FILE)
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": FORMAT_VERSION,
+                    "byteorder": sys.byteorder,
+                    "columns": [list(column) for column in COLUMNS],
+                    "created_at": datetime.now(timezone.utc).isoformat()
+                }, f)
+
+        self.channels = self._load_dict(CHANNEL_DICT_FILE)
+        self.grades = self._load_dict(GRADE_DICT_FILE)
+        self.keyword_versions = self._load_dict(KEYWORDS_DICT_FILE)
+        self.rows = self._recover()
+        self.text_size = os.path.getsize(os.path.join(segment_dir, TEXT_FILE)) \
+            if os.path.exists(os.path.join(segment_dir, TEXT_FILE)) else 0
+
+        # 버퍼링된 행
+        self._buffers = {name: array(typecode) for name, typecode in COLUMNS}
+        self._video_ids = bytearray()
+        self._text = bytearray()
+        self._new_channels: List[str] = []
+        self._new_grades: List[str] = []
+        self._new_keyword_versions: List[str] = []
+        self.pending = 0
+
+    def _load_dict(self, filename: str) -> Dict[str, int]:
+        path = os.path.join(self.segment_dir, filename)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return {line.rstrip("\n"): i for i, line in enumerate(f)}
+
+    def _recover(self) -> int:
+        """비정상 종료로 길이가 어긋난 컬럼을 가장 짧은 행 수에 맞춰 잘라냅니다."""
+        counts = []
+        for name, typecode in COLUMNS:
+            path = _column_path(self.segment_dir, name)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            counts.append(size // array(typecode).itemsize)
+        path = os.path.join(self.segment_dir, VIDEO_ID_FILE)
+        counts.append((os.path.getsize(path) if os.path.exists(path) else 0) // VIDEO_ID_WIDTH)
+
+        rows = min(counts)
+        if rows != max(counts):
+            logger.warning(f"[ARCHIVE] 세그먼트 복구: {self.segment_dir} ({rows}행으로 정리)")
+            for name, typecode in COLUMNS:
+                path = _column_path(self.segment_dir, name)
+                if os.path.exists(path):
+                    os.truncate(path, rows * array(typecode).itemsize)
+            path = os.path.join(self.segment_dir, VIDEO_ID_FILE)
+            if os.path.exists(path):
+                os.truncate(path, rows * VIDEO_ID_WIDTH)
+        return rows
+
+    def _encode(self, mapping: Dict[str, int], pending: List[str], value: str) -> int:
+        value = value.replace("\n", " ")
+        index = mapping.get(value)
+        if index is None:
+            index = len(mapping)
+            mapping[value] = index
+            pending.append(value)
+        return index
+
+    def append(self, evaluation: Evaluation, timestamp: Optional[float] = None, keyword_version: str = "") -> None:
+        """평가 결과 한 건을 버퍼에 추가합니다. keyword_version은 내용 점수를 계산한 키워드 설정 지문입니다."""
+        video = evaluation.video
+        channel = video.channel
+        source = evaluation.source
+        content = evaluation.content
+
+        title = (video.title or "").encode("utf-8")
+        description = (video.description or "").encode("utf-8")
+
+        values = {
+            "timestamp": int(timestamp or time.time()),
+            "final_score": float(evaluation.final_score),
+            "source_score": float(source.total_score),
+            "content_score": float(content.total_score),
+            "subscriber_score": float(source.subscriber_score),
+            "activity_score": float(source.activity_score),
+            "engagement_score": float(source.engagement_score),
+            "title_score": float(content.title_score),
+            "description_score": float(content.description_score),
+            "sentiment_score": float(content.sentiment_score),
+            "views": int(video.views),
+            "likes": int(video.likes),
+            "comments": int(video.comments),
+            "subscriber_count": int(channel.subscriber_count),
+            "channel_age": int(channel.channel_age),
+            "video_count": int(channel.video_count),
+            "channel": self._encode(self.channels, self._new_channels, channel.channel_id),
+            "grade": self._encode(self.grades, self._new_grades, evaluation.grade),
+            "keywords": self._encode(self.keyword_versions, self._new_keyword_versions, keyword_version),
+            "text_offset": self.text_size + len(self._text),
+            "title_length": len(title),
+            "description_length": len(description),
+        }
+        for name, _ in COLUMNS:
+            self._buffers[name].append(values[name])
+
+        video_id = video.video_id.encode("utf-8")[:VIDEO_ID_WIDTH]
+        self._video_ids += video_id.ljust(VIDEO_ID_WIDTH, b"\0")
+        self._text += title
+        self._text += description
+        self.pending += 1
+
+    def flush(self) -> None:
+        """버퍼링된 행을 디스크에 기록합니다."""
+        if not self.pending:
+            return
+
+        # 사전과 텍스트를 먼저 기록해야 컬럼이 항상 유효한 값을 가리킴
+        for filename, values in ((CHANNEL_DICT_FILE, self._new_channels), (GRADE_DICT_FILE, self._new_grades),
+                                 (KEYWORDS_DICT_FILE, self._new_keyword_versions)):
+            if values:
+                with open(os.path.join(self.segment_dir, filename), "a", encoding="utf-8") as f:
+                    f.write("".join(f"{value}\n" for value in values))
+                values.clear()
+
+        with open(os.path.join(self.segment_dir, TEXT_FILE), "ab") as f:
+            f.write(self._text)
+        self.text_size += len(self._text)
+        self._text = bytearray()
+
+        with open(os.path.join(self.segment_dir, VIDEO_ID_FILE), "ab") as f:
+            f.write(self._video_ids)
+        self._video_ids = bytearray()
+
+        for name, typecode in COLUMNS:
+            with open(_column_path(self.segment_dir, name), "ab") as f:
+                self._buffers[name].tofile(f)
+            self._buffers[name] = array(typecode)
+
+        self.rows += self.pending
+        self.pending = 0
+
+
+class EvaluationArchive:
+    """
+    평가 결과의 컬럼형 추가 전용 아카이브
+
+    세그먼트는 프로세스별로 분리되므로 여러 워커가 같은 디렉터리에 안전하게 기록할 수 있으며,
+    같은 프로세스 안에서는 잠금으로 추가와 디스크 기록(다른 스레드의 flush)을 직렬화합니다.
+    """
+
+    def __init__(self, root: str, segment_rows: int = 1_000_000, flush_rows: int = 64):
+        self.root = root
+        self.segment_rows = segment_rows
+        self.flush_rows = flush_rows
+        self._writer: Optional[SegmentWriter] = None
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _new_segment_dir(self) -> str:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+        return os.path.join(self.root, f"{SEGMENT_PREFIX}{stamp}-{os.getpid()}")
+
+    def append(self, evaluation: Evaluation, timestamp: Optional[float] = None, keyword_version: str = "") -> None:
+        """평가 결과를 아카이브에 추가합니다."""
+        with self._lock:
+            if self._writer is None or self._writer.rows + self._writer.pending >= self.segment_rows:
+                if self._writer is not None:
+                    self._writer.flush()
+                self._writer = SegmentWriter(self._new_segment_dir())
+                logger.info(f"[ARCHIVE] 새 세그먼트 생성: {self._writer.segment_dir}")
+
+            self._writer.append(evaluation, timestamp, keyword_version)
+            if self._writer.pending >= self.flush_rows:
+                self._writer.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+
+    def reader(self) -> "ArchiveReader":
+        return ArchiveReader(self.root)
+
+
+class Segment:
+    """메모리 매핑된 읽기 전용 세그먼트"""
+
+    def __init__(self, segment_dir: str):
+        self.segment_dir = segment_dir
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._views: Dict[str, memoryview] = {}
+
+        with open(os.path.join(segment_dir, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"[ARCHIVE] 바이트 순서가 다른 세그먼트입니다: {segment_dir}")
+        self.columns = {name: typecode for name, typecode in meta["columns"]}
+
+        # 기록 중인 세그먼트는 컬럼 길이가 다를 수 있으므로 가장 짧은 길이를 기준으로 함
+        counts = []
+        for name, typecode in self.columns.items():
+            path = _column_path(segment_dir, name)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            counts.append(size // array(typecode).itemsize)
+        self.rows = min(counts) if counts else 0
+
+        self.channels = self._read_dict(CHANNEL_DICT_FILE)
+        self.grades = self._read_dict(GRADE_DICT_FILE)
+        # 이전 형식의 세그먼트에는 키워드 설정 지문이 없음
+        self.keyword_versions = self._read_dict(KEYWORDS_DICT_FILE)
+
+    def _read_dict(self, filename: str) -> List[str]:
+        path = os.path.join(self.segment_dir, filename)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f]
+
+    def _map(self, filename: str) -> Optional[mmap.mmap]:
+        if filename not in self._maps:
+            path = os.path.join(self.segment_dir, filename)
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                return None
+            with open(path, "rb") as f:
+                self._maps[filename] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[filename]
+
+    def column(self, name: str) -> memoryview:
+        """컬럼을 복사 없이 타입이 지정된 memoryview로 반환합니다."""
+        if name in self._views:
+            return self._views[name]
+        typecode = self.columns.get(name)
+        if typecode is None:
+            raise KeyError(f"[ARCHIVE] 알 수 없는 컬럼입니다: {name}")
+        mapped = self._map(f"{name}.col")
+        if mapped is None or self.rows == 0:
+            return memoryview(array(typecode))
+        view = memoryview(mapped)[:self.rows * array(typecode).itemsize].cast(typecode)
+        self._views[name] = view
+        return view
+
+    def video_id(self, row: int) -> str:
+        mapped = self._map(VIDEO_ID_FILE)
+        start = row * VIDEO_ID_WIDTH
+        return mapped[start:start + VIDEO_ID_WIDTH].rstrip(b"\0").decode("utf-8")
+
+    def text(self, row: int) -> Tuple[str, str]:
+        """행의 제목과 설명을 반환합니다."""
+        offset = self.column("text_offset")[row]
+        title_length = self.column("title_length")[row]
+        description_length = self.column("description_length")[row]
+        mapped = self._map(TEXT_FILE)
+        if mapped is None:
+            return "", ""
+        title = mapped[offset:offset + title_length].decode("utf-8")
+        description = mapped[offset + title_length:offset + title_length + description_length].decode("utf-8")
+        return title, description
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+
+
+class ArchiveReader:
+    """아카이브 전체 세그먼트에 대한 스캔 및 집계"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.segments: List[Segment] = []
+        if os.path.isdir(root):
+            for name in sorted(os.listdir(root)):
+                path = os.path.join(root, name)
+                if name.startswith(SEGMENT_PREFIX) and os.path.exists(os.path.join(path, META_FILE)):
+                    self.segments.append(Segment(path))
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for segment in self.segments:
+            segment.close()
+
+    @property
+    def rows(self) -> int:
+        return sum(segment.rows for segment in self.segments)
+
+    def scan(self, *columns: str) -> Iterator[Tuple[Segment, Dict[str, memoryview]]]:
+        """세그먼트별로 요청한 컬럼의 memoryview를 반환합니다."""
+        for segment in self.segments:
+            if segment.rows:
+                yield segment, {name: segment.column(name) for name in columns}
+
+    def grade_histogram(self) -> Dict[str, int]:
+        """등급별 평가 건수"""
+        histogram: Counter = Counter()
+        for segment, columns in self.scan("grade"):
+            for index, count in Counter(columns["grade"]).items():
+                histogram[segment.grades[index]] += count
+        return dict(histogram)
+
+    def score_summary(self, column: str = "final_score") -> Dict[str, float]:
+        """점수 컬럼의 건수, 평균, 최솟값, 최댓값"""
+        count, total = 0, 0.0
+        low, high = None, None
+        for _, columns in self.scan(column):
+            values = columns[column]
+            count += len(values)
+            total += sum(values)
+            low = min(values) if low is None else min(low, min(values))
+            high = max(values) if high is None else max(high, max(values))
+        return {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "min": low or 0.0,
+            "max": high or 0.0
+        }
+
+    def channel_means(self, column: str = "final_score") -> Dict[str, Tuple[float, int]]:
+        """채널별 (평균 점수, 평가 건수)"""
+        sums: Dict[str, float] = {}
+        counts: Counter = Counter()
+        for segment, columns in self.scan("channel", column):
+            for index, value in zip(columns["channel"], columns[column]):
+                channel_id = segment.channels[index]
+                sums[channel_id] = sums.get(channel_id, 0.0) + value
+                counts[channel_id] += 1
+        return {channel_id: (sums[channel_id] / counts[channel_id], counts[channel_id]) for channel_id in sums}
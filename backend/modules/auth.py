@@ -0,0 +1,131 @@
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import logging
+import threading
+import time
+from passlib.context import CryptContext
+from . import codec
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정
+USERS_KEY = "auth:users"
+
+# 비밀번호 해싱
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasher:
+    """bcrypt 해싱/검증을 크기가 제한된 스레드 풀에서 실행하여 이벤트 루프를 막지 않습니다."""
+
+    def __init__(self, max_workers: int = 2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, pwd_context.verify, password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, pwd_context.hash, password)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+
+class TokenCache:
+    """검증된 JWT 클레임을 토큰 만료 시각까지 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return claims
+
+    def set(self, token: str, claims: Dict) -> None:
+        expires_at = claims.get("exp")
+        if expires_at is None:
+            return
+        with self._lock:
+            self._entries[token] = (claims, float(expires_at))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class UserStore:
+    """
+    Redis 해시 기반 사용자 저장소
+
+    존재하는 사용자 정보는 처음 조회할 때 Redis에서 읽어 cache_ttl 동안 최근 max_entries명만
+    프로세스 내에 보관하며(LRU), 존재하지 않는 사용자는 캐시하지 않습니다.
+    기본 관리자 계정도 첫 조회 시점에 생성합니다.
+    """
+
+    def __init__(self, redis_client, hasher: PasswordHasher, default_admin_password: str, cache_ttl: float = 60.0,
+                 max_entries: int = 1024):
+        self.redis = redis_client
+        self.hasher = hasher
+        self.default_admin_password = default_admin_password
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._seeded = False
+        self._seed_lock: Optional[asyncio.Lock] = None
+
+    async def _seed_default_admin(self) -> None:
+        """기본 관리자 계정이 없으면 생성합니다."""
+        if self._seeded:
+            return
+        if self._seed_lock is None:
+            self._seed_lock = asyncio.Lock()
+        async with self._seed_lock:
+            if self._seeded:
+                return
+            if self.redis.hget(USERS_KEY, "admin") is None:
+                admin = {
+                    "username": "admin",
+                    "email": "admin@example.com",
+                    "full_name": "Administrator",
+                    "disabled": False,
+                    "role": "admin",
+                    "hashed_password": await self.hasher.hash(self.default_admin_password)
+                }
+                self.redis.hset(USERS_KEY, "admin", codec.dumps(admin))
+                logger.info("[AUTH] 기본 관리자 계정을 생성했습니다.")
+            self._seeded = True
+
+    async def get(self, username: str) -> Optional[Dict]:
+        """사용자 조회"""
+        cached = self._cache.get(username)
+        if cached is not None:
+            if cached[1] > time.monotonic():
+                self._cache.move_to_end(username)
+                return cached[0]
+            del self._cache[username]
+
+        await self._seed_default_admin()
+        data = self.redis.hget(USERS_KEY, username)
+        if data is None:
+            return None
+        user = codec.loads(data)
+        self._cache[username] = (user, time.monotonic() + self.cache_ttl)
+        self._cache.move_to_end(username)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return user
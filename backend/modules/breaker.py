@@ -0,0 +1,112 @@
+from typing import Callable, Dict, Optional
+import logging
+import threading
+import time
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 외부 호출을 차단한 경우"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 서비스가 일시적으로 차단되었습니다. {retry_after:.0f}초 후 다시 시도해주세요.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    외부 서비스 호출용 서킷 브레이커
+
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    - open: recovery_timeout 동안 호출하지 않고 즉시 CircuitOpenError 발생
+    - half_open: 최대 half_open_max_calls개의 시험 호출만 허용하고,
+      성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, is_failure: Optional[Callable[[Exception], bool]] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure or (lambda e: True)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        """회로가 다시 시험 호출을 허용하기까지 남은 시간(초)"""
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    def _acquire(self) -> bool:
+        """호출 허용 여부를 확인하고, 시험 호출이면 True를 반환합니다."""
+        with self._lock:
+            if self.state == OPEN:
+                if self.retry_after() > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, self.retry_after())
+                self.state = HALF_OPEN
+                self._probes = 0
+                logger.info(f"[BREAKER] {self.name} 시험 호출 허용 (half-open)")
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, self.recovery_timeout)
+                self._probes += 1
+                return True
+            return False
+
+    def _on_success(self, probe: bool) -> None:
+        with self._lock:
+            if probe:
+                self._probes -= 1
+                if self.state == HALF_OPEN:
+                    logger.info(f"[BREAKER] {self.name} 회로 복구 (closed)")
+                    self.state = CLOSED
+            self.failures = 0
+
+    def _on_failure(self, probe: bool, error: Exception) -> None:
+        with self._lock:
+            if probe:
+                self._probes -= 1
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(f"[BREAKER] {self.name} 회로 차단 (open): {str(error)}")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def call(self, func: Callable, *args, **kwargs):
+        """회로 상태를 확인한 뒤 함수를 호출합니다."""
+        probe = self._acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            # 서비스 장애가 아닌 오류(예: 존재하지 않는 비디오)는 정상 응답으로 취급
+            if self.is_failure(e):
+                self._on_failure(probe, e)
+            else:
+                self._on_success(probe)
+            raise
+        self._on_success(probe)
+        return result
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_after": round(self.retry_after(), 1) if self.state == OPEN else 0,
+            "rejected": self.rejected
+        }
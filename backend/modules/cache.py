@@ -0,0 +1,290 @@
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import threading
+import time
+from . import codec
+from .records import VideoInfo
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정 (해시 태그로 같은 비디오의 키를 같은 샤드에 저장)
+VIDEO_KEY = "video:{{{video_id}}}"
+
+
+def video_key(video_id: str) -> str:
+    return VIDEO_KEY.format(video_id=video_id)
+
+
+@dataclass(slots=True)
+class CachedVideo:
+    """캐시된 비디오 정보와 데이터 버전"""
+    video: VideoInfo
+    version: str
+    fetched_at: float
+    expires_at: float
+
+    def remaining_ttl(self, now: Optional[float] = None) -> int:
+        return max(0, int(self.expires_at - (now or time.time())))
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        return self.expires_at <= (now or time.time())
+
+    def age(self, now: Optional[float] = None) -> int:
+        return max(0, int((now or time.time()) - self.fetched_at))
+
+
+def data_version(data: Dict) -> str:
+    """비디오 데이터의 내용 해시"""
+    return hashlib.blake2b(codec.serializer.dumps(data), digest_size=8).hexdigest()
+
+
+class VideoCache:
+    """
+    비디오 정보 캐시
+
+    프로세스 내 LRU와 Redis(TTL)를 함께 사용하며, 각 항목에는 내용 해시로 계산한
+    데이터 버전이 함께 저장되어 HTTP ETag 계산에 사용됩니다.
+    만료된 항목도 stale_ttl 동안 보관하여 YouTube API 장애 시 대체 응답에 사용합니다.
+    """
+
+    def __init__(self, redis_client, ttl: int = 600, local_size: int = 2048, stale_ttl: int = 86400):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.local_size = local_size
+        self._entries: "OrderedDict[str, CachedVideo]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def _remember(self, entry: CachedVideo) -> None:
+        with self._lock:
+            video_id = entry.video.video_id
+            self._entries[video_id] = entry
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.local_size:
+                self._entries.popitem(last=False)
+
+    def get(self, video_id: str, allow_stale: bool = False) -> Optional[CachedVideo]:
+        """
+        캐시된 비디오 정보 조회
+        
+        Args:
+            video_id (str): 비디오 ID
+            allow_stale (bool): 만료 후 stale_ttl 이내의 항목도 반환할지 여부
+        """
+        now = time.time()
+        # 반환 가능한 항목의 최소 만료 시각
+        cutoff = now - self.stale_ttl if allow_stale else now
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is not None:
+                if entry.expires_at > cutoff:
+                    self._entries.move_to_end(video_id)
+                    self._count_hit(entry, now, local=True)
+                    return entry
+                if entry.expires_at + self.stale_ttl <= now:
+                    del self._entries[video_id]
+
+        try:
+            cached = self.redis.get(video_key(video_id))
+        except Exception as e:
+            logger.warning(f"[CACHE] 비디오 캐시 조회 실패: {str(e)}")
+            cached = None
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        data = codec.loads(cached)
+        entry = CachedVideo(
+            video=VideoInfo.from_dict(data["video"]),
+            version=data["version"],
+            fetched_at=data["fetched_at"],
+            expires_at=data["fetched_at"] + self.ttl
+        )
+        if entry.expires_at <= cutoff:
+            self.misses += 1
+            return None
+        self._remember(entry)
+        self._count_hit(entry, now, local=False)
+        return entry
+
+    def get_many(self, video_ids: List[str]) -> Dict[str, CachedVideo]:
+        """여러 비디오 정보를 조회합니다. 프로세스 내 LRU에 없는 항목은 한 번의 파이프라인으로 조회합니다."""
+        now = time.time()
+        found: Dict[str, CachedVideo] = {}
+        missing: List[str] = []
+        with self._lock:
+            for video_id in video_ids:
+                entry = self._entries.get(video_id)
+                if entry is not None and entry.expires_at > now:
+                    self._entries.move_to_end(video_id)
+                    self.local_hits += 1
+                    found[video_id] = entry
+                else:
+                    missing.append(video_id)
+        if not missing:
+            return found
+
+        try:
+            pipe = self.redis.pipeline()
+            for video_id in missing:
+                pipe.get(video_key(video_id))
+            results = pipe.execute()
+        except Exception as e:
+            logger.warning(f"[CACHE] 비디오 캐시 일괄 조회 실패: {str(e)}")
+            results = [None] * len(missing)
+
+        for video_id, cached in zip(missing, results):
+            data = codec.loads(cached) if cached is not None else None
+            if data is None or data["fetched_at"] + self.ttl <= now:
+                self.misses += 1
+                continue
+            entry = CachedVideo(
+                video=VideoInfo.from_dict(data["video"]),
+                version=data["version"],
+                fetched_at=data["fetched_at"],
+                expires_at=data["fetched_at"] + self.ttl
+            )
+            self._remember(entry)
+            self.remote_hits += 1
+            found[video_id] = entry
+        return found
+
+    def _count_hit(self, entry: CachedVideo, now: float, local: bool) -> None:
+        if entry.is_stale(now):
+            self.stale_hits += 1
+        elif local:
+            self.local_hits += 1
+        else:
+            self.remote_hits += 1
+
+    def put(self, video: VideoInfo) -> CachedVideo:
+        """새로 조회한 비디오 정보를 캐시에 저장합니다."""
+        data = video.to_dict()
+        now = time.time()
+        entry = CachedVideo(video=video, version=data_version(data), fetched_at=now, expires_at=now + self.ttl)
+        self._remember(entry)
+        try:
+            self.redis.setex(
+                video_key(video.video_id),
+                self.ttl + self.stale_ttl,
+                codec.dumps({"video": data, "version": entry.version, "fetched_at": now})
+            )
+        except Exception as e:
+            logger.warning(f"[CACHE] 비디오 캐시 저장 실패: {str(e)}")
+        return entry
+
+    def export_entries(self) -> List[List]:
+        """스냅샷용 프로세스 내 LRU 항목 (오래 사용하지 않은 항목부터)"""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [[entry.video.to_dict(), entry.version, entry.fetched_at] for entry in entries]
+
+    def load_entries(self, entries: List[List]) -> int:
+        """스냅샷 항목을 프로세스 내 LRU에 채웁니다. stale_ttl까지 지난 항목과 이미 더 새로운 항목이 있는 비디오는 건너뜁니다."""
+        now = time.time()
+        loaded = 0
+        for data, version, fetched_at in entries:
+            expires_at = fetched_at + self.ttl
+            if expires_at + self.stale_ttl <= now:
+                continue
+            current = self._entries.get(data["video_id"])
+            if current is not None and current.fetched_at >= fetched_at:
+                continue
+            self._remember(CachedVideo(
+                video=VideoInfo.from_dict(data), version=version, fetched_at=fetched_at, expires_at=expires_at
+            ))
+            loaded += 1
+        return loaded
+
+    def stats(self) -> Dict:
+        lookups = self.local_hits + self.remote_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.local_size,
+            "ttl": self.ttl,
+            "local_hits": self.local_hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "hit_rate": (self.local_hits + self.remote_hits) / lookups if lookups else 0.0
+        }
+
+
+# (채널 개설 후 일수, 구독자 수, 동영상 수)
+ChannelStats = Tuple[int, int, int]
+
+
+class ChannelCache:
+    """
+    채널 통계 프로세스 내 캐시
+
+    채널 통계는 비디오 통계보다 천천히 바뀌므로 ttl 동안 같은 채널의 비디오를 조회할 때
+    channels.list를 다시 호출하지 않습니다.
+    """
+
+    def __init__(self, ttl: int = 21600, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[ChannelStats, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, channel_id: str, stats: ChannelStats, expires_at: float) -> None:
+        with self._lock:
+            self._entries[channel_id] = (stats, expires_at)
+            self._entries.move_to_end(channel_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, channel_id: str) -> Optional[ChannelStats]:
+        with self._lock:
+            entry = self._entries.get(channel_id)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(channel_id)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[channel_id]
+        self.misses += 1
+        return None
+
+    def put(self, channel_id: str, stats: ChannelStats) -> None:
+        self._remember(channel_id, stats, time.time() + self.ttl)
+
+    def export_entries(self) -> List[List]:
+        """스냅샷용 항목 (오래 사용하지 않은 항목부터)"""
+        with self._lock:
+            return [[channel_id, list(stats), expires_at] for channel_id, (stats, expires_at) in self._entries.items()]
+
+    def load_entries(self, entries: List[List]) -> int:
+        """만료되지 않은 스냅샷 항목을 채웁니다."""
+        now = time.time()
+        loaded = 0
+        for channel_id, stats, expires_at in entries:
+            if expires_at <= now or channel_id in self._entries:
+                continue
+            self._remember(channel_id, tuple(stats), expires_at)
+            loaded += 1
+        return loaded
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
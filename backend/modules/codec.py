@@ -0,0 +1,125 @@
+from typing import Any, Callable, Dict, Tuple, Union
+import json
+import logging
+import os
+import zlib
+
+try:
+    import msgpack
+except ImportError:  # msgpack이 없으면 JSON 코덱만 사용
+    msgpack = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 헤더 형식: MAGIC(1) + 형식 버전(1) + 코덱 ID(1) + 플래그(1)
+# 기존 JSON 값은 0xFF로 시작할 수 없으므로 헤더 유무로 구분할 수 있음
+MAGIC = 0xFF
+FORMAT_VERSION = 1
+HEADER_SIZE = 4
+
+FLAG_ZLIB = 0x01
+
+CODEC_JSON = ord("j")
+CODEC_MSGPACK = ord("m")
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+# 코덱 ID -> (직렬화 함수, 역직렬화 함수)
+CODECS: Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    CODEC_JSON: (_json_dumps, _json_loads),
+}
+CODEC_NAMES: Dict[str, int] = {"json": CODEC_JSON}
+
+if msgpack is not None:
+    CODECS[CODEC_MSGPACK] = (
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False)
+    )
+    CODEC_NAMES["msgpack"] = CODEC_MSGPACK
+
+
+def register_codec(name: str, codec_id: int, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]) -> None:
+    """새 코덱을 등록합니다."""
+    if codec_id in CODECS and CODEC_NAMES.get(name) != codec_id:
+        raise ValueError(f"[CODEC] 이미 사용 중인 코덱 ID입니다: {codec_id}")
+    CODECS[codec_id] = (dumps, loads)
+    CODEC_NAMES[name] = codec_id
+
+
+class Serializer:
+    """
+    Redis 값 직렬화기
+
+    모든 값에 버전 헤더를 붙여 저장하며, 읽을 때는 헤더의 코덱 ID를 보고 역직렬화하므로
+    코덱을 변경해도 기존 값을 그대로 읽을 수 있습니다. 헤더가 없는 값은 기존 JSON으로 처리합니다.
+    """
+
+    def __init__(self, codec: str = "msgpack", compress_threshold: int = 1024, compress_level: int = 6):
+        if codec not in CODEC_NAMES:
+            logger.warning(f"[CODEC] 사용할 수 없는 코덱입니다: {codec}. JSON 코덱을 사용합니다.")
+            codec = "json"
+        self.codec_id = CODEC_NAMES[codec]
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def dumps(self, value: Any) -> bytes:
+        """값을 헤더가 포함된 바이트로 직렬화합니다."""
+        payload = CODECS[self.codec_id][0](value)
+        flags = 0
+        if self.compress_threshold and len(payload) >= self.compress_threshold:
+            compressed = zlib.compress(payload, self.compress_level)
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= FLAG_ZLIB
+        return bytes((MAGIC, FORMAT_VERSION, self.codec_id, flags)) + payload
+
+    def loads(self, data: Union[bytes, str, None]) -> Any:
+        """직렬화된 값을 복원합니다."""
+        if data is None:
+            return None
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data or data[0] != MAGIC:
+            return json.loads(data)
+
+        version, codec_id, flags = data[1], data[2], data[3]
+        if version > FORMAT_VERSION:
+            raise ValueError(f"[CODEC] 지원하지 않는 형식 버전입니다: {version}")
+        if codec_id not in CODECS:
+            raise ValueError(f"[CODEC] 알 수 없는 코덱입니다: {codec_id}")
+
+        payload = memoryview(data)[HEADER_SIZE:]
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return CODECS[codec_id][1](bytes(payload))
+
+
+# 기본 직렬화기
+serializer = Serializer(
+    codec=os.getenv("REDIS_CODEC", "msgpack"),
+    compress_threshold=int(os.getenv("REDIS_COMPRESS_THRESHOLD", 1024))
+)
+
+
+def dumps(value: Any) -> bytes:
+    return serializer.dumps(value)
+
+
+def loads(data: Union[bytes, str, None]) -> Any:
+    return serializer.loads(data)
+
+
+def to_text(value: Union[bytes, str, None]) -> Union[str, None]:
+    """Redis에서 읽은 키/필드 값을 문자열로 변환합니다."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
@@ -0,0 +1,152 @@
+from typing import Dict, Optional
+import logging
+import math
+import time
+from . import codec
+from .tokenizer import TextIndex
+from .youtube import CommentsDisabledError
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정 (분석 결과는 키워드 설정에 따라 달라지므로 키워드 지문 포함)
+COMMENT_KEY = "comments:{{{video_id}}}:{keyword_version}"
+
+# 키워드 분류별 댓글 비율의 점수 가중치 (비율 1.0당 점수 변화량 / 100)
+COMMENT_WEIGHTS = {
+    'suspicious': -1.5,
+    'clickbait': -1.5,
+    'emotional': -0.5,
+    'professional': 0.5,
+    'required': 0.5
+}
+
+
+def comment_score(rates: Dict[str, float]) -> float:
+    """키워드 분류별 댓글 비율로 계산한 댓글 신뢰도 (0~100)"""
+    score = 100.0 + sum(weight * rates.get(category, 0.0) * 100 for category, weight in COMMENT_WEIGHTS.items())
+    return max(0.0, min(100.0, score))
+
+
+def score_error(rates: Dict[str, float], sampled: int) -> float:
+    """표본 비율의 표준 오차로 추정한 댓글 신뢰도의 표준 오차"""
+    if sampled == 0:
+        return math.inf
+    variance = sum(
+        (weight * 100) ** 2 * rates.get(category, 0.0) * (1 - rates.get(category, 0.0)) / sampled
+        for category, weight in COMMENT_WEIGHTS.items()
+    )
+    return math.sqrt(variance)
+
+
+class CommentAnalyzer:
+    """
+    댓글 키워드 분석
+
+    commentThreads를 페이지 단위로 필요할 때만 조회하면서 설명 분석과 같은 키워드 분류로
+    댓글마다 분류 포함 여부를 집계합니다. 댓글 수/할당량(페이지 수)/시간 예산 중 하나를
+    소진하거나, min_comments개 이상 분석한 뒤 점수의 표준 오차가 tolerance 이하로 수렴하면
+    조회를 멈춥니다. 결과는 비디오별로 ttl 동안 캐시합니다.
+    """
+
+    def __init__(self, youtube_api, redis_client, max_comments: int = 300, max_pages: int = 3,
+                 time_budget: float = 2.0, min_comments: int = 50, tolerance: float = 3.0, ttl: int = 21600):
+        self.youtube = youtube_api
+        self.redis = redis_client
+        self.max_comments = max_comments
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.min_comments = min_comments
+        self.tolerance = tolerance
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.quota_used = 0
+
+    def get(self, video_id: str, evaluator) -> Dict:
+        """캐시된 분석 결과를 반환하고, 없으면 분석합니다."""
+        key = COMMENT_KEY.format(video_id=video_id, keyword_version=evaluator.keyword_version)
+        try:
+            cached = self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"[COMMENTS] 댓글 분석 캐시 조회 실패: {str(e)}")
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            return codec.loads(cached)
+
+        self.misses += 1
+        result = self.analyze(video_id, evaluator)
+        try:
+            self.redis.setex(key, self.ttl, codec.dumps(result))
+        except Exception as e:
+            logger.warning(f"[COMMENTS] 댓글 분석 캐시 저장 실패: {str(e)}")
+        return result
+
+    def analyze(self, video_id: str, evaluator) -> Dict:
+        """예산 안에서 댓글을 분석합니다 (회로가 열려 있으면 CircuitOpenError 발생)."""
+        started = time.monotonic()
+        counts = {category: 0 for category in evaluator.keyword_keys}
+        sampled = pages = 0
+        rates: Dict[str, float] = {}
+        stop_reason = "exhausted"
+
+        page_iter = self.youtube.comment_pages(video_id, page_size=min(100, self.max_comments))
+        while True:
+            if sampled >= self.max_comments:
+                stop_reason = "count"
+                break
+            if pages >= self.max_pages:
+                stop_reason = "quota"
+                break
+            if time.monotonic() - started >= self.time_budget:
+                stop_reason = "time"
+                break
+            try:
+                comments = next(page_iter)
+            except StopIteration:
+                break
+            except CommentsDisabledError:
+                stop_reason = "disabled"
+                break
+            pages += 1
+
+            # 페이지마다 증분 집계
+            for text in comments[:self.max_comments - sampled]:
+                for category in evaluator.matched_categories(TextIndex(text)):
+                    counts[category] += 1
+                sampled += 1
+            rates = {category: count / sampled for category, count in counts.items()} if sampled else {}
+
+            if sampled >= self.min_comments and score_error(rates, sampled) <= self.tolerance:
+                stop_reason = "converged"
+                break
+        page_iter.close()
+        self.quota_used += pages
+
+        result = {
+            "video_id": video_id,
+            "score": comment_score(rates) if sampled else None,
+            "standard_error": score_error(rates, sampled) if sampled else None,
+            "sampled": sampled,
+            "pages": pages,
+            "quota_used": pages,
+            "rates": rates,
+            "stop_reason": stop_reason,
+            "keyword_version": evaluator.keyword_version,
+            "elapsed": time.monotonic() - started,
+            "analyzed_at": time.time()
+        }
+        logger.info(f"[COMMENTS] 댓글 분석 완료: {video_id} ({sampled}개, {pages}페이지, {stop_reason})")
+        return result
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "quota_used": self.quota_used,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,148 @@
+from typing import List, Optional
+import gzip
+import logging
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 압축하지 않는 콘텐츠 유형 (스트리밍 응답)
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+# 지원하는 인코딩 (ETag 접미사로도 사용)
+ENCODINGS = ("br", "gzip")
+
+
+def encoded_etag(etag: bytes, encoding: str) -> bytes:
+    """압축된 표현의 ETag: 강한 ETag를 유지하고 닫는 따옴표 앞에 인코딩을 붙임 ("v-1" → "v-1-gzip")"""
+    if not etag.endswith(b'"'):
+        return etag
+    return etag[:-1] + b"-" + encoding.encode("latin-1") + b'"'
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    """encoded_etag로 붙인 인코딩 접미사를 제거합니다."""
+    for encoding in ENCODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def _accepted_encodings(header: str) -> List[str]:
+    """Accept-Encoding 헤더에서 q=0이 아닌 인코딩 목록"""
+    encodings = []
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        encodings.append(name.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    일정 크기 이상의 응답 본문을 brotli 또는 gzip으로 압축하는 ASGI 미들웨어
+
+    한 번에 전송되는 응답만 압축하며, 스트리밍 응답은 그대로 전달합니다.
+    압축된 응답의 ETag에는 인코딩 접미사를 붙이고, 클라이언트가 그 ETag로 검증한 304 응답에도
+    같은 ETag를 돌려줍니다.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose_encoding(self, scope) -> Optional[str]:
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accepted = _accepted_encodings(value.decode("latin-1"))
+                if brotli is not None and "br" in accepted:
+                    return "br"
+                if "gzip" in accepted:
+                    return "gzip"
+        return None
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    def _not_modified(self, scope, message, etag: Optional[bytes]):
+        """클라이언트가 압축된 표현의 ETag로 검증했다면 304 응답의 ETag도 같은 값으로 변경"""
+        if etag is None:
+            return message
+        if_none_match = b",".join(value for name, value in scope.get("headers", []) if name == b"if-none-match")
+        candidates = [candidate.strip() for candidate in if_none_match.split(b",")]
+        candidates = [candidate[2:] if candidate.startswith(b"W/") else candidate for candidate in candidates]
+        for encoding in ENCODINGS:
+            tagged = encoded_etag(etag, encoding)
+            if tagged != etag and tagged in candidates:
+                message["headers"] = [
+                    (name, tagged if name.lower() == b"etag" else value) for name, value in message.get("headers", [])
+                ]
+                break
+        return message
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        encoding = self._choose_encoding(scope)
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                return await send(message)
+
+            if message["type"] == "http.response.start":
+                headers = dict((name.lower(), value) for name, value in message.get("headers", []))
+                if message["status"] == 304:
+                    passthrough = True
+                    return await send(self._not_modified(scope, message, headers.get(b"etag")))
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                if b"content-encoding" in headers or content_type.startswith(UNCOMPRESSED_TYPES):
+                    passthrough = True
+                    return await send(message)
+                start_message = message
+                return
+
+            if message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                # 스트리밍 응답이거나 작은 응답은 압축하지 않음
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    return await send(message)
+
+                compressed = self._compress(encoding, body)
+                headers = [
+                    (name, value) for name, value in start_message.get("headers", [])
+                    if name.lower() not in (b"content-length", b"etag")
+                ]
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+                headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+                headers.append((b"vary", b"Accept-Encoding"))
+                # 압축된 표현은 바이트가 다르므로 인코딩별로 다른 강한 ETag 사용
+                for name, value in start_message.get("headers", []):
+                    if name.lower() == b"etag":
+                        headers.append((b"etag", encoded_etag(value, encoding)))
+                start_message["headers"] = headers
+                await send(start_message)
+                return await send({"type": "http.response.body", "body": compressed})
+
+            return await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,162 @@
+from typing import Dict, List, NamedTuple, Optional
+from collections import Counter
+import hashlib
+import logging
+import struct
+from . import codec
+from .records import ContentTrust
+from .tokenizer import tokenize
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정 (서명 방식이 바뀌면 버전을 올려 이전 서명과 섞이지 않도록 함)
+SIGNATURE_KEY = "dup:v2:sig:{{{video_id}}}"
+BAND_KEY = "dup:v2:band:{band}:{digest}"
+
+# 단어 단위 shingle 길이
+SHINGLE_SIZE = 3
+
+_MASK64 = (1 << 64) - 1
+# 빈 구간을 채울 때 빌려온 거리만큼 더하는 값 (64비트 황금비 상수)
+_ROTATION = 0x9E3779B97F4A7C15
+
+
+def shingles(title: str, description: str, size: int = SHINGLE_SIZE) -> set:
+    """제목과 설명을 이은 텍스트의 단어 size-gram 집합 (토큰이 size개보다 적으면 토큰 집합)"""
+    tokens = tokenize(f"{title}\n{description}")
+    if len(tokens) < size:
+        return set(tokens)
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class DuplicateMatch(NamedTuple):
+    video_id: str
+    similarity: float
+    keyword_version: str
+    content: ContentTrust
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH 기반 유사 텍스트 색인
+
+    제목+설명의 shingle 집합을 num_perm개 구간의 MinHash 서명(One Permutation Hashing)으로 요약하고, 서명을 bands개의 구간으로
+    나누어 구간 해시별 Redis 집합에 비디오 ID를 저장합니다. 조회할 때는 구간 집합과 후보 서명을
+    각각 파이프라인 한 번으로 읽어 서명 일치 비율(자카드 유사도 추정치)을 계산하므로,
+    색인 크기와 관계없이 왕복 두 번으로 끝납니다.
+    """
+
+    def __init__(self, redis_client, num_perm: int = 64, bands: int = 16, ttl: int = 30 * 86400,
+                 max_candidates: int = 32):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.redis = redis_client
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ttl = ttl
+        self.max_candidates = max_candidates
+        self.reused = 0
+        self.indexed = 0
+        self.misses = 0
+
+    def signature(self, title: str, description: str) -> Optional[List[int]]:
+        """
+        MinHash 서명 (텍스트에 토큰이 없으면 None)
+
+        shingle마다 64비트 해시를 한 번만 계산하여 num_perm개 구간 중 하나에 넣고 구간별 최솟값을
+        취하므로 비용은 shingle 수에만 비례합니다. 빈 구간은 오른쪽으로 가장 가까운 구간의 값을
+        거리만큼 변형하여 채웁니다 (회전 밀집화).
+        """
+        bins: List[Optional[int]] = [None] * self.num_perm
+        for shingle in shingles(title, description):
+            h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            index, value = h % self.num_perm, h // self.num_perm
+            if bins[index] is None or value < bins[index]:
+                bins[index] = value
+        if all(value is None for value in bins):
+            return None
+
+        signature = list(bins)
+        for index, value in enumerate(bins):
+            if value is None:
+                distance = 1
+                while bins[(index + distance) % self.num_perm] is None:
+                    distance += 1
+                signature[index] = (bins[(index + distance) % self.num_perm] + distance * _ROTATION) & _MASK64
+        return signature
+
+    def _band_keys(self, signature: List[int]) -> List[str]:
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(struct.pack(f">{self.rows}Q", *rows), digest_size=8).hexdigest()
+            keys.append(BAND_KEY.format(band=band, digest=digest))
+        return keys
+
+    def similarity(self, a: List[int], b: List[int]) -> float:
+        return sum(1 for x, y in zip(a, b) if x == y) / self.num_perm
+
+    def query(self, signature: List[int], exclude: Optional[str] = None, threshold: float = 0.0) -> List[DuplicateMatch]:
+        """서명과 유사도가 threshold 이상인 비디오 (유사도 내림차순)"""
+        pipe = self.redis.pipeline()
+        for key in self._band_keys(signature):
+            pipe.smembers(key)
+        # 여러 구간에서 함께 등장한 후보일수록 유사할 가능성이 높으므로 우선 확인
+        counts = Counter(codec.to_text(member) for members in pipe.execute() for member in members)
+        counts.pop(exclude, None)
+        candidates = [video_id for video_id, _ in counts.most_common(self.max_candidates)]
+        if not candidates:
+            return []
+
+        pipe = self.redis.pipeline()
+        for video_id in candidates:
+            pipe.get(SIGNATURE_KEY.format(video_id=video_id))
+        matches = []
+        for video_id, data in zip(candidates, pipe.execute()):
+            if data is None:
+                continue
+            entry = codec.loads(data)
+            similarity = self.similarity(signature, entry["signature"])
+            if similarity >= threshold:
+                matches.append(DuplicateMatch(video_id, similarity, entry["keyword_version"], ContentTrust(*entry["content"])))
+        matches.sort(key=lambda match: match.similarity, reverse=True)
+        return matches
+
+    def find_reusable(self, video_id: str, signature: List[int], keyword_version: str,
+                      threshold: float) -> Optional[DuplicateMatch]:
+        """같은 키워드 설정으로 분석된, 유사도가 threshold 이상인 가장 유사한 비디오"""
+        for match in self.query(signature, exclude=video_id, threshold=threshold):
+            if match.keyword_version == keyword_version:
+                self.reused += 1
+                return match
+        self.misses += 1
+        return None
+
+    def add(self, video_id: str, signature: List[int], keyword_version: str, content: ContentTrust) -> None:
+        """분석한 비디오의 서명과 내용 신뢰도를 색인에 추가합니다."""
+        entry = {
+            "signature": signature,
+            "keyword_version": keyword_version,
+            "content": [content.title_score, content.description_score, content.sentiment_score, content.total_score]
+        }
+        pipe = self.redis.pipeline()
+        pipe.setex(SIGNATURE_KEY.format(video_id=video_id), self.ttl, codec.dumps(entry))
+        for key in self._band_keys(signature):
+            pipe.sadd(key, video_id)
+            pipe.expire(key, self.ttl)
+        pipe.execute()
+        self.indexed += 1
+
+    def stats(self) -> Dict:
+        lookups = self.reused + self.misses
+        return {
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "indexed": self.indexed,
+            "reused": self.reused,
+            "misses": self.misses,
+            "reuse_rate": self.reused / lookups if lookups else 0.0
+        }
@@ -1,16 +1,81 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from .trust import TrustAnalyzer
 from .nlp import ContentAnalyzer
 from .scoring import ScoreCalculator
+from .records import VideoInfo, SourceTrust, ContentTrust, Evaluation
+from .memo import keyword_fingerprint
+from .tokenizer import TextIndex, keyword_key
 import logging
 import os
+import copy
 from dotenv import load_dotenv
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 평가기 기본 관리자 설정
+DEFAULT_ADMIN_CONFIG = {
+    "weights": {
+        "source": 0.7,
+        "content": 0.3
+    },
+    "thresholds": {
+        "subscribers": {
+            "high": 1000000,
+            "medium": 100000,
+            "low": 10000
+        },
+        "activity": {
+            "high": 365,
+            "medium": 180,
+            "low": 90
+        }
+    },
+    "keywords": {
+        "required": ["연구", "데이터", "출처", "근거", "확인", "검증", "인용", "참고", "인터뷰", "전문가"],
+        "suspicious": ["확실", "무조건", "100%", "절대", "완벽", "최고", "최초", "최강", "최고급", "최상급"],
+        "clickbait": ["충격", "경악", "폭로", "진실", "비밀", "숨겨진", "알려지지 않은", "깜짝", "놀라운"],
+        "emotional": ["놀랍다", "충격적", "경악", "믿을 수 없다", "믿기지 않는다", "믿기 어렵다"],
+        "professional": ["연구", "데이터", "분석", "조사", "통계", "전문가", "학자", "교수", "박사"]
+    }
+}
+
+# 출처/내용 신뢰도 세부 가중치 (합계 1)
+SOURCE_WEIGHTS = {
+    'subscriber': 0.3,
+    'activity': 0.2,
+    'engagement': 0.5
+}
+CONTENT_WEIGHTS = {
+    'title': 0.2,
+    'description': 0.5,
+    'sentiment': 0.3
+}
+
+def merge_admin_config(admin_config: Dict = None) -> Dict:
+    """
+    관리자 설정을 기본 설정 위에 병합합니다.
+    
+    저장된 관리자 설정에는 일부 키워드 분류만 포함될 수 있으므로
+    누락된 항목은 기본값을 사용합니다.
+    
+    Args:
+        admin_config (Dict): 관리자 설정
+        
+    Returns:
+        Dict: 병합된 설정
+    """
+    merged = copy.deepcopy(DEFAULT_ADMIN_CONFIG)
+    if not admin_config:
+        return merged
+    merged['weights'].update(admin_config.get('weights', {}))
+    for name, values in admin_config.get('thresholds', {}).items():
+        merged['thresholds'].setdefault(name, {}).update(values)
+    merged['keywords'].update(admin_config.get('keywords', {}))
+    return merged
+
 class ContentEvaluator:
     def __init__(self):
         self.trust_analyzer = TrustAnalyzer()
@@ -62,31 +127,15 @@ class Evaluator:
         Args:
             admin_config (Dict): 관리자 설정
         """
-        self.admin_config = admin_config or {
-            "weights": {
-                "source": 0.7,
-                "content": 0.3
-            },
-            "thresholds": {
-                "subscribers": {
-                    "high": 1000000,
-                    "medium": 100000,
-                    "low": 10000
-                },
-                "activity": {
-                    "high": 365,
-                    "medium": 180,
-                    "low": 90
-                }
-            },
-            "keywords": {
-                "required": ["연구", "데이터", "출처", "근거", "확인", "검증", "인용", "참고", "인터뷰", "전문가"],
-                "suspicious": ["확실", "무조건", "100%", "절대", "완벽", "최고", "최초", "최강", "최고급", "최상급"],
-                "clickbait": ["충격", "경악", "폭로", "진실", "비밀", "숨겨진", "알려지지 않은", "깜짝", "놀라운"],
-                "emotional": ["놀랍다", "충격적", "경악", "믿을 수 없다", "믿기지 않는다", "믿기 어렵다"],
-                "professional": ["연구", "데이터", "분석", "조사", "통계", "전문가", "학자", "교수", "박사"]
-            }
+        self.admin_config = merge_admin_config(admin_config)
+        self.keyword_version = keyword_fingerprint(self.admin_config['keywords'])
+        
+        # 키워드를 색인 조회 키로 미리 변환 (중복 키워드는 한 번만 계산)
+        self.keyword_keys = {
+            category: tuple(dict.fromkeys(filter(None, map(keyword_key, words))))
+            for category, words in self.admin_config['keywords'].items()
         }
+        self.score_calculator = ScoreCalculator()
         
         logger.info("평가기가 초기화되었습니다.")
         logger.debug(f"관리자 설정: {self.admin_config}")
@@ -127,6 +176,37 @@ class Evaluator:
             logger.error(f"[SCORING] 종합 점수 계산 중 오류 발생: {str(e)}")
             raise
 
+    def evaluate(self, video: VideoInfo, content: Optional[ContentTrust] = None) -> Evaluation:
+        """
+        비디오를 평가하여 평가 결과 레코드를 반환합니다.
+        
+        Args:
+            video (VideoInfo): 비디오 정보
+            content (ContentTrust): 미리 계산된 내용 신뢰도 (없으면 직접 계산)
+            
+        Returns:
+            Evaluation: 평가 결과
+        """
+        source = self.score_source(video)
+        if content is None:
+            content = self.score_content(video)
+        
+        # 종합 점수 계산 (ScoreCalculator 사용)
+        final_score = self.score_calculator.calculate_score(
+            trust_score=source.total_score,
+            content_score=content.total_score
+        )
+        grade = self.score_calculator.get_grade(final_score)
+        
+        return Evaluation(
+            video=video,
+            source=source,
+            content=content,
+            final_score=final_score,
+            grade=grade,
+            grade_description=self.score_calculator.get_grade_description(grade)
+        )
+
     def evaluate_source_trust(self, video_data: Dict) -> Dict:
         """출처/채널 신뢰도 평가"""
         try:
@@ -138,45 +218,42 @@ class Evaluator:
                 if field not in video_data:
                     raise ValueError(f"[TRUST] 필수 필드가 누락되었습니다: {field}")
             
-            logger.info(f"[TRUST] 출처 신뢰도 평가 시작: {video_data['channel_id']}")
+            return self.score_source(VideoInfo.from_dict(video_data)).to_dict()
+        except ValueError as e:
+            logger.error(f"[TRUST] 입력값 검증 오류: {str(e)}")
+            raise
+
+    def score_source(self, video: VideoInfo) -> SourceTrust:
+        """출처/채널 신뢰도 계산"""
+        try:
+            channel = video.channel
+            logger.info(f"[TRUST] 출처 신뢰도 평가 시작: {channel.channel_id}")
             
             # 각 점수 계산 (0~1점)
-            subscriber_score = self._calculate_subscriber_score(video_data['subscriber_count']) / 100
-            activity_score = self._calculate_activity_score(video_data['channel_age']) / 100
+            subscriber_score = self._calculate_subscriber_score(channel.subscriber_count) / 100
+            activity_score = self._calculate_activity_score(channel.channel_age) / 100
             engagement_score = self._calculate_engagement_score(
-                video_data['likes'],
-                video_data['comments'],
-                video_data['views']
+                video.likes,
+                video.comments,
+                video.views
             ) / 100
             
-            # 가중치 적용
-            source_weights = {
-                'subscriber': 0.3,
-                'activity': 0.2,
-                'engagement': 0.5
-            }
-            
             # 각 점수에 가중치를 곱하고 합산
-            weighted_scores = {
-                'subscriber': subscriber_score * source_weights['subscriber'],
-                'activity': activity_score * source_weights['activity'],
-                'engagement': engagement_score * source_weights['engagement']
-            }
-            
             # 가중치의 합이 1이므로, 합산된 점수는 0~1 범위
-            total_score = sum(weighted_scores.values()) * 100  # 0~100 범위로 변환
+            total_score = (
+                subscriber_score * SOURCE_WEIGHTS['subscriber']
+                + activity_score * SOURCE_WEIGHTS['activity']
+                + engagement_score * SOURCE_WEIGHTS['engagement']
+            ) * 100  # 0~100 범위로 변환
             
             logger.info(f"[TRUST] 출처 신뢰도 평가 완료: {total_score}")
             
-            return {
-                'subscriber_score': subscriber_score,  # 0~1 범위로 변환
-                'activity_score': activity_score,  # 0~1 범위로 변환
-                'engagement_score': engagement_score,  # 0~1 범위로 변환
-                'total_score': total_score  # 0~100 범위로 반환
-            }
-        except ValueError as e:
-            logger.error(f"[TRUST] 입력값 검증 오류: {str(e)}")
-            raise
+            return SourceTrust(
+                subscriber_score=subscriber_score,  # 0~1 범위
+                activity_score=activity_score,  # 0~1 범위
+                engagement_score=engagement_score,  # 0~1 범위
+                total_score=total_score  # 0~100 범위
+            )
         except Exception as e:
             logger.error(f"[TRUST] 출처 신뢰도 평가 중 오류 발생: {str(e)}")
             raise
@@ -192,41 +269,41 @@ class Evaluator:
                 if field not in video_data:
                     raise ValueError(f"[NLP] 필수 필드가 누락되었습니다: {field}")
             
-            logger.info(f"[NLP] 내용 신뢰도 평가 시작: {video_data['video_id']}")
+            return self.score_content(VideoInfo.from_dict(video_data)).to_dict()
+        except ValueError as e:
+            logger.error(f"[NLP] 입력값 검증 오류: {str(e)}")
+            raise
+
+    def score_content(self, video: VideoInfo) -> ContentTrust:
+        """내용 신뢰도 계산"""
+        try:
+            logger.info(f"[NLP] 내용 신뢰도 평가 시작: {video.video_id}")
             
-            # 각 점수 계산 (0~1점)
-            title_score = self._analyze_title(video_data['title']) / 100
-            description_score = self._analyze_description(video_data['description']) / 100
-            sentiment_score = self._analyze_sentiment(video_data['title'], video_data['description']) / 100
+            # 제목/설명은 한 번만 토큰화하여 모든 항목에서 재사용
+            title_index = TextIndex(video.title)
+            description_index = TextIndex(video.description)
             
-            # 가중치 적용
-            content_weights = {
-                'title': 0.2,
-                'description': 0.5,
-                'sentiment': 0.3
-            }
+            # 각 점수 계산 (0~1점)
+            title_score = self._analyze_title(title_index) / 100
+            description_score = self._analyze_description(description_index) / 100
+            sentiment_score = self._analyze_sentiment(title_index, description_index) / 100
             
             # 각 점수에 가중치를 곱하고 합산
-            weighted_scores = {
-                'title': title_score * content_weights['title'],
-                'description': description_score * content_weights['description'],
-                'sentiment': sentiment_score * content_weights['sentiment']
-            }
-            
-            # 가중치의 합이 1이므로, 합산된 점수는 0~100 범위
-            total_score = sum(weighted_scores.values())
+            # 가중치의 합이 1이므로, 합산된 점수는 0~1 범위
+            total_score = (
+                title_score * CONTENT_WEIGHTS['title']
+                + description_score * CONTENT_WEIGHTS['description']
+                + sentiment_score * CONTENT_WEIGHTS['sentiment']
+            ) * 100  # 0~100 범위로 변환
             
             logger.info(f"[NLP] 내용 신뢰도 평가 완료: {total_score}")
             
-            return {
-                'title_score': title_score,  # 0~100 범위로 반환
-                'description_score': description_score,  # 0~100 범위로 반환
-                'sentiment_score': sentiment_score,  # 0~100 범위로 반환
-                'total_score': total_score * 100  # 0~100 범위로 반환
-            }
-        except ValueError as e:
-            logger.error(f"[NLP] 입력값 검증 오류: {str(e)}")
-            raise
+            return ContentTrust(
+                title_score=title_score,  # 0~1 범위
+                description_score=description_score,  # 0~1 범위
+                sentiment_score=sentiment_score,  # 0~1 범위
+                total_score=total_score  # 0~100 범위
+            )
         except Exception as e:
             logger.error(f"[NLP] 내용 신뢰도 평가 중 오류 발생: {str(e)}")
             raise
@@ -272,60 +349,73 @@ class Evaluator:
         else:
             return 20.0
 
-    def _analyze_title(self, title: str) -> float:
+    def matched_categories(self, index: TextIndex) -> List[str]:
+        """색인이 하나 이상의 키워드를 포함하는 키워드 분류 목록"""
+        return [
+            category for category, keys in self.keyword_keys.items()
+            if any(key in index.counts for key in keys)
+        ]
+
+    def _count_keywords(self, category: str, *indexes: TextIndex) -> int:
+        """색인 중 하나라도 포함하는 키워드 분류의 키워드 수"""
+        return sum(
+            1 for key in self.keyword_keys.get(category, ())
+            if any(key in index.counts for index in indexes)
+        )
+
+    def _analyze_title(self, title: TextIndex) -> float:
         """제목 분석 (100점 만점)"""
         score = 100.0
         
         # 클릭베이트 단어 감지 (최대 30점 감점)
-        clickbait_count = sum(1 for word in self.admin_config['keywords']['clickbait'] if word in title)
+        clickbait_count = self._count_keywords('clickbait', title)
         clickbait_penalty = min(30.0, clickbait_count * 20.0)
         score = max(0.0, score - clickbait_penalty)
         
         # 감정적 단어 감지 (최대 20점 감점)
-        emotional_count = sum(1 for word in self.admin_config['keywords']['emotional'] if word in title)
+        emotional_count = self._count_keywords('emotional', title)
         emotional_penalty = min(20.0, emotional_count * 15.0)
         score = max(0.0, score - emotional_penalty)
         
         # 전문성 단어 감지 (최대 20점)
-        professional_count = sum(1 for word in self.admin_config['keywords']['professional'] if word in title)
+        professional_count = self._count_keywords('professional', title)
         professional_bonus = min(20.0, professional_count * 10.0)
         score = min(100.0, score + professional_bonus)
         
         return max(0.0, min(100.0, score))
 
-    def _analyze_description(self, description: str) -> float:
+    def _analyze_description(self, description: TextIndex) -> float:
         """설명 분석 (100점 만점)"""
         score = 100.0
         
         # 필수 단어 확인 (최대 30점)
-        required_count = sum(1 for word in self.admin_config['keywords']['required'] if word in description)
+        required_count = self._count_keywords('required', description)
         required_bonus = min(30.0, required_count * 10.0)
         score = min(100.0, score + required_bonus)
         
         # 의심스러운 단어 감지 (최대 30점 감점)
-        suspicious_count = sum(1 for word in self.admin_config['keywords']['suspicious'] if word in description)
+        suspicious_count = self._count_keywords('suspicious', description)
         suspicious_penalty = min(30.0, suspicious_count * 15.0)
         score = max(0.0, score - suspicious_penalty)
         
         # 전문성 단어 감지 (최대 20점)
-        professional_count = sum(1 for word in self.admin_config['keywords']['professional'] if word in description)
+        professional_count = self._count_keywords('professional', description)
         professional_bonus = min(20.0, professional_count * 5.0)
         score = min(100.0, score + professional_bonus)
         
         return max(0.0, min(100.0, score))
 
-    def _analyze_sentiment(self, title: str, description: str) -> float:
+    def _analyze_sentiment(self, title: TextIndex, description: TextIndex) -> float:
         """감정 분석 (100점 만점)"""
         score = 100.0
-        text = f"{title} {description}"
         
         # 감정적 단어 감지 (최대 30점 감점)
-        emotional_count = sum(1 for word in self.admin_config['keywords']['emotional'] if word in text)
+        emotional_count = self._count_keywords('emotional', title, description)
         emotional_penalty = min(30.0, emotional_count * 10.0)
         score = max(0.0, score - emotional_penalty)
         
         # 의심스러운 단어 감지 (최대 30점 감점)
-        suspicious_count = sum(1 for word in self.admin_config['keywords']['suspicious'] if word in text)
+        suspicious_count = self._count_keywords('suspicious', title, description)
         suspicious_penalty = min(30.0, suspicious_count * 15.0)
         score = max(0.0, score - suspicious_penalty)
         
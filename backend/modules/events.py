@@ -0,0 +1,245 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import OrderedDict
+from uuid import uuid4
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from .records import Evaluation
+from .storage import ShardedRedis
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub 채널 접두어 (토픽별 채널: events:evaluations:<토픽>)
+EVALUATION_CHANNEL = "events:evaluations"
+
+
+def video_topic(video_id: str) -> str:
+    return f"video:{video_id}"
+
+
+def channel_topic(channel_id: str) -> str:
+    return f"channel:{channel_id}"
+
+
+class Subscription:
+    """구독자 한 명의 이벤트 대기열 (느린 구독자는 오래된 이벤트부터 버림)"""
+
+    def __init__(self, topics: Set[str], max_pending: int = 100):
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.dropped = 0
+
+    def push(self, frame: bytes) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+
+class EvaluationBroadcaster:
+    """
+    평가 결과 발행/구독
+
+    평가 결과는 비디오/채널별 Redis pub/sub 채널(events:evaluations:video:<id>,
+    events:evaluations:channel:<id>)로 발행하고, 워커는 자신의 구독자가 있는 토픽의 채널만
+    구독합니다. 발행 전에 구독 중인 워커 수(PUBSUB NUMSUB)를 확인하여 아무도 구독하지 않는
+    비디오는 직렬화하지 않으며, 메시지는 텍스트 헤더(메시지 ID, 비디오/채널 ID, 버전)와
+    JSON 본문으로 구성하여 수신 워커가 본문을 디코딩하지 않고 그대로 SSE 프레임으로 전달합니다.
+    pub/sub을 지원하지 않는 저장소(메모리 DB)에서는 같은 프로세스의 구독자에게만 전달합니다.
+    """
+
+    def __init__(self, redis_client, channel: str = EVALUATION_CHANNEL,
+                 max_subscribers: int = 5000, max_pending: int = 100, max_tracked: int = 10000):
+        if isinstance(redis_client, ShardedRedis):
+            redis_client = redis_client.client_for(channel)
+        self.redis = redis_client
+        self.channel = channel
+        self.max_subscribers = max_subscribers
+        self.max_pending = max_pending
+        self.max_tracked = max_tracked
+        self.remote = hasattr(type(redis_client), "pubsub")
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._topics_lock = threading.Lock()
+        self._subscribers = 0
+        # 비디오 ID -> 마지막으로 발행/수신한 (데이터 버전, 설정 버전), 최근 max_tracked개만 유지
+        self._last_published: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        # 비디오와 채널 토픽을 함께 구독하면 같은 메시지를 두 번 받으므로 최근 메시지 ID로 중복 제거
+        self._recent_messages: "OrderedDict[str, None]" = OrderedDict()
+        # 수신 스레드가 처리할 채널 구독 변경 (("subscribe" | "unsubscribe", 채널 목록))
+        self._changes: "queue.Queue[Tuple[str, List[str]]]" = queue.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._sequence = 0
+        self.published = 0
+        self.skipped = 0
+
+    def topic_channel(self, topic: str) -> str:
+        return f"{self.channel}:{topic}"
+
+    # 발행
+    def publish(self, evaluation: Evaluation, data_version: str, config_version: int, reason: str) -> None:
+        """새 평가 결과를 구독자가 있는 토픽에만 발행합니다."""
+        video_id = evaluation.video.video_id
+        channel_id = evaluation.video.channel.channel_id
+        topics = [video_topic(video_id)] + ([channel_topic(channel_id)] if channel_id else [])
+        if self.remote:
+            channels = [self.topic_channel(topic) for topic in topics]
+            channels = [channel for channel, count in self.redis.pubsub_numsub(*channels) if count]
+        else:
+            channels = [topic for topic in topics if topic in self._topics]
+        self._remember(video_id, (data_version, config_version))
+        if not channels:
+            self.skipped += 1
+            return
+
+        body = json.dumps({
+            "video_id": video_id,
+            "channel_id": channel_id,
+            "data_version": data_version,
+            "config_version": config_version,
+            "reason": reason,
+            "published_at": time.time(),
+            "evaluation": evaluation.to_dict()
+        }, ensure_ascii=False)
+        message = f"{uuid4().hex}\n{video_id}\n{channel_id}\n{data_version}\n{config_version}\n{body}"
+        if self.remote:
+            pipe = self.redis.pipeline(transaction=False)
+            for channel in channels:
+                pipe.publish(channel, message)
+            pipe.execute()
+        else:
+            self._dispatch(message)
+        self.published += 1
+
+    def _remember(self, video_id: str, versions: Tuple[str, int]) -> None:
+        self._last_published[video_id] = versions
+        self._last_published.move_to_end(video_id)
+        while len(self._last_published) > self.max_tracked:
+            self._last_published.popitem(last=False)
+
+    def last_published(self, video_id: str) -> Optional[Tuple[str, int]]:
+        """이 워커가 마지막으로 발행하거나 받은 (데이터 버전, 설정 버전)"""
+        return self._last_published.get(video_id)
+
+    # 구독
+    @property
+    def subscribed_videos(self) -> List[str]:
+        prefix = video_topic("")
+        return [topic[len(prefix):] for topic in list(self._topics) if topic.startswith(prefix)]
+
+    def subscribe(self, video_ids: Iterable[str], channel_ids: Iterable[str]) -> Subscription:
+        if self._subscribers >= self.max_subscribers:
+            raise RuntimeError("구독자 수가 한도에 도달했습니다.")
+        topics = {video_topic(video_id) for video_id in video_ids} | {channel_topic(channel_id) for channel_id in channel_ids}
+        subscription = Subscription(topics, self.max_pending)
+        added = []
+        with self._topics_lock:
+            for topic in topics:
+                if topic not in self._topics:
+                    added.append(topic)
+                self._topics.setdefault(topic, set()).add(subscription)
+        if added:
+            self._changes.put(("subscribe", [self.topic_channel(topic) for topic in added]))
+        self._subscribers += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        removed = []
+        with self._topics_lock:
+            for topic in subscription.topics:
+                subscribers = self._topics.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[topic]
+                        removed.append(topic)
+        if removed:
+            self._changes.put(("unsubscribe", [self.topic_channel(topic) for topic in removed]))
+        self._subscribers -= 1
+
+    def _dispatch(self, message: str) -> None:
+        """이벤트 루프 스레드에서 실행: 헤더만 해석하고 본문은 그대로 구독자에게 전달"""
+        message_id, video_id, channel_id, data_version, config_version, body = message.split("\n", 5)
+        if message_id in self._recent_messages:
+            return
+        self._recent_messages[message_id] = None
+        while len(self._recent_messages) > 1024:
+            self._recent_messages.popitem(last=False)
+        self._remember(video_id, (data_version, int(config_version)))
+
+        targets: Set[Subscription] = set()
+        targets.update(self._topics.get(video_topic(video_id), ()))
+        if channel_id:
+            targets.update(self._topics.get(channel_topic(channel_id), ()))
+        if not targets:
+            return
+        self._sequence += 1
+        frame = f"id: {self._sequence}\nevent: evaluation\ndata: {body}\n\n".encode("utf-8")
+        for subscription in targets:
+            subscription.push(frame)
+
+    # 수신 스레드
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        if not self.remote or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._listen, name="evaluation-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _apply_changes(self, pubsub) -> None:
+        """구독 변경을 수신 스레드에서 반영합니다 (PubSub 객체는 스레드 간에 공유하지 않음)."""
+        while True:
+            try:
+                action, channels = self._changes.get_nowait()
+            except queue.Empty:
+                return
+            getattr(pubsub, action)(*channels)
+
+    def _listen(self) -> None:
+        while not self._stopped.is_set():
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                # 재연결 시 현재 구독 중인 토픽을 모두 다시 구독 (대기 중인 변경은 이 목록에 이미 반영됨)
+                while not self._changes.empty():
+                    self._changes.get_nowait()
+                with self._topics_lock:
+                    channels = [self.topic_channel(topic) for topic in self._topics]
+                if channels:
+                    pubsub.subscribe(*channels)
+                logger.info(f"[EVENTS] 평가 이벤트 구독 시작: {len(channels)}개 토픽")
+                while not self._stopped.is_set():
+                    self._apply_changes(pubsub)
+                    message = pubsub.get_message(timeout=0.2)
+                    if message is None or message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    self._loop.call_soon_threadsafe(self._dispatch, data)
+            except Exception as e:
+                logger.warning(f"[EVENTS] 평가 이벤트 수신 실패, 재연결합니다: {str(e)}")
+                time.sleep(1)
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    def stats(self) -> Dict:
+        return {
+            "subscribers": self._subscribers,
+            "topics": len(self._topics),
+            "tracked_videos": len(self._last_published),
+            "published": self.published,
+            "skipped": self.skipped,
+            "remote": self.remote
+        }
@@ -0,0 +1,216 @@
+from typing import Any, Dict, List, Optional, Tuple
+import copy
+import json
+import logging
+from datetime import datetime
+from . import codec
+from .locks import redis_lock
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정 (기본 테넌트의 이력 목록)
+CONFIG_HISTORY_KEY = "admin:history"
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_config(old: Any, new: Any, path: str = "") -> List[Dict]:
+    """
+    두 설정의 차이를 JSON Patch(RFC 6902) 형식의 연산 목록으로 계산합니다.
+
+    객체는 키 단위로 비교하고, 목록과 값은 통째로 교체합니다.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_config(old[key], value, child))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: List[Dict]) -> Any:
+    """JSON Patch 연산(add/remove/replace)을 적용한 새 문서를 반환합니다."""
+    document = copy.deepcopy(document)
+    for op in patch:
+        if op["path"] == "":
+            document = copy.deepcopy(op.get("value"))
+            continue
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token) if isinstance(target, list) else token]
+        if isinstance(target, list):
+            last = int(last)
+        if op["op"] == "remove":
+            del target[last]
+        elif op["op"] in ("add", "replace"):
+            target[last] = copy.deepcopy(op["value"])
+        else:
+            raise ValueError(f"지원하지 않는 패치 연산입니다: {op['op']}")
+    return document
+
+
+def is_checkpoint(entry: Dict) -> bool:
+    """전체 설정을 담은 항목인지 확인 (이전 형식의 항목은 모두 전체 설정)"""
+    return "patch" not in entry
+
+
+def normalize_entry(entry: Dict) -> Dict:
+    """이전 형식(JSON 문자열 changes)의 이력 항목을 config 필드로 변환"""
+    if "config" not in entry and "changes" in entry:
+        entry["config"] = json.loads(entry.pop("changes"))
+    return entry
+
+
+class ConfigHistoryStore:
+    """
+    관리자 설정 변경 이력
+
+    변경마다 직전 설정과의 차이(JSON Patch)만 저장하고, checkpoint_interval번째 항목마다
+    전체 설정을 체크포인트로 저장합니다. 특정 이력의 설정은 가장 가까운 이전 체크포인트부터
+    패치를 적용하여 복원하므로 조회 비용은 이력 길이가 아니라 체크포인트 간격에 비례합니다.
+    max_entries를 넘으면 오래된 항목을 잘라내고, 남은 첫 항목은 체크포인트로 다시 씁니다.
+
+    - {key}: 이력 항목 목록
+    - {key}:base: 목록 첫 항목의 이력 ID (보관 정책으로 앞부분을 잘라낸 만큼 증가)
+    - {key}:tip: 마지막 항목의 설정과 마지막 체크포인트 이후 항목 수
+    - {key}:lock: 추가 잠금 (tip을 읽고 항목을 추가하는 동안 다른 워커의 추가를 막음)
+    """
+
+    def __init__(self, redis_client, key: str = CONFIG_HISTORY_KEY, checkpoint_interval: int = 20,
+                 max_entries: int = 1000):
+        self.redis = redis_client
+        self.key = key
+        self.base_key = f"{key}:base"
+        self.tip_key = f"{key}:tip"
+        self.lock_key = f"{key}:lock"
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.max_entries = max_entries
+
+    def _base(self) -> int:
+        base = self.redis.get(self.base_key)
+        return int(base) if base else 0
+
+    def _entries(self, start: int, end: int) -> List[Dict]:
+        return [normalize_entry(codec.loads(item)) for item in self.redis.lrange(self.key, start, end)]
+
+    def _replay(self, start: int, end: int) -> List[Tuple[Dict, Dict]]:
+        """
+        목록 위치 start~end 항목과 각 항목 시점의 설정
+
+        start 이전의 가장 가까운 체크포인트를 찾을 때까지 체크포인트 간격만큼씩 앞쪽을 더 읽습니다.
+        """
+        entries = self._entries(start, end)
+        first = start
+        while entries and not is_checkpoint(entries[0]) and first > 0:
+            earlier = max(0, first - self.checkpoint_interval)
+            entries = self._entries(earlier, first - 1) + entries
+            first = earlier
+        for offset, entry in enumerate(entries):
+            if is_checkpoint(entry):
+                entries, first = entries[offset:], first + offset
+                break
+        else:
+            raise ValueError("변경 이력에 체크포인트가 없습니다.")
+
+        result = []
+        config: Dict = {}
+        for position, entry in enumerate(entries, start=first):
+            config = entry["config"] if is_checkpoint(entry) else apply_patch(config, entry["patch"])
+            if position >= start:
+                result.append((entry, config))
+        return result
+
+    def config_at(self, history_id: int) -> Optional[Dict]:
+        """이력 ID 시점의 전체 설정 (없거나 보관 기간이 지났으면 None)"""
+        position = history_id - self._base()
+        if position < 0 or not self.redis.lrange(self.key, position, position):
+            return None
+        return self._replay(position, position)[-1][1]
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        """
+        최근 limit개 이력 (오래된 항목부터, 0이면 전체)
+
+        각 항목에는 이력 ID와 해당 시점의 전체 설정을 포함하며,
+        차이로 저장된 항목은 변경 내용(patch)도 함께 반환합니다.
+        """
+        base = self._base()
+        length = self.redis.llen(self.key)
+        if length == 0:
+            return []
+        start = max(0, length - limit) if limit > 0 else 0
+        history = []
+        for position, (entry, config) in enumerate(self._replay(start, length - 1), start=start):
+            item = {key: value for key, value in entry.items() if key not in ("config", "checkpoint")}
+            item.update(id=base + position, config=config)
+            history.append(item)
+        return history
+
+    def append(self, config: Dict, user: str, **extra) -> int:
+        """
+        새 설정을 이력에 추가하고 이력 ID를 반환합니다.
+
+        차이는 tip을 기준으로 계산하므로, 두 워커가 같은 tip에 대한 차이를 연달아 추가하지 않도록
+        tip 조회부터 기록(과 보관 정책에 따른 정리)까지 잠금 안에서 수행합니다.
+        """
+        entry = {"timestamp": datetime.utcnow().isoformat(), "user": user, **extra}
+        with redis_lock(self.redis, self.lock_key):
+            tip = codec.loads(self.redis.get(self.tip_key))
+            if tip is not None and not self.redis.exists(self.key):
+                tip = None
+            if tip is None or tip["since_checkpoint"] + 1 >= self.checkpoint_interval:
+                entry.update(checkpoint=True, config=config)
+                tip = {"config": config, "since_checkpoint": 0}
+            else:
+                entry["patch"] = diff_config(tip["config"], config)
+                tip = {"config": config, "since_checkpoint": tip["since_checkpoint"] + 1}
+
+            length = self.redis.rpush(self.key, codec.dumps(entry))
+            self.redis.set(self.tip_key, codec.dumps(tip))
+            history_id = self._base() + length - 1
+            if self.max_entries and length > self.max_entries:
+                try:
+                    self.prune(length - self.max_entries)
+                except Exception as e:
+                    logger.warning(f"[HISTORY] 변경 이력 정리 실패: {str(e)}")
+        return history_id
+
+    def prune(self, count: int) -> None:
+        """오래된 count개 항목을 삭제합니다. 남는 첫 항목이 차이 항목이면 체크포인트로 바꿔 씁니다."""
+        entry, config = self._replay(count, count)[0]
+        if not is_checkpoint(entry):
+            entry = {key: value for key, value in entry.items() if key != "patch"}
+            entry.update(checkpoint=True, config=config)
+            self.redis.lset(self.key, count, codec.dumps(entry))
+        self.redis.ltrim(self.key, count, -1)
+        self.redis.incr(self.base_key, count)
+        logger.info(f"[HISTORY] 오래된 변경 이력 {count}개 삭제")
+
+    def stats(self) -> Dict:
+        length = self.redis.llen(self.key)
+        base = self._base()
+        return {
+            "entries": length,
+            "first_id": base if length else None,
+            "last_id": base + length - 1 if length else None,
+            "checkpoint_interval": self.checkpoint_interval,
+            "max_entries": self.max_entries
+        }
@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from typing import Iterator
+from uuid import uuid4
+import time
+from . import codec
+
+
+class LockTimeoutError(RuntimeError):
+    """제한 시간 안에 잠금을 얻지 못한 경우"""
+
+
+@contextmanager
+def redis_lock(redis_client, key: str, ttl: float = 10, timeout: float = 5, interval: float = 0.01) -> Iterator[None]:
+    """
+    여러 워커 사이의 짧은 임계 구역을 위한 Redis 잠금 (SET NX EX)
+
+    잠금을 가진 워커가 종료되어도 ttl 뒤에는 자동으로 풀리며, 해제할 때는 자신이 설정한
+    잠금인지 확인한 뒤 삭제합니다.
+
+    Args:
+        key (str): 잠금 키
+        ttl (float): 잠금 유지 시간(초, 임계 구역보다 충분히 길어야 함)
+        timeout (float): 잠금을 기다리는 최대 시간(초)
+        interval (float): 재시도 간격(초)
+    """
+    token = uuid4().hex
+    deadline = time.monotonic() + timeout
+    while not redis_client.set(key, token, nx=True, ex=max(1, int(ttl))):
+        if time.monotonic() >= deadline:
+            raise LockTimeoutError(f"잠금을 얻지 못했습니다: {key}")
+        time.sleep(interval)
+    try:
+        yield
+    finally:
+        if codec.to_text(redis_client.get(key)) == token:
+            redis_client.delete(key)
@@ -0,0 +1,134 @@
+from typing import Dict, List, Optional
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from . import codec
+from .records import ContentTrust
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 텍스트 분석 로직이 바뀌면 올려서 기존 캐시를 무효화
+ANALYSIS_VERSION = 2
+
+MEMO_KEY = "memo:text:{digest}"
+
+
+def keyword_fingerprint(keywords: Dict[str, List[str]]) -> str:
+    """키워드 설정의 지문. 키워드가 바뀌면 메모 키도 바뀌므로 기존 항목은 자동으로 무효화됩니다."""
+    encoded = json.dumps(keywords, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+class TextAnalysisMemo:
+    """
+    (제목, 설명, 키워드 설정) 기준 내용 신뢰도 메모이제이션
+
+    프로세스 내 LRU를 먼저 확인하고, 없으면 Redis에서 조회하여
+    같은 텍스트는 전체 워커에서 한 번만 분석합니다.
+    """
+
+    def __init__(self, redis_client, max_entries: int = 10000, ttl: int = 86400):
+        self.redis = redis_client
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, ContentTrust]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+
+    def key(self, title: str, description: str, keyword_version: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{ANALYSIS_VERSION}:{keyword_version}\0".encode("utf-8"))
+        digest.update(title.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(description.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _remember(self, key: str, content: ContentTrust) -> None:
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[ContentTrust]:
+        """메모된 내용 신뢰도를 조회합니다."""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return content
+
+        try:
+            cached = self.redis.get(MEMO_KEY.format(digest=key))
+        except Exception as e:
+            logger.warning(f"[MEMO] 텍스트 분석 캐시 조회 실패: {str(e)}")
+            cached = None
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        content = ContentTrust(*codec.loads(cached))
+        self._remember(key, content)
+        self.remote_hits += 1
+        return content
+
+    def set(self, key: str, content: ContentTrust) -> None:
+        """분석 결과를 메모합니다."""
+        self._remember(key, content)
+        try:
+            value = [content.title_score, content.description_score, content.sentiment_score, content.total_score]
+            self.redis.setex(MEMO_KEY.format(digest=key), self.ttl, codec.dumps(value))
+        except Exception as e:
+            logger.warning(f"[MEMO] 텍스트 분석 캐시 저장 실패: {str(e)}")
+
+    def export_entries(self) -> Dict:
+        """스냅샷용 프로세스 내 LRU 항목 (오래 사용하지 않은 항목부터)"""
+        with self._lock:
+            entries = list(self._entries.items())
+        return {
+            "analysis_version": ANALYSIS_VERSION,
+            "saved_at": time.time(),
+            "entries": [
+                [key, [content.title_score, content.description_score, content.sentiment_score, content.total_score]]
+                for key, content in entries
+            ]
+        }
+
+    def load_entries(self, snapshot: Dict) -> int:
+        """
+        스냅샷 항목을 프로세스 내 LRU에 채웁니다.
+
+        분석 로직 버전이 다르거나 저장 후 TTL이 지난 스냅샷은 사용하지 않습니다.
+        키워드 설정은 키에 포함되어 있으므로 설정이 바뀌어도 잘못된 결과가 반환되지 않습니다.
+        """
+        if snapshot.get("analysis_version") != ANALYSIS_VERSION or snapshot["saved_at"] + self.ttl <= time.time():
+            return 0
+        loaded = 0
+        for key, scores in snapshot["entries"]:
+            if key not in self._entries:
+                self._remember(key, ContentTrust(*scores))
+                loaded += 1
+        return loaded
+
+    def stats(self) -> Dict:
+        """현재 워커의 캐시 적중률"""
+        lookups = self.local_hits + self.remote_hits + self.misses
+        return {
+            "pid": os.getpid(),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "local_hits": self.local_hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.remote_hits) / lookups if lookups else 0.0
+        }
@@ -0,0 +1,166 @@
+from typing import Dict, Iterable, List, Set
+import hashlib
+import logging
+import re
+import threading
+import time
+from .youtube import VideoNotFoundError
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# YouTube 비디오 ID 형식 (URL-safe base64 11자)
+VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# Redis 키 설정
+MISSING_KEY = "missing:{{{video_id}}}"
+BLOOM_KEY = "missing:bloom:{generation}"
+
+
+def is_valid_video_id(video_id: str) -> bool:
+    return bool(VIDEO_ID_PATTERN.fullmatch(video_id or ""))
+
+
+def _has_bits(bitmap: bytes, positions: List[int]) -> bool:
+    """Redis 비트맵(바이트 내 최상위 비트가 오프셋 0)에 모든 비트가 설정되어 있는지 확인"""
+    for position in positions:
+        index = position >> 3
+        if index >= len(bitmap) or not bitmap[index] >> (7 - (position & 7)) & 1:
+            return False
+    return True
+
+
+class MissingVideoCache:
+    """
+    존재하지 않거나 비공개인 비디오 ID의 부정 캐시
+
+    YouTube에서 찾을 수 없었던 ID는 ttl 동안 Redis 키(missing:{<id>})로 기록하고, 같은 ID를
+    블룸 필터(Redis 비트맵)에도 추가합니다. 워커는 비트맵을 refresh_interval마다 내려받아
+    프로세스 내에서 확인하므로, 대부분의 정상 ID는 Redis 왕복 없이 통과하고 블룸 필터에
+    걸린 ID만 Redis 키로 확정합니다 (오탐은 키 조회 한 번으로 걸러짐).
+
+    비트맵은 ttl 주기의 세대로 나누어 현재/이전 세대만 확인하므로, 만료된 ID의 비트는
+    최대 두 주기 뒤에 사라지고 필터가 계속 포화되지 않습니다.
+    """
+
+    def __init__(self, redis_client, ttl: int = 3600, bloom_bits: int = 1 << 20, hashes: int = 7,
+                 refresh_interval: float = 30):
+        self.redis = redis_client
+        self.ttl = max(1, ttl)
+        self.bloom_bits = bloom_bits
+        self.hashes = hashes
+        self.refresh_interval = refresh_interval
+        # 세대 -> 비트맵 (프로세스 내 사본)
+        self._bitmaps: Dict[int, bytearray] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.passed = 0
+        self.hits = 0
+        self.false_positives = 0
+        self.recorded = 0
+
+    def _generation(self, now: float) -> int:
+        return int(now // self.ttl)
+
+    def _positions(self, video_id: str) -> List[int]:
+        digest = hashlib.blake2b(video_id.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.bloom_bits for i in range(self.hashes)]
+
+    def _refresh(self, now: float) -> Dict[int, bytearray]:
+        """현재/이전 세대 비트맵을 refresh_interval마다 Redis에서 다시 읽습니다."""
+        generation = self._generation(now)
+        with self._lock:
+            if now - self._refreshed_at < self.refresh_interval and generation in self._bitmaps:
+                return self._bitmaps
+        generations = (generation, generation - 1)
+        pipe = self.redis.pipeline()
+        for gen in generations:
+            pipe.get(BLOOM_KEY.format(generation=gen))
+        bitmaps = {gen: bytearray(data or b"") for gen, data in zip(generations, pipe.execute())}
+        with self._lock:
+            self._bitmaps = bitmaps
+            self._refreshed_at = now
+        return bitmaps
+
+    def known_missing(self, video_ids: Iterable[str]) -> Set[str]:
+        """찾을 수 없는 것으로 기록된 ID (Redis 오류 시 빈 집합)"""
+        try:
+            bitmaps = self._refresh(time.time())
+            candidates = []
+            for video_id in video_ids:
+                positions = self._positions(video_id)
+                if any(_has_bits(bitmap, positions) for bitmap in bitmaps.values()):
+                    candidates.append(video_id)
+                else:
+                    self.passed += 1
+            if not candidates:
+                return set()
+
+            pipe = self.redis.pipeline()
+            for video_id in candidates:
+                pipe.exists(MISSING_KEY.format(video_id=video_id))
+            missing = {video_id for video_id, found in zip(candidates, pipe.execute()) if found}
+        except Exception as e:
+            logger.warning(f"[MISSING] 부정 캐시 조회 실패: {str(e)}")
+            return set()
+        self.hits += len(missing)
+        self.false_positives += len(candidates) - len(missing)
+        return missing
+
+    def check(self, video_id: str) -> None:
+        """형식이 잘못되었거나 찾을 수 없는 것으로 기록된 ID이면 YouTube API 호출 전에 오류 발생"""
+        if not is_valid_video_id(video_id):
+            self.rejected += 1
+            raise ValueError("유효하지 않은 비디오 ID입니다.")
+        if self.known_missing([video_id]):
+            raise VideoNotFoundError("비디오를 찾을 수 없습니다.")
+
+    def add(self, video_ids: List[str]) -> None:
+        """YouTube에서 찾을 수 없었던 ID를 기록합니다 (실패해도 응답에는 영향 없음)."""
+        if not video_ids:
+            return
+        now = time.time()
+        generation = self._generation(now)
+        key = BLOOM_KEY.format(generation=generation)
+        positions = [position for video_id in video_ids for position in self._positions(video_id)]
+        try:
+            pipe = self.redis.pipeline()
+            for video_id in video_ids:
+                pipe.setex(MISSING_KEY.format(video_id=video_id), self.ttl, 1)
+            for position in positions:
+                pipe.setbit(key, position, 1)
+            # 이전 세대로 확인되는 동안은 유지
+            pipe.expire(key, self.ttl * 2)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"[MISSING] 부정 캐시 기록 실패: {str(e)}")
+            return
+
+        # 다음 갱신 전에도 이 워커에서는 바로 걸러지도록 사본에 반영
+        with self._lock:
+            bitmap = self._bitmaps.setdefault(generation, bytearray())
+            for position in positions:
+                index = position >> 3
+                if index >= len(bitmap):
+                    bitmap.extend(bytes(index + 1 - len(bitmap)))
+                bitmap[index] |= 1 << (7 - (position & 7))
+        self.recorded += len(video_ids)
+        logger.info(f"[MISSING] 찾을 수 없는 비디오 {len(video_ids)}개 기록")
+
+    def stats(self) -> Dict:
+        checks = self.passed + self.hits + self.false_positives
+        return {
+            "ttl": self.ttl,
+            "bloom_bits": self.bloom_bits,
+            "hashes": self.hashes,
+            "rejected": self.rejected,
+            "passed": self.passed,
+            "hits": self.hits,
+            "false_positives": self.false_positives,
+            "recorded": self.recorded,
+            "hit_rate": self.hits / checks if checks else 0.0
+        }
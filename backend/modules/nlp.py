@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import Dict, List, Optional
 import re
 from collections import Counter
+from .tokenizer import TextIndex
 
 class ContentAnalyzer:
     def __init__(self):
@@ -34,10 +35,16 @@ class ContentAnalyzer:
     def analyze(self, video_info: Dict) -> Dict:
         """비디오 내용 분석"""
         try:
+            # 제목/설명은 한 번만 토큰화하여 모든 항목에서 재사용
+            title = video_info.get('title', '')
+            description = video_info.get('description', '')
+            title_index = TextIndex(title)
+            description_index = TextIndex(description)
+            
             # 각 요소별 점수 계산
-            title_score = self._analyze_title(video_info.get('title', ''))
-            description_score = self._analyze_description(video_info.get('description', ''))
-            sentiment_score = self._analyze_sentiment(video_info.get('title', ''), video_info.get('description', ''))
+            title_score = self._analyze_title(title, title_index)
+            description_score = self._analyze_description(description, description_index)
+            sentiment_score = self._analyze_sentiment(title_index, description_index)
             
             # 가중치 적용
             weights = self.admin_config['weights']
@@ -62,12 +69,17 @@ class ContentAnalyzer:
             logger.error(f"[NLP] 내용 분석 중 오류 발생: {str(e)}")
             raise
 
-    def _analyze_title(self, title: str) -> float:
+    def _count(self, keywords: List[str], *indexes: TextIndex) -> int:
+        """색인들에서 키워드 출현 횟수 합계"""
+        return sum(index.count(keyword) for keyword in keywords for index in indexes)
+
+    def _analyze_title(self, title: str, index: Optional[TextIndex] = None) -> float:
         """
         제목을 분석합니다.
         """
         if not title:
             return 30.0
+        index = index or TextIndex(title)
             
         # 제목 길이 점수
         length = len(title)
@@ -75,21 +87,22 @@ class ContentAnalyzer:
             return 20.0
             
         # 키워드 분석
-        keyword_score = self._analyze_keywords(title)
+        keyword_score = self._analyze_keywords(index)
         
         # 감정적 표현 체크
-        emotional_count = sum(title.count(keyword) for keyword in self.emotion_keywords["negative"])
+        emotional_count = self._count(self.emotion_keywords["negative"], index)
         if emotional_count > 0:
             return max(20.0, keyword_score * 0.5)  # 감정적 표현이 있으면 점수 50% 감소
             
         return max(30.0, keyword_score)
 
-    def _analyze_description(self, description: str) -> float:
+    def _analyze_description(self, description: str, index: Optional[TextIndex] = None) -> float:
         """
         설명을 분석합니다.
         """
         if not description:
             return 30.0
+        index = index or TextIndex(description)
             
         # 설명 길이 점수
         length = len(description)
@@ -101,28 +114,26 @@ class ContentAnalyzer:
             return 30.0
             
         # 키워드 분석
-        keyword_score = self._analyze_keywords(description)
+        keyword_score = self._analyze_keywords(index)
         
         # 전문성 지표 체크
-        professional_count = sum(description.count(keyword) for keyword in self.trust_keywords["positive"])
+        professional_count = self._count(self.trust_keywords["positive"], index)
         if professional_count > 0:
             return min(80.0, 50.0 + (professional_count * 5.0))  # 전문성 점수 상한선 80점
             
         return max(30.0, keyword_score)
 
-    def _analyze_sentiment(self, title: str, description: str) -> float:
+    def _analyze_sentiment(self, title: TextIndex, description: TextIndex) -> float:
         """
         감정을 분석합니다.
         """
-        text = f"{title} {description}"
-        
         # 긍정/부정 키워드 카운트
-        positive_count = sum(text.count(keyword) for keyword in self.trust_keywords["positive"])
-        negative_count = sum(text.count(keyword) for keyword in self.trust_keywords["negative"])
+        positive_count = self._count(self.trust_keywords["positive"], title, description)
+        negative_count = self._count(self.trust_keywords["negative"], title, description)
         
         # 감정 키워드 카운트
-        positive_emotion = sum(text.count(keyword) for keyword in self.emotion_keywords["positive"])
-        negative_emotion = sum(text.count(keyword) for keyword in self.emotion_keywords["negative"])
+        positive_emotion = self._count(self.emotion_keywords["positive"], title, description)
+        negative_emotion = self._count(self.emotion_keywords["negative"], title, description)
         
         # 신뢰도 점수 계산 (0~1)
         total_trust = positive_count + negative_count
@@ -141,20 +152,20 @@ class ContentAnalyzer:
         
         return max(0.0, min(100.0, final_score))
 
-    def _analyze_keywords(self, text: str) -> float:
+    def _analyze_keywords(self, index: TextIndex) -> float:
         """
         텍스트의 키워드를 분석합니다.
         """
-        if not text:
+        if not index.counts:
             return 50.0
             
         # 키워드 카운트
-        positive_count = sum(text.count(keyword) for keyword in self.trust_keywords["positive"])
-        negative_count = sum(text.count(keyword) for keyword in self.trust_keywords["negative"])
+        positive_count = self._count(self.trust_keywords["positive"], index)
+        negative_count = self._count(self.trust_keywords["negative"], index)
         
         # 감정 키워드 카운트
-        positive_emotion = sum(text.count(keyword) for keyword in self.emotion_keywords["positive"])
-        negative_emotion = sum(text.count(keyword) for keyword in self.emotion_keywords["negative"])
+        positive_emotion = self._count(self.emotion_keywords["positive"], index)
+        negative_emotion = self._count(self.emotion_keywords["negative"], index)
         
         # 신뢰도 점수 계산 (0~1)
         total_trust = positive_count + negative_count
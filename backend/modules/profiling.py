@@ -0,0 +1,178 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from uuid import uuid4
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 요청별 프로파일링 구간 (Server-Timing 이름 -> 파일 경로 패턴)
+PROFILE_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "evaluator": ("modules/evaluator.py", "modules/tokenizer.py", "modules/scoring.py"),
+    "youtube": ("modules/youtube.py", "googleapiclient", "httplib2"),
+    "redis": ("/redis/",),
+}
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)})"
+
+
+class SamplingProfiler:
+    """
+    sys._current_frames 기반 샘플링 프로파일러
+
+    워커의 모든 스레드 스택을 주기적으로 수집하여 flamegraph 도구에서 사용할 수 있는
+    collapsed stack 형식("루트;...;말단 횟수")으로 반환합니다. 한 번에 하나만 실행됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def collect(self, duration: float, interval: float = 0.005) -> str:
+        """
+        duration초 동안 interval 간격으로 스택을 수집합니다.
+
+        Raises:
+            RuntimeError: 다른 샘플링이 실행 중인 경우
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("이미 프로파일링이 실행 중입니다.")
+        try:
+            own_thread = threading.get_ident()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            stacks: Counter = Counter()
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread:
+                        continue
+                    labels: List[str] = []
+                    while frame is not None:
+                        labels.append(_frame_label(frame.f_code))
+                        frame = frame.f_back
+                    labels.append(names.get(thread_id, f"thread-{thread_id}"))
+                    stacks[";".join(reversed(labels))] += 1
+                time.sleep(interval)
+            return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        finally:
+            self._lock.release()
+
+
+def category_timings(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    구간별 누적 시간(초)
+
+    구간 밖에서 구간 안의 함수를 호출한 경우의 누적 시간만 합산하여
+    구간 내부 호출이 중복 집계되지 않도록 합니다.
+    """
+    def category_of(func) -> Optional[str]:
+        filename = func[0].replace("\\", "/")
+        for name, patterns in PROFILE_CATEGORIES.items():
+            if any(pattern in filename for pattern in patterns):
+                return name
+        return None
+
+    timings = dict.fromkeys(PROFILE_CATEGORIES, 0.0)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        name = category_of(func)
+        if name is None:
+            continue
+        for caller, edge in callers.items():
+            if category_of(caller) != name:
+                timings[name] += edge[3]
+    return timings
+
+
+class ProfileReports:
+    """요청별 프로파일링 결과(함수별 통계 텍스트)를 최근 max_reports개까지 보관"""
+
+    def __init__(self, max_reports: int = 20):
+        self.max_reports = max_reports
+        self._reports: "OrderedDict[str, str]" = OrderedDict()
+
+    def add(self, stats: pstats.Stats, title: str, limit: int = 50) -> str:
+        stream = io.StringIO()
+        stream.write(f"{title}\n\n")
+        stats.stream = stream
+        stats.sort_stats("cumulative").print_stats(limit)
+        profile_id = uuid4().hex[:12]
+        self._reports[profile_id] = stream.getvalue()
+        while len(self._reports) > self.max_reports:
+            self._reports.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[str]:
+        return self._reports.get(profile_id)
+
+
+class RequestProfilerMiddleware:
+    """
+    X-Profile 헤더가 있는 관리자 요청만 cProfile로 측정하는 ASGI 미들웨어
+
+    구간별 시간은 Server-Timing 헤더로 반환하고, 함수별 통계는 reports에 저장한 뒤
+    X-Profile-Id 헤더로 식별자를 반환합니다. 헤더가 없는 요청은 그대로 전달합니다.
+    이벤트 루프 스레드를 측정하므로 같은 시간에 처리된 다른 요청의 작업도 함께 집계될 수 있습니다.
+    """
+
+    def __init__(self, app, authorize: Callable[[Dict], Awaitable[bool]], reports: ProfileReports):
+        self.app = app
+        self.authorize = authorize
+        self.reports = reports
+        self._busy = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(name == b"x-profile" for name, _ in scope.get("headers", [])):
+            return await self.app(scope, receive, send)
+        if self._busy or not await self.authorize(scope):
+            return await self.app(scope, receive, send)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # 다른 프로파일링 도구가 실행 중인 경우
+            logger.warning(f"[PROFILE] 요청 프로파일링 시작 실패: {str(e)}")
+            return await self.app(scope, receive, send)
+        self._busy = True
+        started = time.perf_counter()
+        enabled = True
+
+        def finish() -> List[Tuple[bytes, bytes]]:
+            nonlocal enabled
+            profiler.disable()
+            enabled = False
+            self._busy = False
+            total = time.perf_counter() - started
+            stats = pstats.Stats(profiler)
+            timings = category_timings(stats)
+            timing = ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items())
+            timing += f", total;dur={total * 1000:.2f}"
+            return [
+                (b"server-timing", timing.encode("latin-1")),
+                (b"x-profile-id", self.reports.add(stats, f"{scope['method']} {scope['path']}").encode("latin-1")),
+            ]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and enabled:
+                message["headers"] = list(message.get("headers", [])) + finish()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if enabled:
+                profiler.disable()
+                self._busy = False
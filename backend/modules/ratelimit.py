@@ -0,0 +1,192 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import asyncio
+import json
+import logging
+import math
+import time
+from uuid import uuid4
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정
+RATE_LIMIT_KEY = "ratelimit:{rule}:{identity}"
+
+
+@dataclass
+class AdmissionRule:
+    """
+    경로별 유입 제어 규칙
+
+    Attributes:
+        prefix: 적용할 경로 접두사
+        rate_limit: 클라이언트별 윈도우 내 최대 요청 수 (0이면 제한 없음)
+        window: 윈도우 길이(초)
+        max_concurrency: 워커당 동시 처리 요청 수 (0이면 제한 없음)
+        max_queue: 동시 처리 한도 초과 시 대기할 수 있는 요청 수
+        queue_timeout: 대기 최대 시간(초)
+    """
+    prefix: str
+    rate_limit: int = 0
+    window: int = 60
+    max_concurrency: int = 0
+    max_queue: int = 0
+    queue_timeout: float = 1.0
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, repr=False)
+    _waiting: int = field(default=0, repr=False)
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+
+# 기본 규칙 (앞에서부터 먼저 일치하는 규칙 적용)
+DEFAULT_RULES: List[Dict] = [
+    # 검색은 호출당 100 유닛 이상의 YouTube 할당량을 사용
+    {"prefix": "/api/search", "rate_limit": 10, "window": 60, "max_concurrency": 4, "max_queue": 8, "queue_timeout": 2.0},
+    {"prefix": "/evaluate", "rate_limit": 120, "window": 60, "max_concurrency": 32, "max_queue": 64, "queue_timeout": 2.0},
+    {"prefix": "/youtube/video", "rate_limit": 120, "window": 60, "max_concurrency": 32, "max_queue": 64, "queue_timeout": 2.0},
+    {"prefix": "/token", "rate_limit": 10, "window": 60, "max_concurrency": 4, "max_queue": 4, "queue_timeout": 2.0},
+    # 구독 연결은 오래 유지되므로 동시 처리 한도 대신 구독자 수 한도(EVENTS_MAX_SUBSCRIBERS) 적용
+    {"prefix": "/events", "rate_limit": 30, "window": 60},
+    {"prefix": "/", "rate_limit": 300, "window": 60, "max_concurrency": 64, "max_queue": 128, "queue_timeout": 1.0},
+]
+
+
+def load_rules(spec: Optional[str] = None) -> List[AdmissionRule]:
+    """JSON 규칙 문자열(없으면 기본 규칙)을 파싱합니다."""
+    rules = json.loads(spec) if spec else DEFAULT_RULES
+    return [AdmissionRule(**rule) for rule in rules]
+
+
+class SlidingWindowLimiter:
+    """
+    Redis 정렬 집합 기반 슬라이딩 윈도우 요청 제한
+
+    Redis 왕복은 크기가 제한된 전용 스레드 풀에서 실행하여, 거부 요청이 몰려도
+    이벤트 루프와 다른 요청 처리를 막지 않습니다.
+    """
+
+    def __init__(self, redis_client, max_workers: int = 8):
+        self.redis = redis_client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ratelimit")
+
+    async def check(self, rule: AdmissionRule, identify: Callable[[], str]) -> Tuple[bool, int]:
+        """클라이언트 식별과 allow를 전용 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: self.allow(rule, identify()))
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+    def allow(self, rule: AdmissionRule, identity: str, now: Optional[float] = None) -> Tuple[bool, int]:
+        """
+        요청 허용 여부를 확인합니다.
+
+        Returns:
+            Tuple[bool, int]: (허용 여부, 거부 시 재시도까지 남은 초)
+        """
+        now = now or time.time()
+        key = RATE_LIMIT_KEY.format(rule=rule.prefix, identity=identity)
+        member = f"{now}:{uuid4().hex[:8]}"
+
+        pipe = self.redis.pipeline()
+        pipe.zremrangebyscore(key, 0, now - rule.window)
+        pipe.zadd(key, {member: now})
+        pipe.zcard(key)
+        pipe.expire(key, rule.window)
+        count = pipe.execute()[2]
+
+        if count <= rule.rate_limit:
+            return True, 0
+
+        # 거부된 요청은 윈도우에 포함하지 않음 (제거와 가장 오래된 요청 조회를 한 번에 전송)
+        pipe = self.redis.pipeline()
+        pipe.zrem(key, member)
+        pipe.zrange(key, 0, 0, withscores=True)
+        oldest = pipe.execute()[1]
+        retry_after = rule.window if not oldest else oldest[0][1] + rule.window - now
+        return False, max(1, math.ceil(retry_after))
+
+
+class AdmissionMiddleware:
+    """
+    요청 유입 제어 ASGI 미들웨어
+
+    1. 클라이언트(API 키/사용자/IP)별 슬라이딩 윈도우 요청 제한 → 429
+    2. 경로별 동시 처리 한도와 대기열 길이 기반 부하 차단 → 503
+    """
+
+    def __init__(self, app, rules: List[AdmissionRule], limiter: SlidingWindowLimiter,
+                 identify: Callable[[Dict], str], exempt: Tuple[str, ...] = ()):
+        self.app = app
+        self.rules = rules
+        self.limiter = limiter
+        self.identify = identify
+        self.exempt = exempt
+
+    def _match(self, path: str) -> Optional[AdmissionRule]:
+        for rule in self.rules:
+            if path.startswith(rule.prefix):
+                return rule
+        return None
+
+    async def _reject(self, send, status: int, detail: str, retry_after: int) -> None:
+        body = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(retry_after).encode("latin-1")),
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.exempt:
+            return await self.app(scope, receive, send)
+
+        rule = self._match(scope["path"])
+        if rule is None:
+            return await self.app(scope, receive, send)
+
+        # 클라이언트별 요청 제한
+        if rule.rate_limit:
+            try:
+                allowed, retry_after = await self.limiter.check(rule, lambda: self.identify(scope))
+            except Exception as e:
+                # 제한 저장소 장애 시에는 요청을 허용
+                logger.warning(f"[ADMISSION] 요청 제한 확인 실패: {str(e)}")
+                allowed, retry_after = True, 0
+            if not allowed:
+                return await self._reject(send, 429, "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", retry_after)
+
+        if not rule.max_concurrency:
+            return await self.app(scope, receive, send)
+
+        # 동시 처리 한도: 대기열이 가득 차면 즉시 차단
+        semaphore = rule.semaphore
+        if semaphore.locked():
+            if rule._waiting >= rule.max_queue:
+                return await self._reject(send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", 1)
+            rule._waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), rule.queue_timeout)
+            except asyncio.TimeoutError:
+                return await self._reject(send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", 1)
+            finally:
+                rule._waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            semaphore.release()
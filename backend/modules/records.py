@@ -0,0 +1,194 @@
+from typing import Callable, Dict, Optional, Set
+from dataclasses import dataclass
+
+# 평가 응답에서 선택할 수 있는 최상위 필드
+EVALUATION_FIELDS = ("video_id", "video_info", "source_trust", "content_trust", "final_score", "grade", "grade_description")
+
+# 목록 조회용 요약 응답 필드
+SUMMARY_FIELDS = "video_id,final_score,grade"
+
+
+def parse_fields(spec: str) -> Dict[str, Optional[Set[str]]]:
+    """
+    필드 선택 문자열을 파싱합니다.
+    
+    Args:
+        spec (str): 쉼표로 구분된 필드 목록 (예: "final_score,grade,video_info.title")
+        
+    Returns:
+        Dict: 최상위 필드 -> 선택된 하위 필드 집합 (None이면 전체)
+    """
+    fields: Dict[str, Optional[Set[str]]] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, sub = item.partition(".")
+        if name not in EVALUATION_FIELDS:
+            raise ValueError(f"알 수 없는 필드입니다: {name}")
+        if not sub:
+            fields[name] = None
+        elif name not in fields or fields[name] is not None:
+            fields.setdefault(name, set()).add(sub)
+    if not fields:
+        raise ValueError("선택된 필드가 없습니다.")
+    return fields
+
+
+@dataclass(slots=True)
+class ChannelProfile:
+    """채널 정보"""
+    channel_id: str = ""
+    channel_title: str = ""
+    subscriber_count: int = 0
+    channel_age: int = 0
+    video_count: int = 0
+
+
+@dataclass(slots=True)
+class VideoInfo:
+    """비디오 정보"""
+    video_id: str
+    title: str = ""
+    description: str = ""
+    published_at: str = ""
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+    thumbnail_url: Optional[str] = None
+    channel: ChannelProfile = None
+
+    def __post_init__(self):
+        if self.channel is None:
+            self.channel = ChannelProfile()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VideoInfo":
+        """get_video_info 형식의 딕셔너리에서 생성합니다."""
+        return cls(
+            video_id=data.get('video_id', ''),
+            title=data.get('title', ''),
+            description=data.get('description', ''),
+            published_at=data.get('published_at', ''),
+            views=data.get('views', 0),
+            likes=data.get('likes', 0),
+            comments=data.get('comments', 0),
+            thumbnail_url=data.get('thumbnail_url'),
+            channel=ChannelProfile(
+                channel_id=data.get('channel_id', ''),
+                channel_title=data.get('channel_title', ''),
+                subscriber_count=data.get('subscriber_count', 0),
+                channel_age=data.get('channel_age', 0),
+                video_count=data.get('video_count', 0)
+            )
+        )
+
+    def to_dict(self) -> Dict:
+        """get_video_info 응답 형식으로 변환합니다."""
+        channel = self.channel
+        return {
+            'video_id': self.video_id,
+            'title': self.title,
+            'description': self.description,
+            'channel_id': channel.channel_id,
+            'channel_title': channel.channel_title,
+            'published_at': self.published_at,
+            'views': self.views,
+            'likes': self.likes,
+            'comments': self.comments,
+            'thumbnail_url': self.thumbnail_url,
+            'subscriber_count': channel.subscriber_count,
+            'channel_age': channel.channel_age,
+            'video_count': channel.video_count
+        }
+
+
+@dataclass(slots=True)
+class SourceTrust:
+    """출처 신뢰도 (세부 점수 0~1, 총점 0~100)"""
+    subscriber_score: float
+    activity_score: float
+    engagement_score: float
+    total_score: float
+
+    def to_dict(self) -> Dict:
+        return {
+            'subscriber_score': self.subscriber_score,
+            'activity_score': self.activity_score,
+            'engagement_score': self.engagement_score,
+            'total_score': self.total_score
+        }
+
+
+@dataclass(slots=True)
+class ContentTrust:
+    """내용 신뢰도 (세부 점수 0~1, 총점 0~100)"""
+    title_score: float
+    description_score: float
+    sentiment_score: float
+    total_score: float
+
+    def to_dict(self) -> Dict:
+        return {
+            'title_score': self.title_score,
+            'description_score': self.description_score,
+            'sentiment_score': self.sentiment_score,
+            'total_score': self.total_score
+        }
+
+
+@dataclass(slots=True)
+class Evaluation:
+    """비디오 평가 결과"""
+    video: VideoInfo
+    source: SourceTrust
+    content: ContentTrust
+    final_score: float
+    grade: str
+    grade_description: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Evaluation":
+        """to_dict 전체 응답 형식의 딕셔너리에서 생성합니다."""
+        return cls(
+            video=VideoInfo.from_dict(data['video_info']),
+            source=SourceTrust(**data['source_trust']),
+            content=ContentTrust(**data['content_trust']),
+            final_score=data['final_score'],
+            grade=data['grade'],
+            grade_description=data['grade_description']
+        )
+
+    def to_dict(self, fields: Optional[Dict[str, Optional[Set[str]]]] = None) -> Dict:
+        """
+        /evaluate 응답 형식으로 변환합니다.
+        
+        Args:
+            fields (Dict): parse_fields로 파싱한 필드 선택 (없으면 전체)
+        """
+        if fields is not None:
+            return self._project(fields)
+        return {
+            'video_info': self.video.to_dict(),
+            'source_trust': self.source.to_dict(),
+            'content_trust': self.content.to_dict(),
+            'final_score': self.final_score,
+            'grade': self.grade,
+            'grade_description': self.grade_description
+        }
+
+    def _project(self, fields: Dict[str, Optional[Set[str]]]) -> Dict:
+        """선택된 필드만 생성합니다."""
+        builders: Dict[str, Callable] = {
+            'video_id': lambda: self.video.video_id,
+            'video_info': self.video.to_dict,
+            'source_trust': self.source.to_dict,
+            'content_trust': self.content.to_dict,
+            'final_score': lambda: self.final_score,
+            'grade': lambda: self.grade,
+            'grade_description': lambda: self.grade_description
+        }
+        result = {}
+        for name, sub in fields.items():
+            value = builders[name]()
+            if sub is not None and isinstance(value, dict):
+                value = {key: value[key] for key in sorted(sub) if key in value}
+            result[name] = value
+        return result
@@ -0,0 +1,87 @@
+from typing import Dict, Optional
+import hashlib
+import logging
+import re
+import time
+import unicodedata
+from . import codec
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정
+SEARCH_KEY = "search:{digest}:{bucket}"
+
+# max_results 버킷 (YouTube search.list의 maxResults 최대값은 50)
+RESULT_BUCKETS = (10, 25, 50)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """NFKC 정규화, 대소문자 통합, 공백 정리"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query).casefold()).strip()
+
+
+def result_bucket(max_results: int) -> int:
+    """요청 개수를 담을 수 있는 가장 작은 버킷"""
+    return next((bucket for bucket in RESULT_BUCKETS if bucket >= max_results), RESULT_BUCKETS[-1])
+
+
+class SearchCache:
+    """
+    정규화된 검색어 기준 검색 결과 캐시
+
+    검색 결과는 비디오 ID 목록, 다음 페이지 토큰, 전체 결과 수만 저장하며
+    비디오 정보는 비디오 캐시에서 채웁니다. 더 큰 버킷으로 저장된 결과가 있으면
+    작은 요청은 그 결과의 앞부분으로 응답합니다.
+    """
+
+    def __init__(self, redis_client, ttl: int = 1800):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, query: str, bucket: int) -> str:
+        digest = hashlib.blake2b(normalize_query(query).encode("utf-8"), digest_size=12).hexdigest()
+        return SEARCH_KEY.format(digest=digest, bucket=bucket)
+
+    def get(self, query: str, max_results: int) -> Optional[Dict]:
+        """요청 개수 이상을 담은 캐시 결과 (가장 작은 버킷 우선)"""
+        try:
+            pipe = self.redis.pipeline()
+            for bucket in RESULT_BUCKETS:
+                pipe.get(self._key(query, bucket))
+            cached = pipe.execute()
+        except Exception as e:
+            logger.warning(f"[SEARCH] 검색 캐시 조회 실패: {str(e)}")
+            cached = []
+
+        for bucket, data in zip(RESULT_BUCKETS, cached):
+            if data is None:
+                continue
+            result = codec.loads(data)
+            # 버킷보다 적게 반환되었으면 전체 결과이므로 더 큰 요청에도 사용 가능
+            if len(result["video_ids"]) >= max_results or len(result["video_ids"]) < bucket:
+                self.hits += 1
+                result["video_ids"] = result["video_ids"][:max_results]
+                return result
+        self.misses += 1
+        return None
+
+    def put(self, query: str, bucket: int, result: Dict) -> None:
+        try:
+            self.redis.setex(self._key(query, bucket), self.ttl, codec.dumps({**result, "fetched_at": time.time()}))
+        except Exception as e:
+            logger.warning(f"[SEARCH] 검색 캐시 저장 실패: {str(e)}")
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,169 @@
+from typing import Dict, Iterator, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter
+import logging
+import math
+import time
+from .archive import ArchiveReader, Segment
+from .evaluator import Evaluator, SOURCE_WEIGHTS, CONTENT_WEIGHTS
+from .scoring import ScoreCalculator
+from .tokenizer import TextIndex
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _step_scorer(thresholds: Dict[str, int]):
+    """high/medium/low 임계값을 이진 탐색 기반 점수 함수로 변환합니다."""
+    bounds = [thresholds['low'], thresholds['medium'], thresholds['high']]
+    scores = (20.0, 40.0, 70.0, 100.0)
+    return lambda value: scores[bisect_right(bounds, value)]
+
+
+class BatchScorer:
+    """
+    아카이브에 저장된 특징값으로 후보 설정의 점수를 일괄 재계산합니다.
+
+    YouTube 호출 없이 저장된 구독자 수, 채널 나이, 참여도 점수와 제목/설명을 사용합니다.
+    행마다 기록된 키워드 설정 지문이 후보 설정과 같은 행만 저장된 내용 점수를 재사용하고,
+    다른 키워드로 계산된 행(지문이 없는 이전 형식 포함)은 제목/설명을 다시 분석합니다.
+    """
+
+    def __init__(self, candidate_config: Dict):
+        self.evaluator = Evaluator(candidate_config)
+        self.score_calculator = ScoreCalculator()
+        config = self.evaluator.admin_config
+
+        self.subscriber_score = _step_scorer(config['thresholds']['subscribers'])
+        self.activity_score = _step_scorer(config['thresholds']['activity'])
+        self.rescored_rows = 0
+
+    def _reusable_rows(self, segment: Segment):
+        """저장된 내용 점수를 재사용할 수 있는 행인지 판단하는 함수"""
+        if "keywords" not in segment.columns:
+            return lambda row: False
+        try:
+            index = segment.keyword_versions.index(self.evaluator.keyword_version)
+        except ValueError:
+            return lambda row: False
+        keywords = segment.column("keywords")
+        return lambda row: keywords[row] == index
+
+    def score_rows(self, segment: Segment, rows: range) -> Iterator[Tuple[float, str]]:
+        """세그먼트의 지정된 행들에 대해 (종합 점수, 등급)을 계산합니다."""
+        subscriber_count = segment.column("subscriber_count")
+        channel_age = segment.column("channel_age")
+        engagement = segment.column("engagement_score")
+        title_scores = segment.column("title_score")
+        description_scores = segment.column("description_score")
+        sentiment_scores = segment.column("sentiment_score")
+        reusable = self._reusable_rows(segment)
+
+        for row in rows:
+            source_total = (
+                self.subscriber_score(subscriber_count[row]) / 100 * SOURCE_WEIGHTS['subscriber']
+                + self.activity_score(channel_age[row]) / 100 * SOURCE_WEIGHTS['activity']
+                + engagement[row] * SOURCE_WEIGHTS['engagement']
+            ) * 100
+
+            if reusable(row):
+                title_score = title_scores[row]
+                description_score = description_scores[row]
+                sentiment_score = sentiment_scores[row]
+            else:
+                title, description = segment.text(row)
+                title_index = TextIndex(title)
+                description_index = TextIndex(description)
+                title_score = self.evaluator._analyze_title(title_index) / 100
+                description_score = self.evaluator._analyze_description(description_index) / 100
+                sentiment_score = self.evaluator._analyze_sentiment(title_index, description_index) / 100
+                self.rescored_rows += 1
+
+            content_total = (
+                title_score * CONTENT_WEIGHTS['title']
+                + description_score * CONTENT_WEIGHTS['description']
+                + sentiment_score * CONTENT_WEIGHTS['sentiment']
+            ) * 100
+
+            final_score = self.score_calculator.calculate_score(
+                trust_score=source_total,
+                content_score=content_total
+            )
+            yield final_score, self.score_calculator.get_grade(final_score)
+
+
+def simulate(reader: ArchiveReader, candidate_config: Dict, baseline_config: Dict,
+             sample: Optional[int] = None) -> Dict:
+    """
+    저장된 평가 결과를 후보 설정으로 재계산하여 등급 전이 행렬과 점수 변화를 반환합니다.
+
+    저장된 점수는 기록 당시의 설정으로 계산된 값이므로, 비교 기준 점수도 같은 행을
+    현재 설정(baseline_config)으로 다시 계산하여 설정 차이만 비교합니다.
+
+    Args:
+        reader (ArchiveReader): 평가 아카이브
+        candidate_config (Dict): 후보 관리자 설정
+        baseline_config (Dict): 비교 기준 설정 (현재 적용 중인 설정)
+        sample (int): 표본 크기 (None 또는 0이면 전체)
+
+    Returns:
+        Dict: 시뮬레이션 결과
+    """
+    started = time.perf_counter()
+    scorer = BatchScorer(candidate_config)
+    baseline = BatchScorer(baseline_config)
+
+    total = reader.rows
+    step = max(1, math.ceil(total / sample)) if sample else 1
+
+    transitions: Dict[str, Counter] = {}
+    before: Counter = Counter()
+    after: Counter = Counter()
+    count, delta_sum, abs_delta_sum, changed = 0, 0.0, 0.0, 0
+    min_delta, max_delta = 0.0, 0.0
+
+    offset = 0
+    for segment, _ in reader.scan():
+        # 세그먼트 경계를 넘어도 전체 행 기준으로 일정한 간격을 유지
+        first = (-offset) % step
+        rows = range(first, segment.rows, step)
+        offset += segment.rows
+
+        old = baseline.score_rows(segment, rows)
+        for (old_score, old_grade), (new_score, new_grade) in zip(old, scorer.score_rows(segment, rows)):
+            delta = new_score - old_score
+
+            transitions.setdefault(old_grade, Counter())[new_grade] += 1
+            before[old_grade] += 1
+            after[new_grade] += 1
+            count += 1
+            delta_sum += delta
+            abs_delta_sum += abs(delta)
+            min_delta = min(min_delta, delta)
+            max_delta = max(max_delta, delta)
+            if old_grade != new_grade:
+                changed += 1
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"[SIMULATION] {count}건 재계산 완료 ({elapsed:.2f}초)")
+
+    return {
+        "total_rows": total,
+        "simulated_rows": count,
+        "sampled": step > 1,
+        "rescored_text": scorer.rescored_rows > 0,
+        "rescored_rows": scorer.rescored_rows + baseline.rescored_rows,
+        "transitions": {grade: dict(targets) for grade, targets in transitions.items()},
+        "grade_histogram": {
+            "before": dict(before),
+            "after": dict(after)
+        },
+        "score_delta": {
+            "mean": delta_sum / count if count else 0.0,
+            "mean_abs": abs_delta_sum / count if count else 0.0,
+            "min": min_delta,
+            "max": max_delta
+        },
+        "changed_grades": changed,
+        "elapsed_seconds": round(elapsed, 3)
+    }
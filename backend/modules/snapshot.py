@@ -0,0 +1,143 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from . import codec
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 파일 형식: MAGIC(7) + 형식 버전(1) + 헤더 길이(4) + JSON 헤더 + 섹션 데이터
+SNAPSHOT_MAGIC = b"CTSSNAP"
+SNAPSHOT_FORMAT = 1
+_PREAMBLE = struct.Struct(">7sBI")
+
+
+class CacheSnapshot:
+    """
+    프로세스 내 캐시 스냅샷
+
+    등록된 캐시마다 하나의 섹션을 코덱으로 직렬화하여 파일 하나에 기록하고, 새 워커는 시작할 때
+    파일을 메모리 매핑하여 헤더에 기록된 위치의 섹션만 읽어 복원합니다.
+    임시 파일에 쓴 뒤 교체하므로 기록 중에 종료되어도 이전 스냅샷이 유지됩니다.
+    만료 여부와 설정 버전 검증은 각 캐시의 복원 함수가 담당합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._sections: Dict[str, Tuple[Callable[[], Any], Callable[[Any], int]]] = {}
+        self._lock = threading.Lock()
+        self.last_saved_at: Optional[float] = None
+        self.last_save_bytes = 0
+        self.last_save_seconds = 0.0
+        self.restored: Dict[str, int] = {}
+
+    def register(self, name: str, export: Callable[[], Any], restore: Callable[[Any], int]) -> None:
+        """
+        캐시 섹션 등록
+
+        Args:
+            name (str): 섹션 이름
+            export: 스냅샷에 기록할 값을 반환하는 함수
+            restore: 기록된 값을 받아 복원한 항목 수를 반환하는 함수
+        """
+        self._sections[name] = (export, restore)
+
+    def save(self) -> int:
+        """모든 섹션을 기록하고 파일 크기를 반환합니다."""
+        started = time.perf_counter()
+        blobs: Dict[str, bytes] = {}
+        for name, (export, _) in self._sections.items():
+            try:
+                blobs[name] = codec.dumps(export())
+            except Exception as e:
+                logger.warning(f"[SNAPSHOT] 캐시 섹션 직렬화 실패: {name} ({str(e)})")
+
+        offset = 0
+        sections = {}
+        for name, blob in blobs.items():
+            sections[name] = [offset, len(blob)]
+            offset += len(blob)
+        header = json.dumps({
+            "created_at": time.time(),
+            "pid": os.getpid(),
+            "sections": sections
+        }).encode("utf-8")
+
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(header)))
+                f.write(header)
+                for blob in blobs.values():
+                    f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+
+        size = _PREAMBLE.size + len(header) + offset
+        self.last_saved_at = time.time()
+        self.last_save_bytes = size
+        self.last_save_seconds = time.perf_counter() - started
+        logger.info(f"[SNAPSHOT] 캐시 스냅샷 저장: {size:,}바이트, {self.last_save_seconds * 1000:.1f}ms")
+        return size
+
+    def restore(self) -> Dict[str, int]:
+        """스냅샷 파일에서 등록된 섹션을 복원하고 섹션별 복원 항목 수를 반환합니다."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return {}
+
+        restored: Dict[str, int] = {}
+        with f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # 빈 파일이거나 메모리 매핑을 지원하지 않는 파일 시스템
+                data = f.read()
+            try:
+                magic, version, header_size = _PREAMBLE.unpack_from(data, 0)
+                if magic != SNAPSHOT_MAGIC or version > SNAPSHOT_FORMAT:
+                    logger.warning(f"[SNAPSHOT] 지원하지 않는 스냅샷 파일입니다: {self.path}")
+                    return {}
+                header = json.loads(data[_PREAMBLE.size:_PREAMBLE.size + header_size])
+                base = _PREAMBLE.size + header_size
+
+                for name, (offset, length) in header["sections"].items():
+                    if name not in self._sections:
+                        continue
+                    try:
+                        value = codec.loads(data[base + offset:base + offset + length])
+                        restored[name] = self._sections[name][1](value)
+                    except Exception as e:
+                        logger.warning(f"[SNAPSHOT] 캐시 섹션 복원 실패: {name} ({str(e)})")
+            except (struct.error, ValueError, KeyError) as e:
+                logger.warning(f"[SNAPSHOT] 스냅샷 파일을 읽을 수 없습니다: {str(e)}")
+                return {}
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+        age = time.time() - header["created_at"]
+        logger.info(f"[SNAPSHOT] 캐시 스냅샷 복원 ({age:.0f}초 전 저장): {restored}")
+        self.restored = restored
+        return restored
+
+    def stats(self) -> Dict:
+        return {
+            "path": self.path,
+            "sections": list(self._sections),
+            "last_saved_at": self.last_saved_at,
+            "last_save_bytes": self.last_save_bytes,
+            "last_save_seconds": self.last_save_seconds,
+            "restored": self.restored
+        }
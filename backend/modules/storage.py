@@ -0,0 +1,184 @@
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect
+import hashlib
+import logging
+import redis
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def hash_tag(key) -> bytes:
+    """
+    샤드 결정에 사용할 키 부분
+
+    Redis Cluster와 같이 키에 비어 있지 않은 {해시 태그}가 있으면 태그 안의 문자열만 사용하므로
+    "video:{abc}"와 "evaluation:last:{abc}"는 같은 샤드에 저장됩니다.
+    """
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    start = key.find(b"{")
+    if start != -1:
+        end = key.find(b"}", start + 1)
+        if end > start + 1:
+            return key[start + 1:end]
+    return key
+
+
+def _point(value: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    가상 노드 기반 일관된 해싱 링
+
+    노드마다 vnodes개의 점을 링에 배치하므로, 노드를 추가하거나 제거하면
+    해당 노드가 담당하던 약 1/N의 키만 이동합니다.
+    """
+
+    def __init__(self, nodes: List[str], vnodes: int = 160):
+        self.vnodes = vnodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        ring = sorted(
+            (_point(f"{node}#{i}".encode("utf-8")), node)
+            for node in nodes for i in range(vnodes)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+        self.nodes = list(nodes)
+
+    def node_for(self, key) -> str:
+        index = bisect(self._points, _point(hash_tag(key))) % len(self._points)
+        return self._owners[index]
+
+
+class ShardedPipeline:
+    """명령을 노드별 파이프라인으로 나누어 실행하고 결과를 원래 순서로 반환합니다."""
+
+    def __init__(self, sharded: "ShardedRedis"):
+        self.sharded = sharded
+        self._commands: List[Tuple[str, str, tuple, dict]] = []
+
+    def __getattr__(self, name):
+        def command(key, *args, **kwargs):
+            self._commands.append((self.sharded.ring.node_for(key), name, (key,) + args, kwargs))
+            return self
+        return command
+
+    def execute(self) -> List:
+        commands, self._commands = self._commands, []
+        by_node: Dict[str, List[int]] = {}
+        for index, (node, _, _, _) in enumerate(commands):
+            by_node.setdefault(node, []).append(index)
+
+        results: List = [None] * len(commands)
+        for node, indexes in by_node.items():
+            pipe = self.sharded.clients[node].pipeline(transaction=False)
+            for index in indexes:
+                _, name, args, kwargs = commands[index]
+                getattr(pipe, name)(*args, **kwargs)
+            for index, result in zip(indexes, pipe.execute()):
+                results[index] = result
+        return results
+
+
+class ShardedRedis:
+    """
+    여러 Redis 노드에 키를 분산하는 클라이언트
+
+    단일 키 명령은 키(해시 태그)가 속한 노드로 전달하며, 여러 키를 다루는 명령과
+    파이프라인은 노드별로 묶어 노드당 한 번의 왕복으로 실행합니다.
+    """
+
+    def __init__(self, clients: Dict[str, object], vnodes: int = 160):
+        self.clients = clients
+        self.ring = HashRing(list(clients), vnodes=vnodes)
+
+    def client_for(self, key):
+        return self.clients[self.ring.node_for(key)]
+
+    def __getattr__(self, name):
+        def command(key, *args, **kwargs):
+            return getattr(self.client_for(key), name)(key, *args, **kwargs)
+        return command
+
+    def ping(self) -> bool:
+        return all(client.ping() for client in self.clients.values())
+
+    def mget(self, keys: List) -> List:
+        """여러 키를 노드별 파이프라인 한 번씩으로 조회합니다."""
+        pipe = self.pipeline()
+        for key in keys:
+            pipe.get(key)
+        return pipe.execute()
+
+    def delete(self, *keys) -> int:
+        pipe = self.pipeline()
+        for key in keys:
+            pipe.delete(key)
+        return sum(pipe.execute())
+
+    def exists(self, *keys) -> int:
+        pipe = self.pipeline()
+        for key in keys:
+            pipe.exists(key)
+        return sum(pipe.execute())
+
+    def pipeline(self, transaction: bool = False) -> ShardedPipeline:
+        return ShardedPipeline(self)
+
+
+def parse_nodes(spec: str) -> List[Tuple[str, int]]:
+    """"host:port,host:port" 형식의 노드 목록"""
+    nodes = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, port = item.rpartition(":")
+        nodes.append((host or item, int(port) if host else 6379))
+    return nodes
+
+
+def create_client(nodes: List[Tuple[str, int]], cluster: bool = False, vnodes: int = 160,
+                  **connection_kwargs) -> Optional[object]:
+    """
+    노드 목록으로 Redis 클라이언트를 생성합니다.
+
+    - cluster: Redis Cluster (슬롯 라우팅은 서버가 담당)
+    - 노드가 하나: 일반 클라이언트
+    - 노드가 여럿: 일관된 해싱으로 분산하는 ShardedRedis
+
+    해싱 링은 항상 설정된 전체 노드 목록으로 구성합니다. 연결할 수 없는 노드를 빼고 링을 만들면
+    같은 키가 워커마다 다른 노드로 가게 되므로, 노드 하나라도 연결할 수 없으면 ConnectionError가 발생합니다.
+    """
+    if cluster:
+        from redis.cluster import RedisCluster, ClusterNode
+        from redis.exceptions import RedisClusterException
+        try:
+            client = RedisCluster(startup_nodes=[ClusterNode(host, port) for host, port in nodes], **connection_kwargs)
+        except RedisClusterException as e:
+            raise redis.ConnectionError(str(e))
+        client.ping()
+        return client
+
+    if len(nodes) == 1:
+        host, port = nodes[0]
+        client = redis.Redis(host=host, port=port, **connection_kwargs)
+        client.ping()
+        return client
+
+    clients = {}
+    unreachable = []
+    for host, port in nodes:
+        client = redis.Redis(host=host, port=port, **connection_kwargs)
+        try:
+            client.ping()
+        except redis.ConnectionError as e:
+            logger.warning(f"[STORAGE] Redis 노드 연결 실패: {host}:{port} ({str(e)})")
+            unreachable.append(f"{host}:{port}")
+        clients[f"{host}:{port}"] = client
+    if unreachable:
+        raise redis.ConnectionError(f"연결할 수 없는 Redis 노드가 있습니다: {', '.join(unreachable)}")
+    logger.info(f"[STORAGE] Redis 노드 {len(clients)}개에 키를 분산합니다.")
+    return ShardedRedis(clients, vnodes=vnodes)
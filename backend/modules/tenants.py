@@ -0,0 +1,232 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import re
+import secrets
+import threading
+import time
+from . import codec
+from .evaluator import Evaluator
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# API 키가 없거나 등록되지 않은 요청에 적용하는 테넌트
+DEFAULT_TENANT = "default"
+TENANT_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,31}$")
+
+# Redis 키 설정
+TENANTS_KEY = "tenants"
+# API 키 해시 -> 테넌트 ID
+API_KEYS_KEY = "tenants:api_keys"
+
+
+@dataclass(frozen=True)
+class TenantKeys:
+    """테넌트별 관리자 설정 Redis 키"""
+    config: str
+    version: str
+    pending: str
+    history: str
+
+
+def tenant_keys(tenant_id: str) -> TenantKeys:
+    """기본 테넌트는 기존 키를 그대로 사용하고, 다른 테넌트는 해시 태그로 같은 샤드에 저장합니다."""
+    if tenant_id == DEFAULT_TENANT:
+        return TenantKeys("admin:config", "admin:config:version", "admin:pending", "admin:history")
+    prefix = f"tenant:{{{tenant_id}}}"
+    return TenantKeys(f"{prefix}:config", f"{prefix}:config:version", f"{prefix}:pending", f"{prefix}:history")
+
+
+def api_key_id(api_key: str) -> str:
+    """저장/조회에 사용하는 API 키 해시 (원문은 저장하지 않음)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+class TenantDirectory:
+    """
+    테넌트 목록과 API 키 -> 테넌트 매핑
+
+    요청마다 Redis를 조회하지 않도록 조회 결과를 cache_ttl 동안 프로세스 내에 보관합니다.
+    키를 폐기하면 다른 워커에는 최대 cache_ttl 뒤에 반영됩니다.
+    """
+
+    def __init__(self, redis_client, cache_ttl: float = 60, max_cached: int = 4096):
+        self.redis = redis_client
+        self.cache_ttl = cache_ttl
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, api_key: Optional[str]) -> str:
+        """API 키의 테넌트 (키가 없거나 등록되지 않았으면 기본 테넌트)"""
+        return self.lookup(api_key) or DEFAULT_TENANT
+
+    def lookup(self, api_key: Optional[str]) -> Optional[str]:
+        """등록된 API 키의 테넌트 (키가 없거나 등록되지 않았으면 None)"""
+        if not api_key:
+            return None
+        key_id = api_key_id(api_key)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key_id)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+        tenant = codec.to_text(self.redis.hget(API_KEYS_KEY, key_id)) or None
+        with self._lock:
+            self._cache[key_id] = (tenant, now + self.cache_ttl)
+            self._cache.move_to_end(key_id)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return tenant
+
+    def exists(self, tenant_id: str) -> bool:
+        return tenant_id == DEFAULT_TENANT or tenant_id in self.tenants()
+
+    def tenants(self) -> List[str]:
+        return sorted({DEFAULT_TENANT} | {codec.to_text(member) for member in self.redis.smembers(TENANTS_KEY)})
+
+    def create(self, tenant_id: str, initial_config: Dict) -> bool:
+        """테넌트를 만들고 초기 설정을 저장합니다. 이미 있으면 False"""
+        if not TENANT_ID_PATTERN.match(tenant_id):
+            raise ValueError("테넌트 ID는 영문 소문자, 숫자, '-', '_'로 된 32자 이하여야 합니다.")
+        if self.exists(tenant_id):
+            return False
+        keys = tenant_keys(tenant_id)
+        self.redis.set(keys.config, codec.dumps(initial_config), nx=True)
+        # 초기 설정이 평가기 기본 설정 대신 적용되도록 버전 1부터 시작
+        self.redis.set(keys.version, 1, nx=True)
+        self.redis.sadd(TENANTS_KEY, tenant_id)
+        return True
+
+    def issue_key(self, tenant_id: str) -> Dict[str, str]:
+        """새 API 키를 발급합니다. 원문은 이 응답에서만 확인할 수 있습니다."""
+        api_key = secrets.token_urlsafe(32)
+        key_id = api_key_id(api_key)
+        self.redis.hset(API_KEYS_KEY, key_id, tenant_id)
+        return {"api_key": api_key, "key_id": key_id}
+
+    def keys(self, tenant_id: str) -> List[str]:
+        return [
+            codec.to_text(key_id) for key_id, tenant in self.redis.hgetall(API_KEYS_KEY).items()
+            if codec.to_text(tenant) == tenant_id
+        ]
+
+    def revoke_key(self, tenant_id: str, key_id: str) -> bool:
+        if codec.to_text(self.redis.hget(API_KEYS_KEY, key_id)) != tenant_id:
+            return False
+        self.redis.hdel(API_KEYS_KEY, key_id)
+        with self._lock:
+            self._cache.pop(key_id, None)
+        return True
+
+
+class TenantConfig(NamedTuple):
+    """요청에 적용할 테넌트 설정"""
+    tenant: str
+    version: int
+    evaluator: Evaluator
+
+    @property
+    def tag(self) -> str:
+        """ETag 등 캐시 키에 사용하는 설정 식별자 (기본 테넌트는 기존처럼 버전만 사용)"""
+        return str(self.version) if self.tenant == DEFAULT_TENANT else f"{self.tenant}.{self.version}"
+
+
+class EvaluatorRegistry:
+    """
+    테넌트 설정별로 컴파일된 평가기 (키워드 조회 키, 기준값 표)
+
+    평가기는 설정 내용의 해시로 구분하여 모든 테넌트가 공유하는 크기 제한 LRU에 보관하므로,
+    같은 설정을 쓰는 테넌트는 평가기 하나를 함께 사용합니다. 요청마다 테넌트의 설정 버전만
+    조회하고, 버전이 바뀐 경우에만 설정을 읽어 평가기를 다시 생성합니다.
+    """
+
+    def __init__(self, redis_client, max_entries: int = 32):
+        self.redis = redis_client
+        self.max_entries = max_entries
+        self._compiled: "OrderedDict[str, Evaluator]" = OrderedDict()
+        # 테넌트 -> (설정 버전, 설정 해시)
+        self._versions: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.compiles = 0
+
+    def version(self, tenant_id: str) -> int:
+        version = self.redis.get(tenant_keys(tenant_id).version)
+        return int(version) if version else 0
+
+    @staticmethod
+    def _digest(config: Optional[Dict]) -> str:
+        encoded = json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+    def _lookup(self, tenant_id: str, version: int) -> Optional[Evaluator]:
+        with self._lock:
+            known = self._versions.get(tenant_id)
+            if known is None or known[0] != version:
+                return None
+            evaluator = self._compiled.get(known[1])
+            if evaluator is not None:
+                self._compiled.move_to_end(known[1])
+            return evaluator
+
+    def _store(self, tenant_id: str, version: int, config: Optional[Dict]) -> Evaluator:
+        digest = self._digest(config)
+        with self._lock:
+            evaluator = self._compiled.get(digest)
+        if evaluator is None:
+            evaluator = Evaluator(config)
+            self.compiles += 1
+            logger.info(f"평가기 설정 갱신: {tenant_id} 버전 {version}")
+        with self._lock:
+            self._compiled[digest] = evaluator
+            self._compiled.move_to_end(digest)
+            while len(self._compiled) > self.max_entries:
+                self._compiled.popitem(last=False)
+            self._versions[tenant_id] = (version, digest)
+        return evaluator
+
+    def get(self, tenant_id: str = DEFAULT_TENANT) -> TenantConfig:
+        """테넌트의 현재 설정 버전과 평가기"""
+        version = self.version(tenant_id)
+        evaluator = self._lookup(tenant_id, version)
+        if evaluator is not None:
+            self.hits += 1
+            return TenantConfig(tenant_id, version, evaluator)
+        # 설정 버전 0(변경 이력 없음)은 저장된 설정과 관계없이 평가기 기본 설정 사용
+        config = self.redis.get(tenant_keys(tenant_id).config) if version else None
+        return TenantConfig(tenant_id, version, self._store(tenant_id, version, codec.loads(config) if config else None))
+
+    def export_entries(self) -> List[List]:
+        """스냅샷용 (테넌트, 설정 버전, 설정) 목록"""
+        with self._lock:
+            entries = [
+                [tenant_id, version, self._compiled[digest].admin_config]
+                for tenant_id, (version, digest) in self._versions.items() if digest in self._compiled
+            ]
+        return entries
+
+    def load_entries(self, entries: List[List]) -> int:
+        """저장된 설정 버전이 현재 버전과 같은 테넌트의 평가기만 복원합니다."""
+        loaded = 0
+        for tenant_id, version, config in entries:
+            if version == 0 or version != self.version(tenant_id):
+                continue
+            self._store(tenant_id, version, config)
+            loaded += 1
+        return loaded
+
+    def stats(self) -> Dict:
+        return {
+            "compiled": len(self._compiled),
+            "max_entries": self.max_entries,
+            "tenants": len(self._versions),
+            "hits": self.hits,
+            "compiles": self.compiles
+        }
@@ -0,0 +1,290 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import math
+import queue
+import threading
+import time
+from . import codec
+from .locks import LockTimeoutError, redis_lock
+from .records import VideoInfo
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Redis 키 설정
+SERIES_RAW_KEY = "ts:raw:{{{video_id}}}"
+SERIES_OLD_KEY = "ts:old:{{{video_id}}}"
+SERIES_STATE_KEY = "ts:state:{{{video_id}}}"
+SERIES_LOCK_KEY = "ts:lock:{{{video_id}}}"
+
+# 인코딩 형식 버전 (블롭 첫 바이트)
+SERIES_FORMAT = 1
+
+# 다운샘플링 단계: (이 기간보다 오래된 점, 버킷 크기(초))
+DOWNSAMPLE_TIERS: Tuple[Tuple[int, int], ...] = (
+    (30 * 86400, 86400),  # 30일 이전: 하루에 한 점
+    (2 * 86400, 3600),    # 2일 이전: 한 시간에 한 점
+)
+
+# (시각, 조회수, 좋아요 수, 댓글 수)
+Point = Tuple[int, int, int, int]
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    # 지그재그 인코딩으로 음수 차분도 짧게 표현
+    value = (value << 1) ^ (value >> 63)
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data: bytes) -> Iterable[int]:
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        yield (value >> 1) ^ -(value & 1)
+        value = shift = 0
+
+
+def encode_points(points: List[Point], previous: Optional[Point] = None) -> bytes:
+    """
+    점 목록을 차분 + 지그재그 varint로 인코딩합니다.
+
+    previous가 없으면 형식 버전과 함께 첫 점을 절대값으로 기록하고,
+    있으면 이어 붙일 수 있도록 previous와의 차분만 기록합니다.
+    """
+    out = bytearray()
+    if previous is None:
+        out.append(SERIES_FORMAT)
+        previous = (0, 0, 0, 0)
+    for point in points:
+        for value, base in zip(point, previous):
+            _encode_varint(value - base, out)
+        previous = point
+    return bytes(out)
+
+
+def decode_points(data: Optional[bytes]) -> List[Point]:
+    if not data:
+        return []
+    if data[0] != SERIES_FORMAT:
+        raise ValueError(f"지원하지 않는 시계열 형식입니다: {data[0]}")
+    values = list(_decode_varints(data[1:]))
+    points: List[Point] = []
+    current = [0, 0, 0, 0]
+    for i in range(0, len(values) - len(values) % 4, 4):
+        for j in range(4):
+            current[j] += values[i + j]
+        points.append(tuple(current))
+    return points
+
+
+def downsample(points: List[Point], now: int) -> List[Point]:
+    """오래된 점을 단계별 버킷의 마지막 점만 남기도록 줄입니다 (누적 카운터이므로 마지막 값이 대표값)."""
+    result: List[Point] = []
+    for point in points:
+        age = now - point[0]
+        bucket_size = next((size for min_age, size in DOWNSAMPLE_TIERS if age >= min_age), 0)
+        if bucket_size and result and result[-1][0] // bucket_size == point[0] // bucket_size:
+            result[-1] = point
+        else:
+            result.append(point)
+    return result
+
+
+class VideoStatsSeries:
+    """
+    비디오 통계(조회수/좋아요/댓글) 스냅샷 시계열과 참여도 증가 속도
+
+    - 최근 점은 Redis 문자열(ts:raw)에 차분 인코딩으로 이어 붙이고,
+      raw_retention보다 오래된 점은 다운샘플링하여 ts:old로 옮깁니다.
+    - 속도 지표는 새 스냅샷이 들어올 때마다 직전 상태(ts:state)만으로 갱신하므로
+      이력을 다시 읽지 않습니다.
+    - 요청 처리 중에는 submit으로 대기열에 넣기만 하고, 잠금과 Redis 왕복은 백그라운드
+      스레드 하나가 처리합니다 (대기열이 가득 차면 스냅샷을 버림).
+    """
+
+    def __init__(self, redis_client, raw_retention: int = 2 * 86400, retention: int = 365 * 86400,
+                 half_life: float = 6 * 3600, spike_threshold: float = 3.0, lock_timeout: float = 0.5,
+                 max_pending: int = 1000):
+        self.redis = redis_client
+        self.raw_retention = raw_retention
+        self.retention = retention
+        self.half_life = half_life
+        self.spike_threshold = spike_threshold
+        self.lock_timeout = lock_timeout
+        self._queue: "queue.Queue[Optional[Tuple[VideoInfo, Optional[float]]]]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, video: VideoInfo, timestamp: Optional[float] = None) -> None:
+        """스냅샷을 백그라운드 기록 대기열에 추가합니다 (호출한 스레드를 막지 않음)."""
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._drain, name="video-stats", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait((video, timestamp))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"[SERIES] 기록 대기열이 가득 차 스냅샷을 버립니다: {video.video_id}")
+
+    def stop(self, timeout: float = 5) -> None:
+        """대기 중인 스냅샷을 기록하고 백그라운드 스레드를 종료합니다."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self.record(*item)
+            except Exception as e:
+                logger.warning(f"[SERIES] 비디오 통계 시계열 기록 실패: {item[0].video_id} ({str(e)})")
+
+    def state(self, video_id: str) -> Optional[Dict]:
+        data = self.redis.get(SERIES_STATE_KEY.format(video_id=video_id))
+        return codec.loads(data) if data is not None else None
+
+    def record(self, video: VideoInfo, timestamp: Optional[float] = None) -> Optional[Dict]:
+        """
+        새로 조회한 비디오 통계를 기록하고 갱신된 상태를 반환합니다.
+
+        상태 조회, 점 추가, 상태 저장은 비디오별 잠금(ts:lock:{<id>}) 안에서 실행하여 여러 워커가
+        같은 비디오를 동시에 기록해도 점이 중복되거나 상태가 덮어써지지 않으며, 잠금을
+        lock_timeout 안에 얻지 못하면 이번 스냅샷은 건너뜁니다.
+        """
+        video_id = video.video_id
+        point: Point = (int(timestamp or time.time()), int(video.views), int(video.likes), int(video.comments))
+        try:
+            with redis_lock(self.redis, SERIES_LOCK_KEY.format(video_id=video_id), ttl=5, timeout=self.lock_timeout):
+                return self._record(video_id, point)
+        except LockTimeoutError:
+            logger.warning(f"[SERIES] 잠금을 얻지 못해 스냅샷을 건너뜁니다: {video_id}")
+            return None
+
+    def _record(self, video_id: str, point: Point) -> Dict:
+        state = self.state(video_id)
+        if state is not None and point[0] <= state["last"][0]:
+            return state
+
+        if state is None:
+            state = {"first_seen": point[0], "samples": 0, "raw_start": point[0], "raw_points": 0}
+            chunk = encode_points([point])
+        elif state["raw_points"] == 0:
+            state["raw_start"] = point[0]
+            chunk = encode_points([point])
+        else:
+            chunk = encode_points([point], previous=tuple(state["last"]))
+            self._update_velocity(state, tuple(state["last"]), point)
+
+        state["last"] = list(point)
+        state["samples"] += 1
+        state["raw_points"] += 1
+
+        raw_key = SERIES_RAW_KEY.format(video_id=video_id)
+        pipe = self.redis.pipeline()
+        pipe.append(raw_key, chunk)
+        pipe.expire(raw_key, self.retention)
+        pipe.expire(SERIES_OLD_KEY.format(video_id=video_id), self.retention)
+        pipe.execute()
+
+        # 매번 압축하지 않도록 보존 기간의 1/4만큼 여유를 두고 압축
+        if point[0] - state["raw_start"] > self.raw_retention * 1.25:
+            self._compact(video_id, state, point[0])
+        self.redis.setex(SERIES_STATE_KEY.format(video_id=video_id), self.retention, codec.dumps(state))
+        return state
+
+    def _update_velocity(self, state: Dict, previous: Point, point: Point) -> None:
+        """직전 점과의 차이로 시간당 증가량과 지수 가중 평균, 급증 비율을 갱신합니다."""
+        hours = (point[0] - previous[0]) / 3600
+        views_rate = (point[1] - previous[1]) / hours
+        likes_rate = (point[2] - previous[2]) / hours
+        comments_rate = (point[3] - previous[3]) / hours
+
+        # 간격이 길수록 새 관측값의 가중치가 커지는 시간 감쇠 EWMA
+        alpha = 1 - math.exp(-math.log(2) * (point[0] - previous[0]) / self.half_life)
+        baseline = state.get("ewma_views_per_hour")
+        spike_ratio = views_rate / baseline if baseline and baseline > 0 else None
+
+        def ewma(name: str, value: float) -> float:
+            old = state.get(name)
+            return value if old is None else old + alpha * (value - old)
+
+        state["views_per_hour"] = views_rate
+        state["likes_per_hour"] = likes_rate
+        state["comments_per_hour"] = comments_rate
+        state["ewma_views_per_hour"] = ewma("ewma_views_per_hour", views_rate)
+        state["ewma_likes_per_hour"] = ewma("ewma_likes_per_hour", likes_rate)
+        state["ewma_comments_per_hour"] = ewma("ewma_comments_per_hour", comments_rate)
+        state["spike_ratio"] = spike_ratio
+        state["spike"] = spike_ratio is not None and spike_ratio >= self.spike_threshold
+        view_delta = point[1] - previous[1]
+        state["engagement_per_view"] = (
+            (point[2] - previous[2] + point[3] - previous[3]) / view_delta if view_delta > 0 else None
+        )
+
+    def _compact(self, video_id: str, state: Dict, now: int) -> None:
+        """raw_retention보다 오래된 최근 점을 다운샘플링하여 오래된 점 블롭으로 옮깁니다."""
+        raw_key = SERIES_RAW_KEY.format(video_id=video_id)
+        old_key = SERIES_OLD_KEY.format(video_id=video_id)
+        pipe = self.redis.pipeline()
+        pipe.get(raw_key)
+        pipe.get(old_key)
+        raw_data, old_data = pipe.execute()
+
+        cutoff = now - self.raw_retention
+        raw = decode_points(raw_data)
+        recent = [point for point in raw if point[0] >= cutoff]
+        old = decode_points(old_data) + [point for point in raw if point[0] < cutoff]
+        old = downsample([point for point in old if point[0] >= now - self.retention], now)
+
+        pipe = self.redis.pipeline()
+        if recent:
+            pipe.setex(raw_key, self.retention, encode_points(recent))
+        else:
+            pipe.delete(raw_key)
+        if old:
+            pipe.setex(old_key, self.retention, encode_points(old))
+        pipe.execute()
+        state["raw_start"] = recent[0][0] if recent else now
+        state["raw_points"] = len(recent)
+
+    def points(self, video_id: str) -> List[Point]:
+        """저장된 전체 점 (오래된 점은 다운샘플링된 상태)"""
+        pipe = self.redis.pipeline()
+        pipe.get(SERIES_OLD_KEY.format(video_id=video_id))
+        pipe.get(SERIES_RAW_KEY.format(video_id=video_id))
+        old_data, raw_data = pipe.execute()
+        return decode_points(old_data) + decode_points(raw_data)
+
+    def features(self, video_id: str) -> Optional[Dict]:
+        """참여도 증가 속도 지표"""
+        state = self.state(video_id)
+        if state is None:
+            return None
+        return {
+            "samples": state["samples"],
+            "first_seen": state["first_seen"],
+            "last_seen": state["last"][0],
+            "views_per_hour": state.get("views_per_hour"),
+            "likes_per_hour": state.get("likes_per_hour"),
+            "comments_per_hour": state.get("comments_per_hour"),
+            "ewma_views_per_hour": state.get("ewma_views_per_hour"),
+            "ewma_likes_per_hour": state.get("ewma_likes_per_hour"),
+            "ewma_comments_per_hour": state.get("ewma_comments_per_hour"),
+            "engagement_per_view": state.get("engagement_per_view"),
+            "spike_ratio": state.get("spike_ratio"),
+            "spike": state.get("spike", False)
+        }
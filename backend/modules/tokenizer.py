@@ -0,0 +1,84 @@
+from typing import Dict, List
+from functools import lru_cache
+import re
+import unicodedata
+
+# 토큰: 영문/숫자/한글 연속 문자열 (퍼센트 기호는 숫자 뒤에 붙여 하나의 토큰으로 취급)
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+%?")
+
+# 제거 대상 조사
+PARTICLES = [
+    "으로부터", "에서부터", "이라고", "에게서", "으로서", "으로써", "에서는", "에서도", "까지는", "부터는",
+    "에게는", "한테", "에게", "에서", "으로", "까지", "부터", "처럼", "보다", "라고", "이나", "이랑",
+    "마저", "조차", "밖에", "은", "는", "이", "가", "을", "를", "에", "의", "와", "과", "도", "로",
+    "만", "나", "랑", "께",
+]
+
+# "확실하다", "확실히"처럼 명사에 붙는 '하다' 활용 어미
+HA_ENDINGS = [
+    "하다는", "하다고", "합니다", "했다", "하다", "하는", "하게", "하고", "하지", "한", "히",
+]
+
+SUFFIX_SET = frozenset(PARTICLES + HA_ENDINGS)
+MAX_SUFFIX_LENGTH = max(len(suffix) for suffix in SUFFIX_SET)
+
+# 여러 단어로 된 키워드(예: "믿을 수 없다")를 찾기 위한 최대 구 길이
+MAX_PHRASE_TOKENS = 3
+
+
+def normalize(text: str) -> str:
+    """유니코드 정규화(NFKC) 및 소문자 변환"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """정규화된 텍스트를 토큰 목록으로 분리합니다."""
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+def _stems(token: str) -> List[str]:
+    """토큰 끝의 조사/'하다' 어미를 제거한 어간 후보"""
+    stems = []
+    for length in range(1, min(MAX_SUFFIX_LENGTH, len(token) - 1) + 1):
+        if token[-length:] in SUFFIX_SET:
+            stems.append(token[:-length])
+    return stems
+
+
+@lru_cache(maxsize=4096)
+def keyword_key(keyword: str) -> str:
+    """키워드를 색인 조회 키로 변환합니다."""
+    return " ".join(tokenize(keyword))
+
+
+class TextIndex:
+    """
+    토큰 빈도 색인
+
+    텍스트를 한 번만 정규화/토큰화하여 표면형과 조사/어미를 제거한 어간을 함께 색인하므로,
+    키워드 조회는 해시 조회 한 번으로 끝나며 비용은 키워드 수와 무관합니다.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self, text: str = ""):
+        counts: Dict[str, int] = {}
+        tokens = tokenize(text) if text else []
+        for i, token in enumerate(tokens):
+            for n in range(1, MAX_PHRASE_TOKENS + 1):
+                if i + n > len(tokens):
+                    break
+                last = tokens[i + n - 1]
+                prefix = " ".join(tokens[i:i + n - 1])
+                for form in [last] + _stems(last):
+                    key = f"{prefix} {form}" if prefix else form
+                    counts[key] = counts.get(key, 0) + 1
+        self.counts = counts
+
+    def count(self, keyword: str) -> int:
+        """키워드 출현 횟수"""
+        return self.counts.get(keyword_key(keyword), 0)
+
+    def contains(self, keyword: str) -> bool:
+        """키워드 포함 여부"""
+        return keyword_key(keyword) in self.counts
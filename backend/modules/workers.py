@@ -0,0 +1,198 @@
+from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import json
+import logging
+from .evaluator import Evaluator
+from .records import VideoInfo, ContentTrust
+
+# 일괄 평가 입력의 정수 필드 (CSV 입력은 모든 값이 문자열)
+NUMERIC_FIELDS = ("views", "likes", "comments", "subscriber_count", "channel_age", "video_count")
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 설정 버전 또는 키워드 설정 지문 (평가기 재생성 여부 판단용)
+ConfigVersion = Union[int, str]
+
+# 자식 프로세스별 평가기 (설정 버전 -> 평가기, 최근 CHILD_EVALUATORS개만 유지)
+CHILD_EVALUATORS = 8
+_child_evaluators: "OrderedDict[ConfigVersion, Evaluator]" = OrderedDict()
+
+
+class ChildConfigMissing(LookupError):
+    """자식 프로세스에 해당 설정 버전의 평가기가 없는 경우 (설정을 함께 보내 다시 제출)"""
+
+
+def _init_child(config_version: Optional[ConfigVersion] = None, admin_config: Optional[Dict] = None) -> None:
+    """
+    자식 프로세스 초기화: 평가 로그는 부모 프로세스에서만 남깁니다.
+
+    설정이 고정된 경우(일괄 평가 도구) config_version을 지정하면 평가기를 미리 만들어
+    청크마다 설정을 보내지 않습니다 (admin_config가 None이면 기본 설정).
+    """
+    logging.getLogger("modules.evaluator").setLevel(logging.WARNING)
+    if config_version is not None:
+        _child_evaluators[config_version] = Evaluator(admin_config)
+
+
+def _get_child_evaluator(config_version: ConfigVersion, admin_config: Optional[Dict]) -> Evaluator:
+    """설정 버전별 평가기를 재사용하고, 처음 보는 버전이면 전달받은 설정으로 생성합니다."""
+    evaluator = _child_evaluators.get(config_version)
+    if evaluator is not None:
+        _child_evaluators.move_to_end(config_version)
+        return evaluator
+    if admin_config is None:
+        raise ChildConfigMissing(config_version)
+    evaluator = Evaluator(admin_config)
+    _child_evaluators[config_version] = evaluator
+    while len(_child_evaluators) > CHILD_EVALUATORS:
+        _child_evaluators.popitem(last=False)
+    return evaluator
+
+
+def score_content_chunk(config_version: ConfigVersion, admin_config: Optional[Dict],
+                        items: List[Tuple[str, str, str]]) -> List[Tuple[float, float, float, float]]:
+    """
+    자식 프로세스에서 실행되는 내용 신뢰도 일괄 계산
+
+    Args:
+        config_version: 관리자 설정 버전 또는 키워드 설정 지문
+        admin_config (Dict): 관리자 설정 (None이면 이미 만든 평가기 사용, 없으면 ChildConfigMissing)
+        items (List[Tuple]): (비디오 ID, 제목, 설명) 목록
+
+    Returns:
+        List[Tuple]: (제목, 설명, 감정, 총점) 점수 목록
+    """
+    evaluator = _get_child_evaluator(config_version, admin_config)
+    results = []
+    for video_id, title, description in items:
+        content = evaluator.score_content(VideoInfo(video_id=video_id, title=title, description=description))
+        results.append((content.title_score, content.description_score, content.sentiment_score, content.total_score))
+    return results
+
+
+def flatten_record(data: Dict, prefix: str = "") -> Dict:
+    """중첩 딕셔너리를 "상위.하위" 키로 펼칩니다."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def evaluate_records_chunk(config_version: int, admin_config: Optional[Dict], records: List,
+                           fields: Optional[Dict], output_format: str) -> Tuple[List, int]:
+    """
+    자식 프로세스에서 실행되는 비디오 레코드 일괄 평가
+
+    Args:
+        config_version (int): 관리자 설정 버전
+        admin_config (Dict): 관리자 설정 (None이면 초기화 시 만든 평가기 사용)
+        records (List): get_video_info 형식의 레코드 (JSONL 입력은 파싱 전 문자열)
+        fields (Dict): parse_fields로 파싱한 응답 필드 선택
+        output_format (str): "jsonl"이면 직렬화된 줄, "csv"이면 펼친 딕셔너리 반환
+
+    Returns:
+        Tuple[List, int]: 레코드 순서대로의 평가 결과 (실패한 레코드는 error 필드 포함), 실패 건수
+    """
+    evaluator = _get_child_evaluator(config_version, admin_config)
+    results = []
+    errors = 0
+    for record in records:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            for field in NUMERIC_FIELDS:
+                if isinstance(record.get(field), str):
+                    record[field] = int(record[field] or 0)
+            result = evaluator.evaluate(VideoInfo.from_dict(record)).to_dict(fields)
+        except Exception as e:
+            video_id = record.get("video_id", "") if isinstance(record, dict) else ""
+            result = {"video_id": video_id, "error": str(e)}
+            errors += 1
+        if output_format == "jsonl":
+            results.append(json.dumps(result, ensure_ascii=False))
+        else:
+            results.append(flatten_record(result))
+    return results, errors
+
+
+class ContentAnalysisPool:
+    """
+    내용 분석 단계를 프로세스 풀에서 실행합니다.
+
+    개별 요청은 짧은 대기 시간 동안 모아 청크 단위로 제출하므로
+    프로세스 간 통신 비용이 여러 요청에 나누어집니다. 청크에는 설정 버전만 보내고,
+    자식 프로세스에 그 버전의 평가기가 없을 때만 설정을 함께 보내 다시 제출합니다.
+    """
+
+    def __init__(self, size: int, chunk_size: int = 32, max_wait: float = 0.005):
+        self.size = size
+        self.chunk_size = chunk_size
+        self.max_wait = max_wait
+        self.executor = ProcessPoolExecutor(max_workers=size, initializer=_init_child)
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        logger.info(f"[POOL] 내용 분석 프로세스 풀 시작: {size}개 프로세스")
+
+    async def score(self, video: VideoInfo, config_version: ConfigVersion, admin_config: Dict) -> ContentTrust:
+        """비디오 한 건의 내용 신뢰도를 계산합니다. 동시 요청은 청크로 묶어 제출됩니다."""
+        if self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue()
+            self._collector = asyncio.get_running_loop().create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((config_version, admin_config, (video.video_id, video.title, video.description), future))
+        return await future
+
+    async def _collect(self) -> None:
+        """대기 중인 요청을 모아 청크 단위로 제출합니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.chunk_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 같은 설정 버전끼리 묶어 제출
+            groups: Dict[ConfigVersion, List] = {}
+            for entry in batch:
+                groups.setdefault(entry[0], []).append(entry)
+            for config_version, entries in groups.items():
+                loop.create_task(self._submit(config_version, entries))
+
+    async def _submit(self, config_version: ConfigVersion, entries: List) -> None:
+        loop = asyncio.get_running_loop()
+        futures = [entry[3] for entry in entries]
+        items = [entry[2] for entry in entries]
+        try:
+            try:
+                results = await loop.run_in_executor(self.executor, score_content_chunk, config_version, None, items)
+            except ChildConfigMissing:
+                results = await loop.run_in_executor(
+                    self.executor, score_content_chunk, config_version, entries[0][1], items
+                )
+            for future, scores in zip(futures, results):
+                if not future.done():
+                    future.set_result(ContentTrust(*scores))
+        except Exception as e:
+            logger.error(f"[POOL] 내용 분석 청크 처리 중 오류 발생: {str(e)}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+    def shutdown(self) -> None:
+        if self._collector is not None:
+            self._collector.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,16 +1,38 @@
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import os
 import logging
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import httplib2
 from datetime import datetime, timezone
 import time
 from functools import wraps
+from .records import VideoInfo, ChannelProfile
+from .breaker import CircuitBreaker
+from .cache import ChannelCache
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# videos.list/channels.list 한 번에 조회할 수 있는 최대 ID 수
+MAX_IDS_PER_REQUEST = 50
+
+class QuotaExceededError(ValueError):
+    """API 키가 유효하지 않거나 할당량이 초과된 경우"""
+
+class VideoNotFoundError(ValueError):
+    """비디오가 없거나 비공개인 경우"""
+
+class CommentsDisabledError(ValueError):
+    """비디오의 댓글이 비활성화된 경우"""
+
+def is_upstream_failure(e: Exception) -> bool:
+    """YouTube API 장애로 볼 수 있는 오류인지 확인 (존재하지 않는 비디오 등은 제외)"""
+    if isinstance(e, HttpError):
+        return e.resp.status >= 500 or e.resp.status in (403, 429)
+    return isinstance(e, (QuotaExceededError, OSError, httplib2.HttpLib2Error))
+
 def retry_on_quota_exceeded(max_retries=3, delay=1):
     def decorator(func):
         @wraps(func)
@@ -37,8 +59,22 @@ class YouTubeAPI:
             logger.error("YouTube API 키가 설정되지 않았습니다.")
             raise ValueError("YouTube API 키가 설정되지 않았습니다. .env 파일에 YOUTUBE_API_KEY를 설정해주세요.")
         
+        # 응답 지연 시 요청이 무한정 대기하지 않도록 타임아웃 설정
+        http = httplib2.Http(timeout=float(os.getenv('YOUTUBE_TIMEOUT', 10)))
+        self.breaker = CircuitBreaker(
+            "YouTube API",
+            failure_threshold=int(os.getenv('YOUTUBE_BREAKER_THRESHOLD', 5)),
+            recovery_timeout=float(os.getenv('YOUTUBE_BREAKER_RECOVERY', 30)),
+            is_failure=is_upstream_failure
+        )
+        # 채널 통계 캐시 (같은 채널의 비디오는 channels.list를 다시 호출하지 않음)
+        self.channel_cache = ChannelCache(
+            ttl=int(os.getenv('CHANNEL_CACHE_TTL', 21600)),
+            max_entries=int(os.getenv('CHANNEL_CACHE_SIZE', 4096))
+        )
+        
         try:
-            self.youtube = build('youtube', 'v3', developerKey=api_key)
+            self.youtube = build('youtube', 'v3', developerKey=api_key, http=http)
             # API 키 유효성 검사를 위한 간단한 테스트 요청
             self.youtube.videos().list(part='snippet', id='dQw4w9WgXcQ').execute()
             logger.info("YouTube API 연결 성공")
@@ -53,9 +89,16 @@ class YouTubeAPI:
             logger.error(f"YouTube API 초기화 중 오류 발생: {str(e)}")
             raise
 
-    @retry_on_quota_exceeded()
     def get_video_info(self, video_id: str) -> Dict:
         """비디오 정보 가져오기"""
+        return self.get_video(video_id).to_dict()
+
+    def get_video(self, video_id: str) -> VideoInfo:
+        """비디오 정보 레코드 가져오기 (회로가 열려 있으면 CircuitOpenError 발생)"""
+        return self.breaker.call(self._get_video, video_id)
+
+    @retry_on_quota_exceeded()
+    def _get_video(self, video_id: str) -> VideoInfo:
         try:
             logger.info(f"비디오 정보 요청: {video_id}")
             # 비디오 정보 조회
@@ -66,137 +109,212 @@ class YouTubeAPI:
 
             if not video_response['items']:
                 logger.warning(f"비디오를 찾을 수 없음: {video_id}")
-                raise ValueError("비디오를 찾을 수 없습니다.")
+                raise VideoNotFoundError("비디오를 찾을 수 없습니다.")
 
             video = video_response['items'][0]
             snippet = video['snippet']
-            statistics = video['statistics']
 
             # 채널 정보 조회
-            try:
-                channel_response = self.youtube.channels().list(
-                    part='snippet,statistics',
-                    id=snippet['channelId']
-                ).execute()
-
-                if not channel_response['items']:
-                    logger.warning(f"채널을 찾을 수 없음: {snippet['channelId']}")
-                    raise ValueError("채널을 찾을 수 없습니다.")
-
-                channel = channel_response['items'][0]
-                channel_stats = channel['statistics']
-
-                # 채널 나이 계산
+            channel_stats = self.channel_cache.get(snippet['channelId'])
+            if channel_stats is None:
                 try:
-                    channel_published = datetime.fromisoformat(
-                        channel['snippet']['publishedAt'].replace('Z', '+00:00')
-                    ).replace(tzinfo=timezone.utc)
-                except ValueError:
-                    # ISO 형식이 아닌 경우를 위한 대체 처리
-                    channel_published = datetime.strptime(
-                        channel['snippet']['publishedAt'].split('.')[0] + 'Z',
-                        '%Y-%m-%dT%H:%M:%SZ'
-                    ).replace(tzinfo=timezone.utc)
-                
-                channel_age = (datetime.now(timezone.utc) - channel_published).days
-                
-                # 채널 통계 정보 처리
-                subscriber_count = int(channel_stats.get('subscriberCount', 0))
-                video_count = int(channel_stats.get('videoCount', 0))
-                
-            except HttpError as e:
-                logger.warning(f"채널 정보 조회 실패: {str(e)}")
-                # 채널 정보가 없을 경우 기본값 설정
-                channel_age = 0
-                subscriber_count = 0
-                video_count = 0
+                    channel_response = self.youtube.channels().list(
+                        part='snippet,statistics',
+                        id=snippet['channelId']
+                    ).execute()
 
-            # 비디오 통계 정보 처리
-            views = int(statistics.get('viewCount', 0))
-            likes = int(statistics.get('likeCount', 0))
-            comments = int(statistics.get('commentCount', 0))
-            
-            # 썸네일 URL 처리
-            thumbnail_url = None
-            if 'thumbnails' in snippet:
-                if 'high' in snippet['thumbnails']:
-                    thumbnail_url = snippet['thumbnails']['high']['url']
-                elif 'medium' in snippet['thumbnails']:
-                    thumbnail_url = snippet['thumbnails']['medium']['url']
-                elif 'default' in snippet['thumbnails']:
-                    thumbnail_url = snippet['thumbnails']['default']['url']
-
-            result = {
-                'video_id': video_id,
-                'title': snippet.get('title', ''),
-                'description': snippet.get('description', ''),
-                'channel_id': snippet.get('channelId', ''),
-                'channel_title': snippet.get('channelTitle', ''),
-                'published_at': snippet.get('publishedAt', ''),
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'thumbnail_url': thumbnail_url,
-                'subscriber_count': subscriber_count,
-                'channel_age': channel_age,
-                'video_count': video_count
-            }
+                    if not channel_response['items']:
+                        logger.warning(f"채널을 찾을 수 없음: {snippet['channelId']}")
+                        raise ValueError("채널을 찾을 수 없습니다.")
+
+                    channel_stats = self._channel_stats(channel_response['items'][0])
+                    self.channel_cache.put(snippet['channelId'], channel_stats)
+                    
+                except HttpError as e:
+                    logger.warning(f"채널 정보 조회 실패: {str(e)}")
+                    # 채널 정보가 없을 경우 기본값 설정
+                    channel_stats = (0, 0, 0)
 
+            result = self._to_video_info(video, channel_stats)
             logger.info(f"비디오 정보 조회 성공: {video_id}")
             return result
 
         except HttpError as e:
             logger.error(f"YouTube API HTTP 오류: {str(e)}")
             if e.resp.status == 403:
-                raise ValueError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
+                raise QuotaExceededError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
             raise
         except Exception as e:
             logger.error(f"비디오 정보 조회 중 오류 발생: {str(e)}")
             raise
 
+    def get_videos(self, video_ids: List[str]) -> Dict[str, VideoInfo]:
+        """여러 비디오 정보를 일괄 조회 (회로가 열려 있으면 CircuitOpenError 발생)"""
+        return self.breaker.call(self._get_videos, video_ids)
+
     @retry_on_quota_exceeded()
-    def search_videos(self, query: str, max_results: int = 10) -> Dict:
-        """비디오 검색"""
+    def _get_videos(self, video_ids: List[str]) -> Dict[str, VideoInfo]:
+        """
+        videos.list/channels.list를 최대 50개 ID씩 묶어 호출합니다 (호출당 1 유닛).
+        찾을 수 없는 비디오는 결과에서 제외합니다.
+        """
         try:
-            logger.info(f"비디오 검색 요청: {query}")
-            search_response = self.youtube.search().list(
-                q=query,
-                part='snippet',
-                maxResults=max_results,
-                type='video'
-            ).execute()
+            videos = []
+            for i in range(0, len(video_ids), MAX_IDS_PER_REQUEST):
+                response = self.youtube.videos().list(
+                    part='snippet,statistics',
+                    id=','.join(video_ids[i:i + MAX_IDS_PER_REQUEST])
+                ).execute()
+                videos.extend(response['items'])
 
-            results = []
-            for item in search_response['items']:
-                video_id = item['id']['videoId']
+            channels: Dict[str, Tuple[int, int, int]] = {}
+            channel_ids = []
+            for channel_id in dict.fromkeys(video['snippet']['channelId'] for video in videos):
+                cached = self.channel_cache.get(channel_id)
+                if cached is not None:
+                    channels[channel_id] = cached
+                else:
+                    channel_ids.append(channel_id)
+            for i in range(0, len(channel_ids), MAX_IDS_PER_REQUEST):
                 try:
-                    video_info = self.get_video_info(video_id)
-                    results.append({
-                        'video_id': video_id,
-                        'title': item['snippet']['title'],
-                        'description': item['snippet']['description'],
-                        'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                        'channel_title': item['snippet']['channelTitle'],
-                        'published_at': item['snippet']['publishedAt'],
-                        'views': video_info['views'],
-                        'likes': video_info['likes'],
-                        'comments': video_info['comments']
-                    })
-                except Exception as e:
-                    logger.warning(f"비디오 {video_id} 정보 조회 실패: {str(e)}")
+                    response = self.youtube.channels().list(
+                        part='snippet,statistics',
+                        id=','.join(channel_ids[i:i + MAX_IDS_PER_REQUEST])
+                    ).execute()
+                except HttpError as e:
+                    logger.warning(f"채널 정보 일괄 조회 실패: {str(e)}")
                     continue
+                for channel in response['items']:
+                    channels[channel['id']] = self._channel_stats(channel)
+                    self.channel_cache.put(channel['id'], channels[channel['id']])
 
-            logger.info(f"비디오 검색 성공: {len(results)} 결과")
+            logger.info(f"비디오 정보 일괄 조회 성공: {len(videos)}/{len(video_ids)}")
             return {
-                'total_results': search_response['pageInfo']['totalResults'],
-                'results': results
+                video['id']: self._to_video_info(video, channels.get(video['snippet']['channelId'], (0, 0, 0)))
+                for video in videos
             }
 
         except HttpError as e:
             logger.error(f"YouTube API HTTP 오류: {str(e)}")
             if e.resp.status == 403:
-                raise ValueError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
+                raise QuotaExceededError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
+            raise
+
+    @staticmethod
+    def _channel_stats(channel: Dict) -> Tuple[int, int, int]:
+        """채널 응답 항목에서 (채널 나이(일), 구독자 수, 동영상 수) 계산"""
+        channel_stats = channel['statistics']
+
+        # 채널 나이 계산
+        try:
+            channel_published = datetime.fromisoformat(
+                channel['snippet']['publishedAt'].replace('Z', '+00:00')
+            ).replace(tzinfo=timezone.utc)
+        except ValueError:
+            # ISO 형식이 아닌 경우를 위한 대체 처리
+            channel_published = datetime.strptime(
+                channel['snippet']['publishedAt'].split('.')[0] + 'Z',
+                '%Y-%m-%dT%H:%M:%SZ'
+            ).replace(tzinfo=timezone.utc)
+        
+        channel_age = (datetime.now(timezone.utc) - channel_published).days
+        
+        # 채널 통계 정보 처리
+        subscriber_count = int(channel_stats.get('subscriberCount', 0))
+        video_count = int(channel_stats.get('videoCount', 0))
+        return channel_age, subscriber_count, video_count
+
+    @staticmethod
+    def _to_video_info(video: Dict, channel_stats: Tuple[int, int, int]) -> VideoInfo:
+        """비디오 응답 항목과 채널 통계로 비디오 정보 레코드 생성"""
+        snippet = video['snippet']
+        statistics = video['statistics']
+        channel_age, subscriber_count, video_count = channel_stats
+
+        # 썸네일 URL 처리
+        thumbnail_url = None
+        if 'thumbnails' in snippet:
+            if 'high' in snippet['thumbnails']:
+                thumbnail_url = snippet['thumbnails']['high']['url']
+            elif 'medium' in snippet['thumbnails']:
+                thumbnail_url = snippet['thumbnails']['medium']['url']
+            elif 'default' in snippet['thumbnails']:
+                thumbnail_url = snippet['thumbnails']['default']['url']
+
+        return VideoInfo(
+            video_id=video['id'],
+            title=snippet.get('title', ''),
+            description=snippet.get('description', ''),
+            published_at=snippet.get('publishedAt', ''),
+            # 비디오 통계 정보 처리
+            views=int(statistics.get('viewCount', 0)),
+            likes=int(statistics.get('likeCount', 0)),
+            comments=int(statistics.get('commentCount', 0)),
+            thumbnail_url=thumbnail_url,
+            channel=ChannelProfile(
+                channel_id=snippet.get('channelId', ''),
+                channel_title=snippet.get('channelTitle', ''),
+                subscriber_count=subscriber_count,
+                channel_age=channel_age,
+                video_count=video_count
+            )
+        )
+
+    def search_ids(self, query: str, max_results: int = 10, page_token: Optional[str] = None) -> Dict:
+        """비디오 검색 결과의 ID 목록만 조회 (회로가 열려 있으면 CircuitOpenError 발생)"""
+        return self.breaker.call(self._search_ids, query, max_results, page_token)
+
+    @retry_on_quota_exceeded()
+    def _search_ids(self, query: str, max_results: int, page_token: Optional[str]) -> Dict:
+        try:
+            logger.info(f"비디오 검색 요청: {query}")
+            params = dict(q=query, part='id', maxResults=max_results, type='video')
+            if page_token:
+                params['pageToken'] = page_token
+            search_response = self.youtube.search().list(**params).execute()
+            return {
+                'video_ids': [item['id']['videoId'] for item in search_response['items']],
+                'next_page_token': search_response.get('nextPageToken'),
+                'total_results': search_response['pageInfo']['totalResults']
+            }
+        except HttpError as e:
+            logger.error(f"YouTube API HTTP 오류: {str(e)}")
+            if e.resp.status == 403:
+                raise QuotaExceededError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
+            raise
+
+    def comment_pages(self, video_id: str, page_size: int = 100) -> Iterator[List[str]]:
+        """
+        최상위 댓글을 페이지 단위로 지연 조회 (페이지당 1 유닛)
+
+        다음 페이지는 호출자가 요청할 때만 조회합니다. 회로가 열려 있으면 CircuitOpenError,
+        댓글이 비활성화된 비디오는 CommentsDisabledError가 발생합니다.
+        """
+        page_token = None
+        while True:
+            page = self.breaker.call(self._comment_page, video_id, page_size, page_token)
+            yield page['comments']
+            page_token = page['next_page_token']
+            if not page_token:
+                return
+
+    @retry_on_quota_exceeded()
+    def _comment_page(self, video_id: str, page_size: int, page_token: Optional[str]) -> Dict:
+        try:
+            params = dict(part='snippet', videoId=video_id, maxResults=page_size, order='relevance', textFormat='plainText')
+            if page_token:
+                params['pageToken'] = page_token
+            response = self.youtube.commentThreads().list(**params).execute()
+            return {
+                'comments': [item['snippet']['topLevelComment']['snippet']['textDisplay'] for item in response['items']],
+                'next_page_token': response.get('nextPageToken')
+            }
+        except HttpError as e:
+            if e.resp.status == 403 and 'commentsDisabled' in str(e):
+                raise CommentsDisabledError("댓글이 비활성화된 비디오입니다.")
+            if e.resp.status == 404:
+                raise ValueError("비디오를 찾을 수 없습니다.")
+            logger.error(f"YouTube API HTTP 오류: {str(e)}")
+            if e.resp.status == 403:
+                raise QuotaExceededError("API 키가 유효하지 않거나 할당량이 초과되었습니다.")
             raise
-        except Exception as e:
-            logger.error(f"비디오 검색 중 오류 발생: {str(e)}")
-            raise 
\ No newline at end of file